@@ -1,18 +1,34 @@
+import asyncio
 import contextlib
 import datetime
-import re
-from typing import List, Optional
-from urllib.parse import urlparse
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 import aiohttp  # type: ignore
 import discord  # type: ignore
 from discord.ext import tasks  # type: ignore
 from redbot.core import Config, commands, modlog  # type: ignore
 from redbot.core.bot import Red  # type: ignore
 from redbot.core.commands import Context  # type: ignore
-
-URL_REGEX_PATTERN = re.compile(
-    r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))"
-)
+from redbot.core.data_manager import cog_data_path  # type: ignore
+
+from .domainindex import CompactDomainIndex, DomainIndex, link_host
+from .feedsync import FeedSync
+from .linkextractor import Link, LinkExtractor
+from .redirectcache import RedirectCache
+from .statbuffer import StatBuffer
+from .webhookqueue import WebhookQueue
+
+# Redirect resolution budget: each hop gets its own timeout, and chains are cut off after a fixed number of hops
+REDIRECT_HOP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+MAX_REDIRECT_HOPS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Guild settings read on the message hot path, served from an in-memory snapshot
+CACHED_GUILD_SETTINGS = ("action", "autoban", "webhook", "log_channel")
+# Link scanning concurrency, across all guilds and within a single guild
+GLOBAL_SCAN_CONCURRENCY = 50
+GUILD_SCAN_CONCURRENCY = 10
 
 class AntiPhishing(commands.Cog):
     """
@@ -26,26 +42,62 @@ class AntiPhishing(commands.Cog):
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=73836)
-        self.config.register_guild(
-            action="notify",
-            caught=0,
-            notifications=0,
-            deletions=0,
-            kicks=0,
-            bans=0,
-            timeouts=0,  # Added timeout statistic
-            autoban=3,
-            last_updated=None,
-            webhook=None,
-            log_channel=None
-        )
+        self.default_guild = {
+            "action": "notify",
+            "caught": 0,
+            "notifications": 0,
+            "deletions": 0,
+            "kicks": 0,
+            "bans": 0,
+            "timeouts": 0,  # Added timeout statistic
+            "autoban": 3,
+            "last_updated": None,
+            "webhook": None,
+            "log_channel": None
+        }
+        self.config.register_guild(**self.default_guild)
         self.config.register_member(caught=0)
+        self.config.register_global(compact_index=False)
         self.session = aiohttp.ClientSession()
-        self.bot.loop.create_task(self.get_phishing_domains())
-        self.domains = []
+        self.domains = DomainIndex()
+        self.compact_index = False
+        # Syncs and rebuilds take turns, since a compact rebuild releases the feed sets a sync works on
+        self.index_lock = asyncio.Lock()
+        # Fingerprint of the feeds the current index was built from
+        self.index_fingerprint: Optional[Tuple[int, int]] = None
+        self.feeds = FeedSync(
+            self.session,
+            {
+                "X-Identity": f"BeeHive AntiPhishing v{self.__version__} (https://www.beehive.systems/)",
+                "User-Agent": f"BeeHive AntiPhishing v{self.__version__} (https://www.beehive.systems/)"
+            },
+            cog_data_path(self) / "blocklist_snapshot.json",
+        )
+        self.redirect_cache = RedirectCache()
+        self.link_extractor = LinkExtractor()
+        self.webhook_queue = WebhookQueue(self.session)
+        self.scan_semaphore = asyncio.Semaphore(GLOBAL_SCAN_CONCURRENCY)
+        # Weakly held: a guild's semaphore only needs to live while one of its scans is holding it
+        self.guild_scan_semaphores: "weakref.WeakValueDictionary[int, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+        self.stats_buffer = StatBuffer()
+        self.guild_settings: Dict[int, dict] = {}
+        self.get_phishing_domains.start()
+        self.flush_stats.start()
+
+    async def cog_load(self):
+        all_guilds = await self.config.all_guilds()
+        self.guild_settings = {
+            guild_id: {key: guild_data[key] for key in CACHED_GUILD_SETTINGS}
+            for guild_id, guild_data in all_guilds.items()
+        }
 
-    def cog_unload(self):
-        self.bot.loop.create_task(self.session.close())
+    async def cog_unload(self):
+        self.get_phishing_domains.cancel()
+        self.flush_stats.cancel()
+        await self.stats_buffer.flush(self.config)
+        await self.webhook_queue.close()
+        await self.session.close()
+        self.domains.close()
 
     async def red_delete_data_for_user(self, **kwargs):
         return
@@ -54,28 +106,29 @@ class AntiPhishing(commands.Cog):
         pre_processed = super().format_help_for_context(ctx)
         return f"{pre_processed}\n\nVersion {self.__version__}"
     
-    def extract_urls(self, message: str) -> List[str]:
+    def get_guild_settings(self, guild: discord.Guild) -> dict:
         """
-        Extract URLs from a message.
+        Return the cached settings for a guild without touching Config.
         """
-        matches = URL_REGEX_PATTERN.findall(message)
-        urls = [match[0] for match in matches]
-        return urls
+        settings = self.guild_settings.get(guild.id)
+        if settings is None:
+            return {key: self.default_guild[key] for key in CACHED_GUILD_SETTINGS}
+        return settings
+
+    async def set_guild_setting(self, guild: discord.Guild, key: str, value) -> None:
+        """
+        Save a guild setting to Config and update the cached snapshot.
+        """
+        await self.config.guild(guild).set_raw(key, value=value)
+        if key in CACHED_GUILD_SETTINGS:
+            self.guild_settings.setdefault(guild.id, self.get_guild_settings(guild))[key] = value
 
-    def get_links(self, message: str) -> Optional[List[str]]:
+    def get_links(self, message: discord.Message) -> List[Link]:
         """
         Get links from the message content.
         """
-        zero_width_chars = ["\u200b", "\u200c", "\u200d", "\u2060", "\uFEFF"]
-        for char in zero_width_chars:
-            message = message.replace(char, "")
-        if message:
-            links = self.extract_urls(message)
-            if links:
-                return list(set(links))
-        return None
+        return self.link_extractor.message_links(message)
 
-                        
     @commands.group()
     @commands.guild_only()
     async def antiphishing(self, ctx: Context):
@@ -115,7 +168,7 @@ class AntiPhishing(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        await self.config.guild(ctx.guild).webhook.set(webhook)
+        await self.set_guild_setting(ctx.guild, "webhook", webhook)
         await ctx.message.delete()
         embed = discord.Embed(
             title='Enrollment successful',
@@ -193,7 +246,7 @@ class AntiPhishing(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        await self.config.guild(ctx.guild).action.set(action)
+        await self.set_guild_setting(ctx.guild, "action", action)
         descriptions = {
             "ignore": "Phishing protection is now **disabled**. Malicious links will not trigger any actions.",
             "notify": "Malicious links will now trigger a **notification** in the channel when detected.",
@@ -233,12 +286,14 @@ class AntiPhishing(commands.Cog):
         """
         Check protection statistics for this server
         """
-        caught = await self.config.guild(ctx.guild).caught()
-        notifications = await self.config.guild(ctx.guild).notifications()
-        deletions = await self.config.guild(ctx.guild).deletions()
-        kicks = await self.config.guild(ctx.guild).kicks()
-        bans = await self.config.guild(ctx.guild).bans()
-        timeouts = await self.config.guild(ctx.guild).timeouts()  # Added timeout statistic retrieval
+        guild_data = await self.config.guild(ctx.guild).all()
+        pending = self.stats_buffer.pending(ctx.guild.id)
+        caught = guild_data["caught"] + pending["caught"]
+        notifications = guild_data["notifications"] + pending["notifications"]
+        deletions = guild_data["deletions"] + pending["deletions"]
+        kicks = guild_data["kicks"] + pending["kicks"]
+        bans = guild_data["bans"] + pending["bans"]
+        timeouts = guild_data["timeouts"] + pending["timeouts"]
         last_updated = self.__last_updated__
         patch_notes = self.__quick_notes__
         total_domains = len(self.domains)
@@ -292,6 +347,11 @@ class AntiPhishing(commands.Cog):
             value=f"There are **{total_domains:,}** domains on the [BeeHive](https://www.beehive.systems) blocklist",
             inline=False
         )
+        embed.add_field(
+            name="Blocklist memory",
+            value=f"**{(self.domains.memory_usage() + self.feeds.memory_usage()) / (1024 * 1024):,.1f} MB** ({self.domains.storage})",
+            inline=False
+        )
         embed.add_field(name="About this cog", value="", inline=False)
         embed.add_field(
             name="Version",
@@ -321,7 +381,7 @@ class AntiPhishing(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        await self.config.guild(ctx.guild).autoban.set(autoban)
+        await self.set_guild_setting(ctx.guild, "autoban", autoban)
         embed = discord.Embed(
             title='Settings changed',
             description=f"The number of malicious links a user can share before being banned is now set to **{autoban}**.",
@@ -336,7 +396,7 @@ class AntiPhishing(commands.Cog):
         """
         Set the logging channel where link detections will be sent.
         """
-        await self.config.guild(ctx.guild).log_channel.set(channel.id)
+        await self.set_guild_setting(ctx.guild, "log_channel", channel.id)
         embed = discord.Embed(
             title='Settings changed',
             description=f"The logging channel has been set to {channel.mention}.",
@@ -345,74 +405,165 @@ class AntiPhishing(commands.Cog):
         embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/check-circle.png")
         await ctx.send(embed=embed)
 
-    @tasks.loop(minutes=2)
-    async def get_phishing_domains(self) -> None:
-        domains = []
+    @commands.is_owner()
+    @antiphishing.command()
+    async def compactindex(self, ctx: Context, enabled: bool):
+        """
+        Store the blocklist in a compact memory-mapped Bloom filter instead of in memory.
 
-        headers = {
-            "X-Identity": f"BeeHive AntiPhishing v{self.__version__} (https://www.beehive.systems/)",
-            "User-Agent": f"BeeHive AntiPhishing v{self.__version__} (https://www.beehive.systems/)"
-        }
+        Recommended when running several shards per host. Lookups are slightly slower, but memory use drops to a few bytes per domain.
+        """
+        await self.config.compact_index.set(enabled)
+        self.compact_index = enabled
+        async with ctx.typing(), self.index_lock:
+            await self.rebuild_index()
+        embed = discord.Embed(
+            title='Settings changed',
+            description=f"The compact blocklist index is now **{'enabled' if enabled else 'disabled'}**.",
+            colour=0x2bbd8e,
+        )
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/check-circle.png")
+        await ctx.send(embed=embed)
 
-        async with self.session.get(
-            "https://phish.sinking.yachts/v2/all", headers=headers
-        ) as request:
-            if request.status == 200:
-                try:
-                    data = await request.json()
-                    domains.extend(data)
-                except Exception as e:
-                    print(f"Error parsing JSON from Sinking Yachts: {e}")
-            else:
-                print(f"Failed to fetch Sinking Yachts blacklist, status code: {request.status}")
-
-        async with self.session.get(
-            "https://www.beehive.systems/hubfs/blocklist/blocklist.json", headers=headers
-        ) as request:
-            if request.status == 200:
-                try:
-                    data = await request.json()
-                    if isinstance(data, list):
-                        domains.extend(data)
-                    else:
-                        print("Unexpected data format received from blocklist.")
-                except Exception as e:
-                    print(f"Error parsing JSON from blocklist: {e}")
-            else:
-                print(f"Failed to fetch blocklist, status code: {request.status}")
-        self.domains = list(set(domains))
+    @tasks.loop(minutes=2)
+    async def get_phishing_domains(self) -> None:
+        async with self.index_lock:
+            changed = await self.feeds.sync()
+            if changed:
+                # Saved first: a compact rebuild releases the feeds, leaving the snapshot as their only copy
+                await self.feeds.save_snapshot()
+            # A feed change can leave the combined blocklist as it was, e.g. a domain both feeds list
+            if changed and self.feeds.fingerprint() != self.index_fingerprint:
+                await self.rebuild_index()
+            elif self.compact_index:
+                self.feeds.release()
+
+    @get_phishing_domains.before_loop
+    async def before_get_phishing_domains(self) -> None:
+        self.compact_index = await self.config.compact_index()
+        # Compact index files are rebuilt from the feeds on every start
+        for stale_index in cog_data_path(self).glob("domains-*.idx"):
+            with contextlib.suppress(OSError):
+                stale_index.unlink()
+        # Warm start from the last snapshot so we're protected before the first fetch completes
+        async with self.index_lock:
+            if await self.feeds.load_snapshot():
+                await self.rebuild_index()
+
+    async def rebuild_index(self) -> None:
+        """
+        Build a new domain index from the feeds and swap it in. In compact mode the feed sets
+        are released afterwards, so the snapshot must already be saved.
+        """
+        await self.feeds.restore()
+        # Build the new index fully before swapping it in, so lookups never see a partial list
+        if self.compact_index:
+            path = cog_data_path(self) / f"domains-{time.time_ns()}.idx"
+            loop = asyncio.get_running_loop()
+            index = await loop.run_in_executor(None, CompactDomainIndex.build, self.feeds.domains(), path)
+        else:
+            index = DomainIndex(self.feeds.domains())
+        self.index_fingerprint = self.feeds.fingerprint()
+        previous, self.domains = self.domains, index
+        previous.close()
+        if isinstance(previous, CompactDomainIndex):
+            with contextlib.suppress(OSError):
+                previous.path.unlink()
+        if self.compact_index:
+            self.feeds.release()
+
+    @tasks.loop(seconds=30)
+    async def flush_stats(self) -> None:
+        await self.stats_buffer.flush(self.config)
 
     async def follow_redirects(self, url: str) -> List[str]:
         """
         Follow redirects and return the final URL and any intermediate URLs.
+
+        Results, including failures, are cached and concurrent lookups of the same URL share one request.
+        """
+        return await self.redirect_cache.resolve(url, self._resolve_redirects)
+
+    async def _resolve_redirects(self, url: str) -> List[str]:
+        """
+        Walk the redirect chain one hop at a time, stopping early at the first blocklisted hop.
         """
         urls = []
         headers = {
             "User-Agent": "BeeHive Security Intelligence (https://www.beehive.systems)"
         }
-        try:
-            async with self.session.head(url, allow_redirects=True, headers=headers) as response:
-                urls.append(str(response.url))
-                for history in response.history:
-                    urls.append(str(history.url))
-        except Exception as e:
-            print(f"Error following redirects: {e}")
+        for _ in range(MAX_REDIRECT_HOPS + 1):
+            urls.append(url)
+            if self.domains.match(link_host(url)):
+                break
+            try:
+                async with self.session.head(
+                    url, allow_redirects=False, headers=headers, timeout=REDIRECT_HOP_TIMEOUT
+                ) as response:
+                    location = response.headers.get("Location")
+                    if response.status not in REDIRECT_STATUSES or not location:
+                        break
+            except Exception:
+                if len(urls) == 1:
+                    raise
+                # Keep the hops we already resolved rather than losing the whole chain
+                break
+            url = urljoin(url, location)
         return urls
 
+    def _guild_scan_semaphore(self, guild: discord.Guild) -> asyncio.Semaphore:
+        semaphore = self.guild_scan_semaphores.get(guild.id)
+        if semaphore is None:
+            semaphore = self.guild_scan_semaphores[guild.id] = asyncio.Semaphore(GUILD_SCAN_CONCURRENCY)
+        return semaphore
+
+    async def _scan_link(self, guild: discord.Guild, url: str) -> Optional[Tuple[str, List[str]]]:
+        # Take the guild slot first so one busy guild can't sit on global slots while it queues
+        async with self._guild_scan_semaphore(guild), self.scan_semaphore:
+            redirect_chain = await self.follow_redirects(url)
+        for domain_url in redirect_chain:
+            domain = link_host(domain_url)
+            if self.domains.match(domain):
+                return domain, redirect_chain
+        return None
+
+    async def scan_links(self, guild: discord.Guild, links: List[Link]) -> Optional[Tuple[str, List[str]]]:
+        """
+        Return the first malicious domain found in the links along with its redirect chain.
+
+        Hosts are matched as written first, with no network I/O. Redirects are only resolved,
+        concurrently, for clickable links when none of the literal hosts are known to be malicious.
+        """
+        for link in links:
+            if self.domains.match(link.host):
+                return link.host, [link.url]
+
+        scans = [asyncio.ensure_future(self._scan_link(guild, link.url)) for link in links if link.explicit]
+        try:
+            for next_result in asyncio.as_completed(scans):
+                result = await next_result
+                if result:
+                    return result
+        finally:
+            for scan in scans:
+                scan.cancel()
+        return None
+
     async def handle_phishing(self, message: discord.Message, domain: str, redirect_chain: List[str]) -> None:
         domain = domain[:250]
-        action = await self.config.guild(message.guild).action()
+        settings = self.get_guild_settings(message.guild)
+        action = settings["action"]
         if action != "ignore":
-            count = await self.config.guild(message.guild).caught()
-            await self.config.guild(message.guild).caught.set(count + 1)
+            self.stats_buffer.increment(message.guild.id, "caught")
         member_count = await self.config.member(message.author).caught()
-        autoban = await self.config.guild(message.guild).autoban()
+        member_count += self.stats_buffer.pending_member(message.guild.id, message.author.id)
+        autoban = settings["autoban"]
         if autoban > 0 and member_count + 1 >= autoban:
             action = "ban"
-        await self.config.member(message.author).caught.set(member_count + 1)
+        self.stats_buffer.increment_member(message.guild.id, message.author.id)
         
         # Send URL to webhook if enrolled
-        webhook_url = await self.config.guild(message.guild).webhook()
+        webhook_url = settings["webhook"]
         if webhook_url:
             redirect_chain_str = "\n".join(redirect_chain)
             webhook_embed = discord.Embed(
@@ -423,12 +574,10 @@ class AntiPhishing(commands.Cog):
             webhook_embed.add_field(name="User", value=message.author.mention)
             webhook_embed.add_field(name="URL", value=domain)
             webhook_embed.add_field(name="Redirect Chain", value=redirect_chain_str)
-            async with self.session.post(webhook_url, json={"embeds": [webhook_embed.to_dict()]}) as response:
-                if response.status not in [200, 204]:
-                    print(f"Failed to send webhook: {response.status}")
+            self.webhook_queue.send(webhook_url, webhook_embed)
         
         # Send URL to log channel if set
-        log_channel_id = await self.config.guild(message.guild).log_channel()
+        log_channel_id = settings["log_channel"]
         if log_channel_id:
             log_channel = message.guild.get_channel(log_channel_id)
             if log_channel:
@@ -453,8 +602,8 @@ class AntiPhishing(commands.Cog):
                     redirect_chain_status = []
                     for url in redirect_chain:
                         try:
-                            domain = urlparse(url).netloc  # Extract domain from URL
-                            status = "Malicious" if domain in self.domains else "Unknown"
+                            domain = link_host(url)  # Extract domain from URL
+                            status = "Malicious" if self.domains.match(domain) else "Unknown"
                             redirect_chain_status.append(f"{url} ({status})")
                         except IndexError:
                             print(f"Error extracting domain from URL: {url}")
@@ -477,15 +626,13 @@ class AntiPhishing(commands.Cog):
                     else:
                         await message.reply(embed=embed)
                     
-                notifications = await self.config.guild(message.guild).notifications()
-                await self.config.guild(message.guild).notifications.set(notifications + 1)
+                self.stats_buffer.increment(message.guild.id, "notifications")
         elif action == "delete":
             if message.channel.permissions_for(message.guild.me).manage_messages:
                 with contextlib.suppress(discord.NotFound):
                     await message.delete()
 
-                deletions = await self.config.guild(message.guild).deletions()
-                await self.config.guild(message.guild).deletions.set(deletions + 1)
+                self.stats_buffer.increment(message.guild.id, "deletions")
         elif action == "kick":
             if (
                 message.channel.permissions_for(message.guild.me).kick_members
@@ -501,8 +648,7 @@ class AntiPhishing(commands.Cog):
 
                     await message.author.kick()
 
-                kicks = await self.config.guild(message.guild).kicks()
-                await self.config.guild(message.guild).kicks.set(kicks + 1)
+                self.stats_buffer.increment(message.guild.id, "kicks")
         elif action == "ban":
             if (
                 message.channel.permissions_for(message.guild.me).ban_members
@@ -518,8 +664,7 @@ class AntiPhishing(commands.Cog):
 
                     await message.author.ban()
 
-                bans = await self.config.guild(message.guild).bans()
-                await self.config.guild(message.guild).bans.set(bans + 1)
+                self.stats_buffer.increment(message.guild.id, "bans")
         elif action == "timeout":
             if message.channel.permissions_for(message.guild.me).moderate_members:
                 with contextlib.suppress(discord.NotFound):
@@ -534,8 +679,7 @@ class AntiPhishing(commands.Cog):
                     timeout_duration = datetime.timedelta(minutes=30)
                     await message.author.timeout_for(timeout_duration, reason="Shared a known dangerous link")
 
-                timeouts = await self.config.guild(message.guild).timeouts()  # Retrieve current timeout count
-                await self.config.guild(message.guild).timeouts.set(timeouts + 1)  # Increment timeout count
+                self.stats_buffer.increment(message.guild.id, "timeouts")
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
@@ -544,28 +688,29 @@ class AntiPhishing(commands.Cog):
         """
         if not after.guild or after.author.bot:
             return
-        if await self.bot.cog_disabled_in_guild(self, after.guild):
-            return
 
-        links = self.get_links(after.content)
+        # Most messages have no links, so only those that do pay for the disabled check
+        links = self.get_links(after)
         if not links:
             return
+        if await self.bot.cog_disabled_in_guild(self, after.guild):
+            return
 
         # Check if the guild is enrolled and send all detected links to the webhook
-        if await self.config.guild(after.guild).enrolled():
-            webhook_url = await self.config.guild(after.guild).webhook_url()
-            if webhook_url:
-                async with aiohttp.ClientSession() as session:
-                    webhook = discord.Webhook.from_url(webhook_url, adapter=discord.AsyncWebhookAdapter(session))
-                    await webhook.send(f"Detected links: {', '.join(links)}")
-
-        for url in links:
-            domains_to_check = await self.follow_redirects(url)
-            for domain_url in domains_to_check:
-                domain = urlparse(domain_url).netloc
-                if domain in self.domains:
-                    await self.handle_phishing(after, domain, domains_to_check)
-                    return
+        webhook_url = self.get_guild_settings(after.guild)["webhook"]
+        if webhook_url:
+            links_embed = discord.Embed(
+                title="Detected links",
+                description="\n".join(link.url for link in links)[:4096],
+                color=0xfffffe,
+            )
+            links_embed.add_field(name="Server ID", value=after.guild.id)
+            links_embed.add_field(name="User", value=after.author.mention)
+            self.webhook_queue.send(webhook_url, links_embed)
+
+        result = await self.scan_links(after.guild, links)
+        if result:
+            await self.handle_phishing(after, *result)
 
     @commands.Cog.listener()
     async def on_message_without_command(self, message: discord.Message):
@@ -575,21 +720,14 @@ class AntiPhishing(commands.Cog):
 
         if not message.guild or message.author.bot:
             return
-        if await self.bot.cog_disabled_in_guild(self, message.guild):
-            return
 
-        links = self.get_links(message.content)
+        # Most messages have no links, so only those that do pay for the disabled check
+        links = self.get_links(message)
         if not links:
             return
+        if await self.bot.cog_disabled_in_guild(self, message.guild):
+            return
 
-        for url in links:
-            domains_to_check = await self.follow_redirects(url)
-            for domain_url in domains_to_check:
-                domain = urlparse(domain_url).netloc
-                if domain in self.domains:
-                    await self.handle_phishing(message, domain, domains_to_check)
-                    # return  # Removed premature return to handle all links
-
-
-
-
+        result = await self.scan_links(message.guild, links)
+        if result:
+            await self.handle_phishing(message, *result)
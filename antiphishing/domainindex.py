@@ -0,0 +1,254 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+
+def _decode_idna(host: str) -> str:
+    labels = host.split(".")
+    for i, label in enumerate(labels):
+        if label.startswith("xn--"):
+            try:
+                labels[i] = label.encode("ascii").decode("idna")
+            except UnicodeError:
+                pass
+    return ".".join(labels)
+
+
+def normalize_host(host: str) -> str:
+    """
+    Normalize a hostname for blocklist comparisons.
+
+    Ports and credentials are dropped and punycode labels are decoded, so `xn--` and
+    Unicode spellings of the same domain compare equal.
+    """
+    host = host.strip().lower().rstrip(".")
+    if "@" in host:
+        host = host.rsplit("@", 1)[1]
+    if host.startswith("["):
+        return host
+    if ":" in host:
+        host = host.split(":", 1)[0]
+    if "xn--" in host:
+        host = _decode_idna(host).lower()
+    return host
+
+
+def link_host(url: str) -> str:
+    """
+    Extract the normalized host from a link, including links written without a scheme.
+    """
+    if "://" not in url:
+        url = f"http://{url}"
+    try:
+        return normalize_host(urlsplit(url).netloc)
+    except ValueError:
+        return ""
+
+
+def _suffixes(host: str) -> Iterator[str]:
+    """
+    Yield a host followed by each of its parent domains, stopping short of the bare TLD.
+    """
+    yield host
+    index = host.find(".")
+    while index != -1:
+        parent = host[index + 1:]
+        if "." not in parent:
+            break
+        yield parent
+        index = host.find(".", index + 1)
+
+
+def _normalize_domains(domains: Iterable[str]) -> Iterator[str]:
+    for domain in domains:
+        if not isinstance(domain, str):
+            continue
+        host = normalize_host(domain)
+        if host:
+            # Reuse the feed's string object when normalizing didn't change it, rather than holding two copies
+            yield domain if host == domain else host
+
+
+class DomainIndex:
+    """
+    Hashed suffix index over a set of blocked domains.
+
+    Lookups walk the labels of a host from the most specific to the least
+    specific, so `evil.example.com` matches an `example.com` entry in
+    O(labels) hash probes regardless of how large the blocklist is.
+    """
+
+    __slots__ = ("_domains",)
+
+    storage = "in-memory"
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._domains = frozenset(_normalize_domains(domains))
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __contains__(self, host: object) -> bool:
+        return isinstance(host, str) and self.match(host) is not None
+
+    def match(self, host: str) -> Optional[str]:
+        """
+        Return the blocklist entry covering a host, or None if it is not listed.
+        """
+        host = normalize_host(host)
+        if not host:
+            return None
+        domains = self._domains
+        for candidate in _suffixes(host):
+            if candidate in domains:
+                return candidate
+        return None
+
+    def memory_usage(self) -> int:
+        """
+        Approximate number of bytes held by the index.
+        """
+        return sys.getsizeof(self._domains) + sum(sys.getsizeof(domain) for domain in self._domains)
+
+    def close(self) -> None:
+        pass
+
+
+class CompactDomainIndex:
+    """
+    Memory-mapped Bloom filter over the blocklist, backed by a sorted on-disk domain table.
+
+    Each suffix of a host is first checked against the Bloom filter, and only positives are
+    confirmed with a binary search of the table, so misses (nearly every lookup) never touch
+    the table. Neither structure is loaded into Python objects, which keeps a large blocklist
+    at a few bytes per domain instead of a `str` and a set slot each.
+
+    File layout: header, Bloom filter bits, (count + 1) uint32 offsets, then the sorted
+    UTF-8 domains concatenated.
+    """
+
+    storage = "memory-mapped"
+
+    HEADER = struct.Struct("<4sIQII")
+    MAGIC = b"APBF"
+    VERSION = 1
+    FALSE_POSITIVE_RATE = 0.001
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = path.open("rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files, which only a corrupt build could produce
+            self._file.close()
+            raise
+        magic, version, self._bits, self._hashes, self._count = self.HEADER.unpack_from(self._mmap, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a compact domain index")
+        self._bloom_start = self.HEADER.size
+        self._offsets_start = self._bloom_start + (self._bits + 7) // 8
+        self._data_start = self._offsets_start + 4 * (self._count + 1)
+
+    @classmethod
+    def build(cls, domains: Iterable[str], path: Path) -> "CompactDomainIndex":
+        """
+        Write a compact index for the domains to `path` and map it. This is CPU-bound and
+        should be run in an executor for large blocklists.
+        """
+        encoded = sorted({domain.encode("utf-8") for domain in _normalize_domains(domains)})
+        count = len(encoded)
+        bits = max(64, math.ceil(-count * math.log(cls.FALSE_POSITIVE_RATE) / (math.log(2) ** 2)))
+        hashes = max(1, round(bits / max(count, 1) * math.log(2)))
+
+        bloom = bytearray((bits + 7) // 8)
+        for domain in encoded:
+            for position in cls._positions(domain, bits, hashes):
+                bloom[position >> 3] |= 1 << (position & 7)
+
+        offsets = array("I", [0])
+        for domain in encoded:
+            offsets.append(offsets[-1] + len(domain))
+        if sys.byteorder != "little":
+            offsets.byteswap()
+
+        temp_path = path.with_suffix(".tmp")
+        with temp_path.open("wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, bits, hashes, count))
+            f.write(bloom)
+            f.write(offsets.tobytes())
+            for domain in encoded:
+                f.write(domain)
+        os.replace(temp_path, path)
+        return cls(path)
+
+    @staticmethod
+    def _positions(domain: bytes, bits: int, hashes: int) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing: k positions from two 64-bit hashes
+        digest = hashlib.blake2b(domain, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(hashes):
+            yield (h1 + i * h2) % bits
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, host: object) -> bool:
+        return isinstance(host, str) and self.match(host) is not None
+
+    def _might_contain(self, domain: bytes) -> bool:
+        mm = self._mmap
+        start = self._bloom_start
+        for position in self._positions(domain, self._bits, self._hashes):
+            if not mm[start + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _entry(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mmap, self._offsets_start + 4 * i)
+        return self._mmap[self._data_start + start:self._data_start + end]
+
+    def _confirm(self, domain: bytes) -> bool:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            if entry == domain:
+                return True
+            if entry < domain:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def match(self, host: str) -> Optional[str]:
+        """
+        Return the blocklist entry covering a host, or None if it is not listed.
+        """
+        host = normalize_host(host)
+        if not host:
+            return None
+        for candidate in _suffixes(host):
+            encoded = candidate.encode("utf-8")
+            if self._might_contain(encoded) and self._confirm(encoded):
+                return candidate
+        return None
+
+    def memory_usage(self) -> int:
+        """
+        Number of bytes mapped for the index. Pages are loaded on demand and shared between processes.
+        """
+        return len(self._mmap)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,286 @@
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+import aiohttp  # type: ignore
+
+SINKING_YACHTS_ALL_URL = "https://phish.sinking.yachts/v2/all"
+SINKING_YACHTS_RECENT_URL = "https://phish.sinking.yachts/v2/recent/{seconds}"
+BEEHIVE_BLOCKLIST_URL = "https://www.beehive.systems/hubfs/blocklist/blocklist.json"
+
+# The Sinking Yachts recent endpoint only looks back one week
+MAX_DELTA_SECONDS = 7 * 24 * 60 * 60
+# Overlap each delta window so changes published during a fetch aren't lost
+DELTA_OVERLAP_SECONDS = 60
+SNAPSHOT_VERSION = 1
+
+
+class FeedSync:
+    """
+    Keeps the Sinking Yachts and BeeHive feeds in sync without re-downloading them every cycle.
+
+    Sinking Yachts is fetched in full once and then kept current with its recent-changes
+    endpoint. The BeeHive blocklist has no delta endpoint, so it is fetched with
+    conditional requests and only re-parsed when it has actually changed. Both feeds are
+    persisted to disk so a restart starts protecting immediately.
+
+    When the blocklist index lives on disk, `release` drops the feed sets after each build and
+    the snapshot becomes the only copy. They are read back only when a sync has changes to apply.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, headers: Dict[str, str], snapshot_path: Path):
+        self.session = session
+        self.headers = headers
+        self.snapshot_path = snapshot_path
+        self.sinking_yachts: Set[str] = set()
+        self.beehive: Set[str] = set()
+        self.sinking_yachts_synced_at: Optional[float] = None
+        self.beehive_etag: Optional[str] = None
+        self.beehive_last_modified: Optional[str] = None
+        self.released = False
+        # Domain -> last change type applied from the recent endpoint, so the overlapping part of
+        # the next window can be recognized as already applied without reading the snapshot back
+        self._recent_changes: Dict[str, str] = {}
+
+    def domains(self) -> Iterator[str]:
+        # The indexes deduplicate, so chain the feeds rather than building a union copy
+        return itertools.chain(self.sinking_yachts, self.beehive)
+
+    def fingerprint(self) -> Tuple[int, int]:
+        """
+        Order-independent (count, hash) of the combined feeds, for telling whether a sync changed the blocklist.
+        """
+        count, combined = 0, 0
+        for domain in self.sinking_yachts:
+            count += 1
+            combined ^= hash(domain)
+        for domain in self.beehive:
+            if domain not in self.sinking_yachts:
+                count += 1
+                combined ^= hash(domain)
+        return count, combined
+
+    def memory_usage(self) -> int:
+        """
+        Approximate bytes held by the feed sets themselves. Their strings are shared with the in-memory index.
+        """
+        return sys.getsizeof(self.sinking_yachts) + sys.getsizeof(self.beehive)
+
+    def release(self) -> None:
+        """
+        Drop the feed sets, leaving the saved snapshot as the only copy until `restore` is called.
+        """
+        self.sinking_yachts = set()
+        self.beehive = set()
+        self.released = True
+
+    async def restore(self) -> bool:
+        """
+        Read released feed sets back from the snapshot. Returns False if the snapshot is unusable,
+        in which case the feeds start over empty and are marked for a full fetch.
+        """
+        if not self.released:
+            return True
+        loop = asyncio.get_running_loop()
+        try:
+            snapshot = await loop.run_in_executor(None, self._read_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Error loading blocklist snapshot: {e}")
+            snapshot = None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            self.sinking_yachts_synced_at = None
+            self.beehive_etag = None
+            self.beehive_last_modified = None
+            self.released = False
+            self._recent_changes = {}
+            return False
+        self.sinking_yachts = set(snapshot.get("sinking_yachts", []))
+        self.beehive = set(snapshot.get("beehive", []))
+        self.released = False
+        return True
+
+    async def sync(self) -> bool:
+        """
+        Bring both feeds up to date. Returns True if either feed changed.
+        """
+        sinking_yachts_changed = await self._sync_sinking_yachts()
+        beehive_changed = await self._sync_beehive()
+        return sinking_yachts_changed or beehive_changed
+
+    async def _sync_sinking_yachts(self) -> bool:
+        started_at = time.time()
+        if self.sinking_yachts_synced_at is None or started_at - self.sinking_yachts_synced_at >= MAX_DELTA_SECONDS:
+            return await self._fetch_sinking_yachts_full(started_at)
+
+        seconds = int(started_at - self.sinking_yachts_synced_at) + DELTA_OVERLAP_SECONDS
+        try:
+            async with self.session.get(
+                SINKING_YACHTS_RECENT_URL.format(seconds=seconds), headers=self.headers
+            ) as request:
+                if request.status != 200:
+                    print(f"Failed to fetch Sinking Yachts changes, status code: {request.status}")
+                    return False
+                changes = await request.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error fetching Sinking Yachts changes: {e}")
+            return False
+
+        if not isinstance(changes, list):
+            print("Unexpected data format received from Sinking Yachts changes.")
+            return False
+
+        changes = [
+            (change.get("type"), [domain for domain in change.get("domains", []) if isinstance(domain, str)])
+            for change in changes
+            if isinstance(change, dict) and change.get("type") in ("add", "delete")
+        ]
+        recent_changes = dict(self._recent_changes)
+        pending = False
+        for change_type, domains in changes:
+            for domain in domains:
+                if recent_changes.get(domain) != change_type:
+                    pending = True
+                recent_changes[domain] = change_type
+        if not pending:
+            # Everything in the window was applied last time; released feeds stay on disk
+            self.sinking_yachts_synced_at = started_at
+            return False
+        if not await self.restore():
+            return False
+
+        changed = False
+        for change_type, domains in changes:
+            if change_type == "add":
+                new_domains = set(domains) - self.sinking_yachts
+                if new_domains:
+                    self.sinking_yachts.update(new_domains)
+                    changed = True
+            else:
+                removed_domains = self.sinking_yachts.intersection(domains)
+                if removed_domains:
+                    self.sinking_yachts.difference_update(removed_domains)
+                    changed = True
+        # Only this window's domains can show up again in the next window's overlap
+        self._recent_changes = {domain: recent_changes[domain] for _, domains in changes for domain in domains}
+        self.sinking_yachts_synced_at = started_at
+        return changed
+
+    async def _fetch_sinking_yachts_full(self, started_at: float) -> bool:
+        try:
+            async with self.session.get(SINKING_YACHTS_ALL_URL, headers=self.headers) as request:
+                if request.status != 200:
+                    print(f"Failed to fetch Sinking Yachts blacklist, status code: {request.status}")
+                    return False
+                data = await request.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error fetching Sinking Yachts blacklist: {e}")
+            return False
+
+        if not isinstance(data, list):
+            print("Unexpected data format received from Sinking Yachts.")
+            return False
+
+        domains = {domain for domain in data if isinstance(domain, str)}
+        if not domains:
+            # An empty list is an upstream fault, not a cleared blocklist; keep protecting with what we have
+            print("Received an empty Sinking Yachts blacklist, keeping the previous list.")
+            return False
+        # A failed restore leaves nothing to compare against, so the fresh list counts as a change
+        await self.restore()
+        changed = domains != self.sinking_yachts
+        self._recent_changes = {}
+        self.sinking_yachts = domains
+        self.sinking_yachts_synced_at = started_at
+        return changed
+
+    async def _sync_beehive(self) -> bool:
+        headers = dict(self.headers)
+        if self.beehive_etag:
+            headers["If-None-Match"] = self.beehive_etag
+        if self.beehive_last_modified:
+            headers["If-Modified-Since"] = self.beehive_last_modified
+
+        try:
+            async with self.session.get(BEEHIVE_BLOCKLIST_URL, headers=headers) as request:
+                if request.status == 304:
+                    return False
+                if request.status != 200:
+                    print(f"Failed to fetch blocklist, status code: {request.status}")
+                    return False
+                data = await request.json(content_type=None)
+                etag = request.headers.get("ETag")
+                last_modified = request.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error fetching blocklist: {e}")
+            return False
+
+        if not isinstance(data, list):
+            print("Unexpected data format received from blocklist.")
+            return False
+
+        domains = {domain for domain in data if isinstance(domain, str)}
+        if not domains:
+            print("Received an empty blocklist, keeping the previous list.")
+            return False
+        await self.restore()
+        changed = domains != self.beehive
+        self.beehive = domains
+        self.beehive_etag = etag
+        self.beehive_last_modified = last_modified
+        return changed
+
+    async def load_snapshot(self) -> bool:
+        """
+        Restore both feeds from disk. Returns True if a usable snapshot was loaded.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            snapshot = await loop.run_in_executor(None, self._read_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Error loading blocklist snapshot: {e}")
+            return False
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return False
+
+        self.sinking_yachts = set(snapshot.get("sinking_yachts", []))
+        self.beehive = set(snapshot.get("beehive", []))
+        self.sinking_yachts_synced_at = snapshot.get("sinking_yachts_synced_at")
+        self.beehive_etag = snapshot.get("beehive_etag")
+        self.beehive_last_modified = snapshot.get("beehive_last_modified")
+        self.released = False
+        return bool(self.sinking_yachts or self.beehive)
+
+    async def save_snapshot(self) -> None:
+        if self.released:
+            # The snapshot on disk is already the only copy of the feeds
+            return
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "sinking_yachts": sorted(self.sinking_yachts),
+            "beehive": sorted(self.beehive),
+            "sinking_yachts_synced_at": self.sinking_yachts_synced_at,
+            "beehive_etag": self.beehive_etag,
+            "beehive_last_modified": self.beehive_last_modified,
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write_snapshot, snapshot)
+        except OSError as e:
+            print(f"Error saving blocklist snapshot: {e}")
+
+    def _read_snapshot(self) -> Optional[dict]:
+        if not self.snapshot_path.exists():
+            return None
+        with self.snapshot_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_snapshot(self, snapshot: dict) -> None:
+        temp_path = self.snapshot_path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(temp_path, self.snapshot_path)
@@ -0,0 +1,79 @@
+import re
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple
+
+import discord  # type: ignore
+
+from .domainindex import link_host
+
+ZERO_WIDTH_TRANSLATION = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\uFEFF"))
+
+_URL_BODY = r"[^\s<>\"'`()\[\]{}|\\^]"
+
+# One pass finds explicit links (scheme or www.) and bare domains, including IDN hosts.
+# Markdown `[text](url)` and angle-bracket `<url>` links need no special casing because
+# brackets and parentheses never appear in a match.
+LINK_PATTERN = re.compile(
+    rf"""
+    (?P<explicit>(?:https?://|www\d{{0,3}}\.){_URL_BODY}+)
+    |
+    (?<![\w@./:-])(?P<bare>(?:[^\W_][\w-]{{0,62}}\.)+[^\W\d_]{{2,63}}\b(?:/{_URL_BODY}*)?)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+TRAILING_PUNCTUATION = ".,;:!?*_~'\""
+
+
+class Link(NamedTuple):
+    host: str
+    url: str
+    # Explicit links have a scheme or a www. prefix. Discord only makes these clickable,
+    # so bare domains are worth a blocklist lookup but not a network request.
+    explicit: bool
+
+
+def extract_links(content: str) -> List[Link]:
+    """
+    Extract the unique links from message content, in the order they appear.
+    """
+    content = content.translate(ZERO_WIDTH_TRANSLATION)
+    links = []
+    seen = set()
+    for match in LINK_PATTERN.finditer(content):
+        explicit = match.group("explicit")
+        url = (explicit or match.group("bare")).rstrip(TRAILING_PUNCTUATION)
+        if "://" not in url:
+            url = f"http://{url}"
+        if url in seen:
+            continue
+        seen.add(url)
+        host = link_host(url)
+        if host:
+            links.append(Link(host, url, explicit is not None))
+    return links
+
+
+class LinkExtractor:
+    """
+    Memoizes extracted links per message, so every listener that looks at a message shares one parse.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[int, Tuple[str, List[Link]]]" = OrderedDict()
+
+    def message_links(self, message: discord.Message) -> List[Link]:
+        content = message.content or ""
+        cached = self._cache.get(message.id)
+        # Edits keep the message ID, so only reuse the parse if the content is unchanged
+        if cached is not None and cached[0] == content:
+            self._cache.move_to_end(message.id)
+            return cached[1]
+
+        links = extract_links(content) if content else []
+        self._cache[message.id] = (content, links)
+        self._cache.move_to_end(message.id)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return links
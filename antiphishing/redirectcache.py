@@ -0,0 +1,78 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL into a cache key. Scheme and host are case-insensitive and fragments
+    never reach the server, so neither should produce a separate entry.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+class RedirectCache:
+    """
+    Bounded LRU + TTL cache of resolved redirect chains.
+
+    Failed resolutions are cached too, with shorter TTLs for timeouts and errors, so a
+    dead link posted hundreds of times during a raid is only tried once per window.
+    Concurrent lookups of the same URL share a single in-flight resolution.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 600, timeout_ttl: float = 60, error_ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timeout_ttl = timeout_ttl
+        self.error_ttl = error_ttl
+        self._entries: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def resolve(self, url: str, resolver: Callable[[str], Awaitable[List[str]]]) -> List[str]:
+        key = normalize_url(url)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return list(entry[1])
+            del self._entries[key]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._resolve(key, url, resolver))
+            self._pending[key] = pending
+        # Shield the shared resolution so one cancelled waiter doesn't cancel it for everyone
+        return list(await asyncio.shield(pending))
+
+    async def _resolve(self, key: str, url: str, resolver: Callable[[str], Awaitable[List[str]]]) -> List[str]:
+        try:
+            urls = await resolver(url)
+            ttl = self.ttl
+        except asyncio.TimeoutError:
+            print(f"Timed out following redirects: {url}")
+            urls = []
+            ttl = self.timeout_ttl
+        except Exception as e:
+            print(f"Error following redirects: {e}")
+            urls = []
+            ttl = self.error_ttl
+        finally:
+            self._pending.pop(key, None)
+
+        self._entries[key] = (time.monotonic() + ttl, urls)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return urls
@@ -0,0 +1,55 @@
+from collections import Counter, defaultdict
+from typing import Dict, Tuple
+
+from redbot.core import Config  # type: ignore
+
+
+class StatBuffer:
+    """
+    In-memory buffer of guild and member stat increments.
+
+    Detections bump counters here instead of doing a Config read/modify/write per stat,
+    and the totals are written back in one batch per guild by `flush`.
+    """
+
+    def __init__(self):
+        self.guilds: Dict[int, Counter] = defaultdict(Counter)
+        self.members: Dict[Tuple[int, int], int] = defaultdict(int)
+
+    def increment(self, guild_id: int, stat: str, amount: int = 1) -> None:
+        self.guilds[guild_id][stat] += amount
+
+    def increment_member(self, guild_id: int, member_id: int, amount: int = 1) -> None:
+        self.members[(guild_id, member_id)] += amount
+
+    def pending(self, guild_id: int) -> Counter:
+        """
+        Return the increments for a guild that haven't been flushed yet.
+        """
+        return self.guilds.get(guild_id, Counter())
+
+    def pending_member(self, guild_id: int, member_id: int) -> int:
+        return self.members.get((guild_id, member_id), 0)
+
+    async def flush(self, config: Config) -> None:
+        # Swap the buffers out first so increments made while we write land in the next batch
+        guilds, self.guilds = self.guilds, defaultdict(Counter)
+        members, self.members = self.members, defaultdict(int)
+
+        for guild_id, counts in guilds.items():
+            try:
+                async with config.guild_from_id(guild_id).all() as guild_data:
+                    for stat, amount in counts.items():
+                        guild_data[stat] = guild_data.get(stat, 0) + amount
+            except Exception as e:
+                print(f"Error flushing antiphishing stats for guild {guild_id}: {e}")
+                for stat, amount in counts.items():
+                    self.increment(guild_id, stat, amount)
+
+        for (guild_id, member_id), amount in members.items():
+            try:
+                member_caught = config.member_from_ids(guild_id, member_id).caught
+                await member_caught.set(await member_caught() + amount)
+            except Exception as e:
+                print(f"Error flushing antiphishing stats for member {member_id}: {e}")
+                self.increment_member(guild_id, member_id, amount)
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Dict
+
+import aiohttp  # type: ignore
+import discord  # type: ignore
+
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_QUEUED_EMBEDS = 1000
+MAX_ATTEMPTS = 3
+# Seconds to spend delivering queued reports when the cog unloads
+CLOSE_TIMEOUT = 5
+
+
+class WebhookQueue:
+    """
+    Per-webhook queues that batch embeds into multi-embed payloads over a shared session.
+
+    Each webhook gets one worker, so deliveries to a webhook are serialized and can honor its
+    rate limit. Embeds queued while a request or a rate-limit wait is in progress are sent
+    together in the next payload. Workers exit once their queue has been idle for a while.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, idle_timeout: float = 60):
+        self.session = session
+        self.idle_timeout = idle_timeout
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    def send(self, webhook_url: str, embed: discord.Embed) -> None:
+        queue = self._queues.get(webhook_url)
+        if queue is None:
+            queue = self._queues[webhook_url] = asyncio.Queue(maxsize=MAX_QUEUED_EMBEDS)
+        try:
+            queue.put_nowait(embed.to_dict())
+        except asyncio.QueueFull:
+            print("Webhook queue is full, dropping detection report")
+            return
+        worker = self._workers.get(webhook_url)
+        if worker is None or worker.done():
+            self._workers[webhook_url] = asyncio.ensure_future(self._worker(webhook_url, queue))
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """
+        Give the workers up to `timeout` seconds to deliver what is already queued, then stop them.
+        """
+        queues = [queue.join() for queue in self._queues.values()]
+        if queues:
+            try:
+                await asyncio.wait_for(asyncio.gather(*queues), timeout)
+            except asyncio.TimeoutError:
+                print("Timed out delivering queued detection reports, dropping the rest")
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
+
+    async def _worker(self, webhook_url: str, queue: asyncio.Queue) -> None:
+        while True:
+            try:
+                embed = await asyncio.wait_for(queue.get(), timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    self._queues.pop(webhook_url, None)
+                    self._workers.pop(webhook_url, None)
+                    return
+                continue
+
+            embeds = [embed]
+            while len(embeds) < MAX_EMBEDS_PER_MESSAGE and not queue.empty():
+                embeds.append(queue.get_nowait())
+            try:
+                await self._post(webhook_url, embeds)
+            finally:
+                for _ in embeds:
+                    queue.task_done()
+
+    async def _post(self, webhook_url: str, embeds: list) -> None:
+        for _ in range(MAX_ATTEMPTS):
+            try:
+                async with self.session.post(webhook_url, json={"embeds": embeds}) as response:
+                    if response.status == 429:
+                        await asyncio.sleep(self._retry_after(response))
+                        continue
+                    if response.status not in [200, 204]:
+                        print(f"Failed to send webhook: {response.status}")
+                        return
+                    # Wait out an exhausted bucket before the next payload instead of hitting a 429
+                    if response.headers.get("X-RateLimit-Remaining") == "0":
+                        await asyncio.sleep(self._reset_after(response))
+                    return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Failed to send webhook: {e}")
+                return
+        print("Failed to send webhook: still rate limited after retrying")
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse) -> float:
+        try:
+            return float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            return 1.0
+
+    @staticmethod
+    def _reset_after(response: aiohttp.ClientResponse) -> float:
+        try:
+            return float(response.headers.get("X-RateLimit-Reset-After", 0))
+        except ValueError:
+            return 0.0
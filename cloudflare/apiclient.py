@@ -0,0 +1,186 @@
+import asyncio
+import contextlib
+import re
+import time
+from collections import deque
+
+import aiohttp #type: ignore
+
+API_BASE = "https://api.cloudflare.com/client/v4"
+# Cloudflare's global limit is 1200 requests per five minutes per user
+RATE_LIMIT_REQUESTS = 1200
+RATE_LIMIT_WINDOW = 300
+MAX_ATTEMPTS = 4
+
+
+class CloudflareAPIError(Exception):
+    """A Cloudflare API call that failed, with the messages from the response's `errors` array."""
+
+    def __init__(self, status, errors):
+        self.status = status
+        self.errors = errors
+        super().__init__(format_errors({"errors": errors}, status))
+
+
+def format_errors(data, status=None):
+    """Join the messages of a Cloudflare error response, falling back to the HTTP status."""
+    errors = data.get("errors") if isinstance(data, dict) else None
+    messages = [f"{error.get('message', 'Unknown error')} ({error['code']})" if error.get("code") else error.get("message", "Unknown error") for error in errors or [] if isinstance(error, dict)]
+    if messages:
+        return "\n".join(messages)
+    return f"HTTP {status}" if status else "Unknown error"
+
+
+class SlidingWindowLimiter:
+    """Waits as needed so no more than `limit` requests start in any `window` seconds."""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self._starts = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self.window:
+                    self._starts.popleft()
+                if len(self._starts) < self.limit:
+                    self._starts.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self._starts[0]))
+
+
+class CloudflareAPI:
+    """
+    Shared client for the Cloudflare API.
+
+    Credentials from Red's shared API tokens are cached until `invalidate_credentials` is
+    called. Every request goes through one pooled session and a sliding-window limiter that
+    keeps the cog under the account rate limit. A 429 is retried after the delay Cloudflare
+    asks for, using Retry-After or the reset time in the Ratelimit header.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._session = None
+        self._credentials = None
+        self.limiter = SlidingWindowLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_WINDOW)
+
+    @property
+    def session(self):
+        # Created lazily so the session binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=60))
+        return self._session
+
+    async def credentials(self):
+        if self._credentials is None:
+            self._credentials = await self.bot.get_shared_api_tokens("cloudflare")
+        return self._credentials
+
+    def invalidate_credentials(self):
+        self._credentials = None
+
+    async def auth_headers(self):
+        """Headers authenticating with the bearer token if one is set, otherwise the email and global API key."""
+        credentials = await self.credentials()
+        if credentials.get("bearer_token"):
+            return {"Authorization": f"Bearer {credentials['bearer_token']}"}
+        return {"X-Auth-Email": credentials.get("email", ""), "X-Auth-Key": credentials.get("api_key", "")}
+
+    @contextlib.asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        """
+        Make a rate-limited request, retrying rate-limited attempts, and yield the final response.
+        Used like `session.request`, so callers keep their own handling of the response.
+        """
+        # Multipart bodies are consumed by the first attempt and can't be resent
+        attempts = 1 if isinstance(kwargs.get("data"), aiohttp.FormData) else MAX_ATTEMPTS
+        for attempt in range(attempts):
+            await self.limiter.acquire()
+            response = await self.session.request(method, url, **kwargs)
+            if response.status == 429 and attempt < attempts - 1:
+                delay = self._retry_delay(response, attempt)
+                response.release()
+                await asyncio.sleep(delay)
+                continue
+            try:
+                yield response
+            finally:
+                response.release()
+            return
+
+    async def call(self, method, path, **kwargs):
+        """
+        Call an API path (relative to the v4 base) with the cached credentials and return the decoded
+        JSON body. Raises CloudflareAPIError if Cloudflare reports a failure.
+        """
+        headers = await self.auth_headers()
+        headers.update(kwargs.pop("headers", {}))
+        async with self.request(method, f"{API_BASE}{path}", headers=headers, **kwargs) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+            if response.status >= 400 or not isinstance(data, dict) or data.get("success") is False:
+                raise CloudflareAPIError(response.status, data.get("errors", []) if isinstance(data, dict) else [])
+            return data
+
+    async def paginate(self, path, params=None, per_page=None, key=None):
+        """
+        Yield every item of a list endpoint, fetching one page at a time as the caller consumes them.
+
+        Handles both of Cloudflare's schemes: cursors (R2's `result_info.cursor`, or the images API's
+        `continuation_token` next to the items) and numbered pages (`page` with `result_info.total_pages`).
+        `key` names the list inside `result` for endpoints that wrap their items in an object.
+        Only the current page is held in memory. Raises CloudflareAPIError if any page fails.
+        """
+        params = dict(params or {})
+        if per_page:
+            params["per_page"] = per_page
+        page = 1
+        cursor = None
+        while True:
+            data = await self.call("GET", path, params=params)
+            result = data.get("result") or []
+            items = result.get(key, []) if isinstance(result, dict) else result
+            for item in items:
+                yield item
+
+            info = data.get("result_info") or {}
+            if isinstance(result, dict) and result.get("continuation_token"):
+                cursor_param, next_cursor = "continuation_token", result["continuation_token"]
+            else:
+                cursor_param, next_cursor = "cursor", info.get("cursor")
+            if next_cursor:
+                # An endpoint handing back the cursor it was given has nothing more
+                if info.get("is_truncated") is False or next_cursor == cursor:
+                    return
+                cursor = params[cursor_param] = next_cursor
+                continue
+
+            total_pages = info.get("total_pages")
+            if not total_pages and info.get("total_count") and info.get("per_page"):
+                total_pages = -(-info["total_count"] // info["per_page"])
+            if not items or not total_pages or page >= total_pages:
+                return
+            page = params["page"] = page + 1
+
+    @staticmethod
+    def _retry_delay(response, attempt):
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            pass
+        # e.g. Ratelimit: "default";r=0;t=30
+        match = re.search(r"\bt=(\d+)", response.headers.get("Ratelimit", ""))
+        if match:
+            return float(match.group(1))
+        return 2 ** attempt
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
@@ -10,6 +10,9 @@ import json
 import re
 import io
 
+from .apiclient import API_BASE, CloudflareAPI, CloudflareAPIError, format_errors
+from .paginator import StreamPaginator
+
 class Cloudflare(commands.Cog):
     """A Red-Discordbot cog to interact with the Cloudflare API."""
 
@@ -23,7 +26,15 @@ class Cloudflare(commands.Cog):
             "account_id": None,
         }
         self.config.register_global(**default_global)
-        self.session = aiohttp.ClientSession()
+        self.api = CloudflareAPI(bot)
+
+    async def cog_unload(self):
+        await self.api.close()
+
+    @commands.Cog.listener()
+    async def on_red_api_tokens_update(self, service_name, api_tokens):
+        if service_name == "cloudflare":
+            self.api.invalidate_credentials()
     
 
 
@@ -53,7 +64,7 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
         if not account_id or not bearer_token:
@@ -64,14 +75,8 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1"
-
         try:
-            async with self.session.get(attachment.url) as resp:
+            async with self.api.session.get(attachment.url) as resp:
                 if resp.status != 200:
                     await ctx.send(embed=discord.Embed(
                         title="Error",
@@ -79,49 +84,48 @@ class Cloudflare(commands.Cog):
                         color=discord.Color.from_str("#ff4545")
                     ))
                     return
-                data = aiohttp.FormData()
-                data.add_field('file', await resp.read(), filename=attachment.filename, content_type=attachment.content_type)
-
-                # aiohttp.FormData automatically sets the correct Content-Type with boundary
-                async with self.session.post(url, headers=headers, data=data) as response:
-                    data = await response.json()
-                    if not data.get("success", False):
-                        error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                        embed = discord.Embed(
-                            title="Failed to Upload Image",
-                            description=f"**Error:** {error_message}",
-                            color=discord.Color.from_str("#ff4545"))
-                        await ctx.send(embed=embed)
-                        return
-
-                    result = data.get("result", {})
-                    filename = result.get("filename", "Unknown")
-                    image_id = result.get("id", "Unknown")
-                    uploaded = result.get("uploaded", "Unknown")
-                    variants = result.get("variants", [])
-
-                    embed = discord.Embed(
-                        title="Uploaded successfully",
-                        color=discord.Color.from_str("#2BBD8E"))
-                    embed.add_field(name="Filename", value=f"**`{filename}`**", inline=False)
-                    embed.add_field(name="Uploaded", value=f"**`{uploaded}`**", inline=False)
-                    embed.add_field(name="ID", value=f"```{image_id}```", inline=False)
-                    for variant in variants:
-                        embed.add_field(name="Variant", value=variant, inline=False)
+                form = aiohttp.FormData()
+                form.add_field('file', await resp.read(), filename=attachment.filename, content_type=attachment.content_type)
 
-                    await ctx.send(embed=embed)
+            # aiohttp.FormData automatically sets the correct Content-Type with boundary
+            data = await self.api.call("POST", f"/accounts/{account_id}/images/v1", data=form)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Upload Image",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545"))
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        result = data.get("result", {})
+        filename = result.get("filename", "Unknown")
+        image_id = result.get("id", "Unknown")
+        uploaded = result.get("uploaded", "Unknown")
+        variants = result.get("variants", [])
+
+        embed = discord.Embed(
+            title="Uploaded successfully",
+            color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="Filename", value=f"**`{filename}`**", inline=False)
+        embed.add_field(name="Uploaded", value=f"**`{uploaded}`**", inline=False)
+        embed.add_field(name="ID", value=f"```{image_id}```", inline=False)
+        for variant in variants:
+            embed.add_field(name="Variant", value=variant, inline=False)
+
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @images.command(name="delete")
     async def delete_image(self, ctx, image_id: str):
         """Delete an image from Cloudflare Images by its ID."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
         if not account_id or not bearer_token:
@@ -132,42 +136,34 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1/{image_id}"
-
         try:
-            async with self.session.delete(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Delete Image",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545"))
-                    await ctx.send(embed=embed)
-                    return
-
-                embed = discord.Embed(
-                    title="Deleted successfully",
-                    description=f"Image with ID `{image_id}` has been deleted.",
-                    color=discord.Color.from_str("#2BBD8E"))
-                await ctx.send(embed=embed)
+            await self.api.call("DELETE", f"/accounts/{account_id}/images/v1/{image_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Delete Image",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545"))
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        embed = discord.Embed(
+            title="Deleted successfully",
+            description=f"Image with ID `{image_id}` has been deleted.",
+            color=discord.Color.from_str("#2BBD8E"))
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @images.command(name="info")
     async def image_info(self, ctx, image_id: str):
         """Get information about a specific image."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
         if not account_id or not bearer_token:
@@ -178,54 +174,46 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1/{image_id}"
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch Image Info",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                filename = result.get("filename", "Unknown")
-                upload_time = result.get("uploaded", "Unknown")
-                variants = result.get("variants", [])
-
-                embed = discord.Embed(
-                    title="Image Information",
-                    description=f"Information for image ID `{image_id}`:",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                embed.add_field(name="Filename", value=f"**`{filename}`**", inline=False)
-                embed.add_field(name="Uploaded", value=f"**`{upload_time}`**", inline=False)
-                for variant in variants:
-                    embed.add_field(name="Variant", value=variant, inline=False)
-
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/accounts/{account_id}/images/v1/{image_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Fetch Image Info",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        result = data.get("result", {})
+        filename = result.get("filename", "Unknown")
+        upload_time = result.get("uploaded", "Unknown")
+        variants = result.get("variants", [])
+
+        embed = discord.Embed(
+            title="Image Information",
+            description=f"Information for image ID `{image_id}`:",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        embed.add_field(name="Filename", value=f"**`{filename}`**", inline=False)
+        embed.add_field(name="Uploaded", value=f"**`{upload_time}`**", inline=False)
+        for variant in variants:
+            embed.add_field(name="Variant", value=variant, inline=False)
+
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @images.command(name="list")
     async def list_images(self, ctx):
         """List available images."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
         if not account_id or not bearer_token:
@@ -236,54 +224,54 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v2"
-
-        try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch Images",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                images = data.get("result", {}).get("images", [])
-                if not images:
-                    await ctx.send(embed=discord.Embed(
-                        title="No Images Found",
-                        description="No images found.",
-                        color=discord.Color.from_str("#ff4545")
-                    ))
-                    return
+        def render(images, index):
+            embed = discord.Embed(
+                title="Available Images",
+                description="Here are the available images:",
+                color=discord.Color.from_str("#2BBD8E")
+            )
+            for image in images:
+                filename = image.get("filename", "Unknown")
+                image_id = image.get("id", "Unknown")
+                upload_time = image.get("uploaded", "Unknown")
+                variants = image.get("variants", [])
 
-                embed = discord.Embed(
-                    title="Available Images",
-                    description="Here are the available images:",
-                    color=discord.Color.from_str("#2BBD8E")
+                embed.add_field(
+                    name=f"Image ID: {image_id}",
+                    value=f"**Filename:** `{filename}`\n**Uploaded:** `{upload_time}`\n**Variants:** {', '.join(variants)}"[:1024],
+                    inline=False
                 )
+            return embed
+
+        def export_row(image):
+            return {
+                "id": image.get("id", ""),
+                "filename": image.get("filename", ""),
+                "uploaded": image.get("uploaded", ""),
+                "variants": " ".join(image.get("variants", [])),
+            }
 
-                for image in images:
-                    filename = image.get("filename", "Unknown")
-                    image_id = image.get("id", "Unknown")
-                    upload_time = image.get("uploaded", "Unknown")
-                    variants = image.get("variants", [])
-
-                    embed.add_field(
-                        name=f"Image ID: {image_id}",
-                        value=f"**Filename:** `{filename}`\n**Uploaded:** `{upload_time}`\n**Variants:** {', '.join(variants)}",
-                        inline=False
-                    )
-
-                await ctx.send(embed=embed)
+        paginator = StreamPaginator(
+            ctx.author,
+            lambda: self.api.paginate(f"/accounts/{account_id}/images/v2", per_page=1000, key="images"),
+            render,
+            per_page=5,
+            export_row=export_row,
+            export_name="images.csv"
+        )
+        try:
+            if not await paginator.start(ctx):
+                await ctx.send(embed=discord.Embed(
+                    title="No Images Found",
+                    description="No images found.",
+                    color=discord.Color.from_str("#ff4545")
+                ))
+        except CloudflareAPIError as e:
+            await ctx.send(embed=discord.Embed(
+                title="Failed to Fetch Images",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            ))
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
@@ -295,7 +283,7 @@ class Cloudflare(commands.Cog):
     @images.command(name="stats")
     async def image_stats(self, ctx):
         """Fetch Cloudflare Images usage statistics."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
         if not account_id or not bearer_token:
@@ -306,45 +294,37 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1/stats"
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch Image Stats",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                count = result.get("count", {})
-                allowed = count.get("allowed", "Unknown")
-                current = count.get("current", "Unknown")
-
-                embed = discord.Embed(
-                    title="Usage statistics",
-                    description="Here are your current usage statistics for Cloudflare Images:",
-                    color=discord.Color.from_str("#2BBD8E"))
-                embed.add_field(name="Allowed", value=f"**`{allowed}`**", inline=True)
-                embed.add_field(name="Current", value=f"**`{current}`**", inline=True)
-
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/accounts/{account_id}/images/v1/stats")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Fetch Image Stats",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        result = data.get("result", {})
+        count = result.get("count", {})
+        allowed = count.get("allowed", "Unknown")
+        current = count.get("current", "Unknown")
+
+        embed = discord.Embed(
+            title="Usage statistics",
+            description="Here are your current usage statistics for Cloudflare Images:",
+            color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="Allowed", value=f"**`{allowed}`**", inline=True)
+        embed.add_field(name="Current", value=f"**`{current}`**", inline=True)
+
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @commands.group()
@@ -355,7 +335,7 @@ class Cloudflare(commands.Cog):
     @loadbalancing.command(name="create")
     async def loadbalancing_create(self, ctx, name: str, description: str, default_pools: str, country_pools: str, pop_pools: str, region_pools: str, proxied: bool, ttl: int, adaptive_routing: bool, failover_across_pools: bool, fallback_pool: str, location_strategy_mode: str, location_strategy_prefer_ecs: str, random_steering_default_weight: float, random_steering_pool_weights: str, steering_policy: str, session_affinity: str, session_affinity_ttl: int):
         """Create a new load balancer for a specific zone."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -367,13 +347,6 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/load_balancers"
-
         payload = {
             "name": name,
             "description": description,
@@ -402,41 +375,40 @@ class Cloudflare(commands.Cog):
         }
 
         try:
-            async with self.session.post(url, headers=headers, json=payload) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Create Load Balancer",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                lb_id = result.get("id", "Unknown")
-                lb_name = result.get("name", "Unknown")
-                lb_created_on = result.get("created_on", "Unknown")
-
-                embed = discord.Embed(
-                    title="Load Balancer Created",
-                    description=f"Load balancer **{lb_name}** has been successfully created.\n\n**ID:** {lb_id}\n**Created On:** {lb_created_on}",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                await ctx.send(embed=embed)
+            data = await self.api.call("POST", f"/zones/{zone_id}/load_balancers", json=payload)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Create Load Balancer",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        result = data.get("result", {})
+        lb_id = result.get("id", "Unknown")
+        lb_name = result.get("name", "Unknown")
+        lb_created_on = result.get("created_on", "Unknown")
+
+        embed = discord.Embed(
+            title="Load Balancer Created",
+            description=f"Load balancer **{lb_name}** has been successfully created.\n\n**ID:** {lb_id}\n**Created On:** {lb_created_on}",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @loadbalancing.command(name="list")
     async def loadbalancing_list(self, ctx):
         """Get a list of load balancers for a specific zone."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -448,48 +420,44 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/load_balancers"
-
+        def render(load_balancers, index):
+            embed = discord.Embed(
+                title="Load Balancers",
+                description="Here is a list of load balancers for your Cloudflare zone:",
+                color=discord.Color.from_str("#2BBD8E")
+            )
+            for lb in load_balancers:
+                lb_name = lb.get("name", "Unknown")
+                lb_id = lb.get("id", "Unknown")
+                lb_status = "Enabled" if lb.get("enabled", False) else "Disabled"
+                embed.add_field(name=lb_name, value=f"ID: `{lb_id}`\nStatus: `{lb_status}`", inline=False)
+            return embed
+
+        def export_row(lb):
+            return {"id": lb.get("id", ""), "name": lb.get("name", ""), "enabled": lb.get("enabled", False)}
+
+        paginator = StreamPaginator(
+            ctx.author,
+            lambda: self.api.paginate(f"/zones/{zone_id}/load_balancers"),
+            render,
+            export_row=export_row,
+            export_name="load_balancers.csv"
+        )
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch Load Balancers",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", [])
-                if not result:
-                    embed = discord.Embed(
-                        title="No Load Balancers Found",
-                        description="There are no load balancers configured for this zone.",
-                        color=discord.Color.from_str("#2BBD8E")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
+            if not await paginator.start(ctx):
                 embed = discord.Embed(
-                    title="Load Balancers",
-                    description="Here is a list of load balancers for your Cloudflare zone:",
+                    title="No Load Balancers Found",
+                    description="There are no load balancers configured for this zone.",
                     color=discord.Color.from_str("#2BBD8E")
                 )
-                for lb in result:
-                    lb_name = lb.get("name", "Unknown")
-                    lb_id = lb.get("id", "Unknown")
-                    lb_status = "Enabled" if lb.get("enabled", False) else "Disabled"
-                    embed.add_field(name=lb_name, value=f"ID: `{lb_id}`\nStatus: `{lb_status}`", inline=False)
-
                 await ctx.send(embed=embed)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Fetch Load Balancers",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
@@ -501,7 +469,7 @@ class Cloudflare(commands.Cog):
     @loadbalancing.command(name="delete")
     async def delete_load_balancer(self, ctx, load_balancer_id: str):
         """Delete a load balancer by its ID."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -513,44 +481,36 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/load_balancers/{load_balancer_id}"
-
         try:
-            async with self.session.delete(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Delete Load Balancer",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                embed = discord.Embed(
-                    title="Load Balancer Deleted",
-                    description=f"Load balancer with ID `{load_balancer_id}` has been successfully deleted.",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                await ctx.send(embed=embed)
+            await self.api.call("DELETE", f"/zones/{zone_id}/load_balancers/{load_balancer_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Delete Load Balancer",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        embed = discord.Embed(
+            title="Load Balancer Deleted",
+            description=f"Load balancer with ID `{load_balancer_id}` has been successfully deleted.",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @loadbalancing.command(name="info")
     async def get_load_balancer_info(self, ctx, load_balancer_id: str):
         """Get information about a specific load balancer by its ID."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -562,53 +522,45 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/load_balancers/{load_balancer_id}"
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch Load Balancer Info",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                embed = discord.Embed(
-                    title="Load Balancer Information",
-                    description=f"Information for Load Balancer with ID `{load_balancer_id}`",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                embed.add_field(name="Name", value=f"**`{result.get('name', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Description", value=f"**`{result.get('description', 'None')}`**", inline=True)
-                embed.add_field(name="Enabled", value=f"**`{result.get('enabled', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Created On", value=f"**`{result.get('created_on', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Modified On", value=f"**`{result.get('modified_on', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Proxied", value=f"**`{result.get('proxied', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Session Affinity", value=f"**`{result.get('session_affinity', 'None')}`**", inline=True)
-                embed.add_field(name="Steering Policy", value=f"**`{result.get('steering_policy', 'None')}`**", inline=True)
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/zones/{zone_id}/load_balancers/{load_balancer_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Fetch Load Balancer Info",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        result = data.get("result", {})
+        embed = discord.Embed(
+            title="Load Balancer Information",
+            description=f"Information for Load Balancer with ID `{load_balancer_id}`",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        embed.add_field(name="Name", value=f"**`{result.get('name', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Description", value=f"**`{result.get('description', 'None')}`**", inline=True)
+        embed.add_field(name="Enabled", value=f"**`{result.get('enabled', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Created On", value=f"**`{result.get('created_on', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Modified On", value=f"**`{result.get('modified_on', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Proxied", value=f"**`{result.get('proxied', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Session Affinity", value=f"**`{result.get('session_affinity', 'None')}`**", inline=True)
+        embed.add_field(name="Steering Policy", value=f"**`{result.get('steering_policy', 'None')}`**", inline=True)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @loadbalancing.command(name="patch")
     async def patch_load_balancer(self, ctx, load_balancer_id: str, key: str, value: str):
         """Update the settings of a specific load balancer."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -620,41 +572,34 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/load_balancers/{load_balancer_id}"
         payload = {
             key: value
         }
 
         try:
-            async with self.session.patch(url, headers=headers, json=payload) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Update Load Balancer",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                embed = discord.Embed(
-                    title="Load Balancer Updated",
-                    description=f"Load Balancer with ID `{load_balancer_id}` has been updated successfully.",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                await ctx.send(embed=embed)
+            await self.api.call("PATCH", f"/zones/{zone_id}/load_balancers/{load_balancer_id}", json=payload)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Update Load Balancer",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=discord.Color.from_str("#ff4545")
             ))
+            return
+
+        embed = discord.Embed(
+            title="Load Balancer Updated",
+            description=f"Load Balancer with ID `{load_balancer_id}` has been updated successfully.",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @commands.group()
@@ -665,7 +610,7 @@ class Cloudflare(commands.Cog):
     @dnssec.command(name="status")
     async def dnssec_status(self, ctx):
         """Get the current DNSSEC status and config for a specific zone."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         zone_id = api_tokens.get("zone_id")
         if not bearer_token or not zone_id:
@@ -677,68 +622,16 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/dnssec"
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Fetch DNSSEC Status",
-                        description=f"**Error:** {error_message}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                embed = discord.Embed(
-                    title="DNSSEC Status",
-                    description=f"Here is the current DNSSEC status and configuration for Cloudflare Zone `{zone_id}`\n\nChange your zone using `[p]set api cloudflare zone_id`",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                embed.add_field(name="Algorithm", value=f"**`{result.get('algorithm', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Digest Algorithm", value=f"**`{result.get('digest_algorithm', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Digest Type", value=f"**`{result.get('digest_type', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Multi Signer", value=f"**`{str(result.get('dnssec_multi_signer', 'Unknown')).upper()}`**", inline=True)
-                embed.add_field(name="Presigned", value=f"**`{str(result.get('dnssec_presigned', 'Unknown')).upper()}`**", inline=True)
-                embed.add_field(name="Flags", value=f"**`{result.get('flags', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Key Tag", value=f"**`{result.get('key_tag', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Key Type", value=f"**`{result.get('key_type', 'Unknown')}`**", inline=True)
-                modified_on = result.get('modified_on', 'Unknown')
-                if modified_on != 'Unknown':
-                    try:
-                        from datetime import datetime
-                        modified_on_dt = datetime.fromisoformat(modified_on.replace('Z', '+00:00'))
-                        modified_on = f"<t:{int(modified_on_dt.timestamp())}:R>"
-                    except ValueError:
-                        pass
-                embed.add_field(name="Modified On", value=f"**{modified_on}**", inline=True)
-                status = result.get('status', 'Unknown').lower()
-                if status == 'active':
-                    status_display = "**`ACTIVE`**"
-                elif status == 'pending':
-                    status_display = "**`PENDING ACTIVATION`**"
-                elif status == 'disabled':
-                    status_display = "**`DISABLED`**"
-                elif status == 'pending-disabled':
-                    status_display = "**`PENDING DEACTIVATION`**"
-                elif status == 'error':
-                    status_display = "**`ERROR`**"
-                else:
-                    status_display = "**`UNKNOWN`**"
-                embed.add_field(name="Status", value=status_display, inline=True)
-                embed.add_field(name="DS", value=f"```{result.get('ds', 'Unknown')}```", inline=False)
-                embed.add_field(name="Public Key", value=f"```{result.get('public_key', 'Unknown')}```", inline=False)
-                embed.add_field(name="Digest", value=f"```{result.get('digest', 'Unknown')}```", inline=False)
-
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/zones/{zone_id}/dnssec")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Fetch DNSSEC Status",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             embed = discord.Embed(
                 title="Error",
@@ -746,41 +639,76 @@ class Cloudflare(commands.Cog):
                 color=discord.Color.from_str("#ff4545")
             )
             await ctx.send(embed=embed)
+            return
+
+        result = data.get("result", {})
+        embed = discord.Embed(
+            title="DNSSEC Status",
+            description=f"Here is the current DNSSEC status and configuration for Cloudflare Zone `{zone_id}`\n\nChange your zone using `[p]set api cloudflare zone_id`",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        embed.add_field(name="Algorithm", value=f"**`{result.get('algorithm', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Digest Algorithm", value=f"**`{result.get('digest_algorithm', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Digest Type", value=f"**`{result.get('digest_type', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Multi Signer", value=f"**`{str(result.get('dnssec_multi_signer', 'Unknown')).upper()}`**", inline=True)
+        embed.add_field(name="Presigned", value=f"**`{str(result.get('dnssec_presigned', 'Unknown')).upper()}`**", inline=True)
+        embed.add_field(name="Flags", value=f"**`{result.get('flags', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Key Tag", value=f"**`{result.get('key_tag', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Key Type", value=f"**`{result.get('key_type', 'Unknown')}`**", inline=True)
+        modified_on = result.get('modified_on', 'Unknown')
+        if modified_on != 'Unknown':
+            try:
+                from datetime import datetime
+                modified_on_dt = datetime.fromisoformat(modified_on.replace('Z', '+00:00'))
+                modified_on = f"<t:{int(modified_on_dt.timestamp())}:R>"
+            except ValueError:
+                pass
+        embed.add_field(name="Modified On", value=f"**{modified_on}**", inline=True)
+        status = result.get('status', 'Unknown').lower()
+        if status == 'active':
+            status_display = "**`ACTIVE`**"
+        elif status == 'pending':
+            status_display = "**`PENDING ACTIVATION`**"
+        elif status == 'disabled':
+            status_display = "**`DISABLED`**"
+        elif status == 'pending-disabled':
+            status_display = "**`PENDING DEACTIVATION`**"
+        elif status == 'error':
+            status_display = "**`ERROR`**"
+        else:
+            status_display = "**`UNKNOWN`**"
+        embed.add_field(name="Status", value=status_display, inline=True)
+        embed.add_field(name="DS", value=f"```{result.get('ds', 'Unknown')}```", inline=False)
+        embed.add_field(name="Public Key", value=f"```{result.get('public_key', 'Unknown')}```", inline=False)
+        embed.add_field(name="Digest", value=f"```{result.get('digest', 'Unknown')}```", inline=False)
+
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @dnssec.command(name="delete")
     async def delete_dnssec(self, ctx):
         """Delete DNSSEC on the currently set Cloudflare zone"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         zone_id = api_tokens.get("zone_id")
         if not zone_id:
             embed = discord.Embed(title="Error", description="Zone ID not set.", color=discord.Color.from_str("#ff4545"))
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {api_tokens.get('bearer_token')}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/dnssec"
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                data = await response.json()
-                if data.get("success"):
-                    embed = discord.Embed(
-                        title="Success",
-                        description="DNSSEC has been successfully deleted for the set zone.",
-                        color=discord.Color.from_str("#2BBD8E")
-                    )
-                else:
-                    error_messages = "\n".join([error.get("message", "Unknown error") for error in data.get("errors", [])])
-                    embed = discord.Embed(
-                        title="Error",
-                        description=f"Failed to delete DNSSEC: {error_messages}",
-                        color=discord.Color.from_str("#ff4545")
-                    )
-                await ctx.send(embed=embed)
+        try:
+            await self.api.call("DELETE", f"/zones/{zone_id}/dnssec")
+            embed = discord.Embed(
+                title="Success",
+                description="DNSSEC has been successfully deleted for the set zone.",
+                color=discord.Color.from_str("#2BBD8E")
+            )
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to delete DNSSEC: {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @commands.group(invoke_without_command=True)
@@ -791,7 +719,7 @@ class Cloudflare(commands.Cog):
     @keystore.command(name="email")
     async def email(self, ctx):
         """Fetch the current Cloudflare email"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         if not email:
             embed = discord.Embed(title="Error", description="Email not set.", color=discord.Color.from_str("#ff4545"))
@@ -810,7 +738,7 @@ class Cloudflare(commands.Cog):
     @keystore.command(name="apikey")
     async def api_key(self, ctx):
         """Fetch the current Cloudflare API key"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         if not api_key:
             embed = discord.Embed(title="Error", description="API key not set.", color=discord.Color.from_str("#ff4545"))
@@ -829,7 +757,7 @@ class Cloudflare(commands.Cog):
     @keystore.command(name="bearertoken")
     async def bearer_token(self, ctx):
         """Fetch the current Cloudflare bearer token"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         if not bearer_token:
             embed = discord.Embed(title="Error", description="Bearer token not set.", color=discord.Color.from_str("#ff4545"))
@@ -848,7 +776,7 @@ class Cloudflare(commands.Cog):
     @keystore.command(name="accountid")
     async def account_id(self, ctx):
         """Fetch the current Cloudflare account ID"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         if not account_id:
             embed = discord.Embed(title="Error", description="Account ID not set.", color=discord.Color.from_str("#ff4545"))
@@ -867,7 +795,7 @@ class Cloudflare(commands.Cog):
     @keystore.command(name="zoneid")
     async def zone_id(self, ctx):
         """Fetch the current Cloudflare zone ID"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         zone_id = api_tokens.get("zone_id")
         if not zone_id:
             embed = discord.Embed(title="Error", description="Zone ID not set.", color=discord.Color.from_str("#ff4545"))
@@ -891,7 +819,7 @@ class Cloudflare(commands.Cog):
     @botmanagement.command(name="get")
     async def get_bot_management_config(self, ctx):
         """Get the current bot management config from Cloudflare."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         zone_id = api_tokens.get("zone_id")
@@ -905,75 +833,66 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/bot_management"
-        
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch bot management config: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            bot_management_config = data.get("result", {})
-            if not bot_management_config:
-                embed = discord.Embed(
-                    title="Error",
-                    description="No bot management config found.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
+        try:
+            data = await self.api.call("GET", f"/zones/{zone_id}/bot_management")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch bot management config: {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
 
+        bot_management_config = data.get("result", {})
+        if not bot_management_config:
             embed = discord.Embed(
-                title="Bot Management",
-                description="Your current **Cloudflare Bot Management** settings are as follows:",
-                color=discord.Color.from_str("#2BBD8E")
+                title="Error",
+                description="No bot management config found.",
+                color=discord.Color.from_str("#ff4545")
             )
+            await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="Bot Management",
+            description="Your current **Cloudflare Bot Management** settings are as follows:",
+            color=discord.Color.from_str("#2BBD8E")
+        )
 
-            def format_value(value):
-                return value.upper() if isinstance(value, str) else str(value).upper()
-
-            # Add fields to the embed only if the corresponding key is present in the API response
-            if 'fight_mode' in bot_management_config:
-                embed.add_field(name="Super Bot Fight Mode", value=f"**`{format_value(bot_management_config.get('fight_mode', 'Not set'))}`**", inline=False)
-            if 'enable_js' in bot_management_config:
-                embed.add_field(name="Enable JS", value=f"**`{format_value(bot_management_config.get('enable_js', 'Not set'))}`**", inline=False)
-            if 'using_latest_model' in bot_management_config:
-                embed.add_field(name="Using Latest Model", value=f"**`{format_value(bot_management_config.get('using_latest_model', 'Not set'))}`**", inline=False)
-            if 'optimize_wordpress' in bot_management_config:
-                embed.add_field(name="Optimize Wordpress", value=f"**`{format_value(bot_management_config.get('optimize_wordpress', 'Not set'))}`**", inline=False)
-            if 'sbfm_definitely_automated' in bot_management_config:
-                embed.add_field(name="Definitely Automated", value=f"**`{format_value(bot_management_config.get('sbfm_definitely_automated', 'Not set'))}`**", inline=True)
-            if 'sbfm_verified_bots' in bot_management_config:
-                embed.add_field(name="Verified Bots", value=f"**`{format_value(bot_management_config.get('sbfm_verified_bots', 'Not set'))}`**", inline=True)
-            if 'sbfm_static_resource_protection' in bot_management_config:
-                embed.add_field(name="Static Resource Protection", value=f"**`{format_value(bot_management_config.get('sbfm_static_resource_protection', 'Not set'))}`**", inline=True)
-            if 'suppress_session_score' in bot_management_config:
-                embed.add_field(name="Suppress Session Score", value=f"**`{format_value(bot_management_config.get('suppress_session_score', 'Not set'))}`**", inline=False)
-            if 'auto_update_model' in bot_management_config:
-                embed.add_field(name="Auto Update Model", value=f"**`{format_value(bot_management_config.get('auto_update_model', 'Not set'))}`**", inline=False)
+        def format_value(value):
+            return value.upper() if isinstance(value, str) else str(value).upper()
+
+        # Add fields to the embed only if the corresponding key is present in the API response
+        if 'fight_mode' in bot_management_config:
+            embed.add_field(name="Super Bot Fight Mode", value=f"**`{format_value(bot_management_config.get('fight_mode', 'Not set'))}`**", inline=False)
+        if 'enable_js' in bot_management_config:
+            embed.add_field(name="Enable JS", value=f"**`{format_value(bot_management_config.get('enable_js', 'Not set'))}`**", inline=False)
+        if 'using_latest_model' in bot_management_config:
+            embed.add_field(name="Using Latest Model", value=f"**`{format_value(bot_management_config.get('using_latest_model', 'Not set'))}`**", inline=False)
+        if 'optimize_wordpress' in bot_management_config:
+            embed.add_field(name="Optimize Wordpress", value=f"**`{format_value(bot_management_config.get('optimize_wordpress', 'Not set'))}`**", inline=False)
+        if 'sbfm_definitely_automated' in bot_management_config:
+            embed.add_field(name="Definitely Automated", value=f"**`{format_value(bot_management_config.get('sbfm_definitely_automated', 'Not set'))}`**", inline=True)
+        if 'sbfm_verified_bots' in bot_management_config:
+            embed.add_field(name="Verified Bots", value=f"**`{format_value(bot_management_config.get('sbfm_verified_bots', 'Not set'))}`**", inline=True)
+        if 'sbfm_static_resource_protection' in bot_management_config:
+            embed.add_field(name="Static Resource Protection", value=f"**`{format_value(bot_management_config.get('sbfm_static_resource_protection', 'Not set'))}`**", inline=True)
+        if 'suppress_session_score' in bot_management_config:
+            embed.add_field(name="Suppress Session Score", value=f"**`{format_value(bot_management_config.get('suppress_session_score', 'Not set'))}`**", inline=False)
+        if 'auto_update_model' in bot_management_config:
+            embed.add_field(name="Auto Update Model", value=f"**`{format_value(bot_management_config.get('auto_update_model', 'Not set'))}`**", inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @botmanagement.command(name="update")
     async def update_bot_management_config(self, ctx, setting: str, value: str):
         """Update a specific bot management setting."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         zone_id = api_tokens.get("zone_id")
-        bearer_token = api_tokens.get("bearer_token")
         if not api_key or not email or not zone_id:
             embed = discord.Embed(
                 title="Error",
@@ -983,43 +902,33 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/bot_management"
         payload = json.dumps({setting: value.lower() == 'true'})
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, headers=headers, data=payload) as response:
-                    data = await response.json()
-                    if response.status != 200:
-                        error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                        embed = discord.Embed(
-                            title="Failed to Update Bot Management Config",
-                            description=f"**Error:** {error_message}",
-                            color=discord.Color.from_str("#ff4545")
-                        )
-                        await ctx.send(embed=embed)
-                        return
-
-                    embed = discord.Embed(
-                        title="Bot management changed",
-                        description=f"Successfully updated bot management setting **`{setting}`** to **`{value}`**.",
-                        color=discord.Color.from_str("#2BBD8E")
-                    )
-                    await ctx.send(embed=embed)
+            await self.api.call("PUT", f"/zones/{zone_id}/bot_management", headers={"Content-Type": "application/json"}, data=payload)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Update Bot Management Config",
+                description=f"**Error:** {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             embed = discord.Embed(
                 title="Error",
-                description=f"An error occurred: {str(e)}\n\nRequest URL: {url}\nHeaders: {headers}\nPayload: {payload}",
+                description=f"An error occurred: {str(e)}\n\nPayload: {payload}",
                 color=discord.Color.from_str("#ff4545")
             )
             await ctx.author.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="Bot management changed",
+            description=f"Successfully updated bot management setting **`{setting}`** to **`{value}`**.",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @commands.group()
@@ -1032,7 +941,7 @@ class Cloudflare(commands.Cog):
     @zones.command(name="get")
     async def get(self, ctx):
         """Get the list of zones from Cloudflare."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         if not api_key or not email:
@@ -1044,80 +953,74 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json"
-        }
-
-        async with self.session.get("https://api.cloudflare.com/client/v4/zones", headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch zones: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            zones = data.get("result", [])
-            if not zones:
-                embed = discord.Embed(
-                    title="Error",
-                    description="No zones found.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
-            zone_names = [zone["name"] for zone in zones]
-            pages = [zone_names[i:i + 10] for i in range(0, len(zone_names), 10)]
-
-            current_page = 0
+        try:
+            data = await self.api.call("GET", "/zones")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Zones in Cloudflare account",
-                description="\n".join(pages[current_page]),
-                color=discord.Color.from_str("#2BBD8E")
+                title="Error",
+                description=f"Failed to fetch zones: {e}",
+                color=discord.Color.from_str("#ff4545")
             )
-            message = await ctx.send(embed=embed)
-
-            if len(pages) > 1:
-                await message.add_reaction("◀️")
-                await message.add_reaction("❌")
-                await message.add_reaction("▶️")
+            await ctx.send(embed=embed)
+            return
 
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
+        zones = data.get("result", [])
+        if not zones:
+            embed = discord.Embed(
+                title="Error",
+                description="No zones found.",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
 
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+        zone_names = [zone["name"] for zone in zones]
+        pages = [zone_names[i:i + 10] for i in range(0, len(zone_names), 10)]
 
-                        if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
-                            current_page += 1
-                            embed.description = "\n".join(pages[current_page])
-                            await message.edit(embed=embed)
-                            await message.remove_reaction(reaction, user)
+        current_page = 0
+        embed = discord.Embed(
+            title="Zones in Cloudflare account",
+            description="\n".join(pages[current_page]),
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        message = await ctx.send(embed=embed)
 
-                        elif str(reaction.emoji) == "◀️" and current_page > 0:
-                            current_page -= 1
-                            embed.description = "\n".join(pages[current_page])
-                            await message.edit(embed=embed)
-                            await message.remove_reaction(reaction, user)
+        if len(pages) > 1:
+            await message.add_reaction("◀️")
+            await message.add_reaction("❌")
+            await message.add_reaction("▶️")
 
-                        elif str(reaction.emoji) == "❌":
-                            await message.delete()
-                            break
+            def check(reaction, user):
+                return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
 
-                    except asyncio.TimeoutError:
+            while True:
+                try:
+                    reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+
+                    if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
+                        current_page += 1
+                        embed.description = "\n".join(pages[current_page])
+                        await message.edit(embed=embed)
+                        await message.remove_reaction(reaction, user)
+
+                    elif str(reaction.emoji) == "◀️" and current_page > 0:
+                        current_page -= 1
+                        embed.description = "\n".join(pages[current_page])
+                        await message.edit(embed=embed)
+                        await message.remove_reaction(reaction, user)
+
+                    elif str(reaction.emoji) == "❌":
+                        await message.delete()
                         break
 
-                # Remove reactions after timeout
-                try:
-                    await message.clear_reactions()
-                except discord.Forbidden:
-                    pass
+                except asyncio.TimeoutError:
+                    break
+
+            # Remove reactions after timeout
+            try:
+                await message.clear_reactions()
+            except discord.Forbidden:
+                pass
 
 
     @commands.group(invoke_without_command=False)
@@ -1134,7 +1037,7 @@ class Cloudflare(commands.Cog):
         undetermined_registrars = {"Dynadot Inc", ""}
         not_receptive_registrars = {"", ""}
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -1150,386 +1053,370 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/whois", params={"domain": domain})
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch WHOIS information: {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
 
-        async with self.session.get(f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/whois?domain={domain}", headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch WHOIS information: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
+        whois_info = data.get("result", {})
 
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch WHOIS information.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
+        pages = []
+        page = discord.Embed(title=f"WHOIS Information for {domain}", color=discord.Color.from_str("#2BBD8E"))
+        field_count = 0
 
-            whois_info = data.get("result", {})
-
-            pages = []
-            page = discord.Embed(title=f"WHOIS Information for {domain}", color=discord.Color.from_str("#2BBD8E"))
-            field_count = 0
-
-            def add_field_to_page(page, name, value):
-                nonlocal field_count, pages
-                page.add_field(name=name, value=value, inline=False)
-                field_count += 1
-                if field_count == 10:
-                    pages.append(page)
-                    page = discord.Embed(title=f"WHOIS Information for {domain}", color=discord.Color.from_str("#2BBD8E"))
-                    field_count = 0
-                return page
-
-            if "registrar" in whois_info:
-                registrar_value = f"`{whois_info['registrar']}`"
-                page = add_field_to_page(page, "Registrar", registrar_value)
-
-                # Determine abuse report status
-                registrar_name = whois_info['registrar']
-                if registrar_name in abuse_friendly_registrars:
-                    abuse_contact_email = whois_info.get('registrar_email', 'N/A')
-                    abuse_status = f"This registrar is known receptive and helpful to abuse reports. You can report abuse to: {abuse_contact_email}"
-                elif registrar_name in undetermined_registrars:
-                    abuse_status = "We don't have enough history with this registrar to determine how helpful they are with abuse reports"
-                elif registrar_name in not_receptive_registrars:
-                    abuse_status = "This registrar is known to refuse, ignore, or otherwise fail to engage with abuse reports"
-                else:
-                    abuse_status = "We don't have enough history with this registrar to determine how helpful they are with abuse reports"
-
-                page = add_field_to_page(page, "Abuse Report Status", f"`{abuse_status}`")
-
-            # Add other fields as before
-            if "administrative_city" in whois_info:
-                administrative_city_value = f"**`{whois_info['administrative_city']}`**"
-                page = add_field_to_page(page, "Admin city", administrative_city_value)
-            if "administrative_country" in whois_info:
-                administrative_country_value = f"**`{whois_info['administrative_country']}`**"
-                page = add_field_to_page(page, "Admin country", administrative_country_value)
-            if "administrative_email" in whois_info:
-                administrative_email_value = f"**`{whois_info['administrative_email']}`**"
-                page = add_field_to_page(page, "Admin email", administrative_email_value)
-            if "administrative_fax" in whois_info:
-                administrative_fax_value = f"**`{whois_info['administrative_fax']}`**"
-                page = add_field_to_page(page, "Admin fax", administrative_fax_value)
-            if "administrative_fax_ext" in whois_info:
-                administrative_fax_ext_value = f"**`{whois_info['administrative_fax_ext']}`**"
-                page = add_field_to_page(page, "Admin fax ext", administrative_fax_ext_value)
-            if "administrative_id" in whois_info:
-                administrative_id_value = f"**`{whois_info['administrative_id']}`**"
-                page = add_field_to_page(page, "Admin ID", administrative_id_value)
-            if "administrative_name" in whois_info:
-                administrative_name_value = f"**`{whois_info['administrative_name']}`**"
-                page = add_field_to_page(page, "Admin name", administrative_name_value)
-            if "administrative_org" in whois_info:
-                administrative_org_value = f"**`{whois_info['administrative_org']}`**"
-                page = add_field_to_page(page, "Admin org", administrative_org_value)
-            if "administrative_phone" in whois_info:
-                administrative_phone_value = f"**`{whois_info['administrative_phone']}`**"
-                page = add_field_to_page(page, "Admin phone", administrative_phone_value)
-            if "administrative_phone_ext" in whois_info:
-                administrative_phone_ext_value = f"**`{whois_info['administrative_phone_ext']}`**"
-                page = add_field_to_page(page, "Admin phone ext", administrative_phone_ext_value)
-            if "administrative_postal_code" in whois_info:
-                administrative_postal_code_value = f"**`{whois_info['administrative_postal_code']}`**"
-                page = add_field_to_page(page, "Administrative Postal Code", administrative_postal_code_value)
-            if "administrative_province" in whois_info:
-                administrative_province_value = f"**`{whois_info['administrative_province']}`**"
-                page = add_field_to_page(page, "Administrative Province", administrative_province_value)
-            if "administrative_street" in whois_info:
-                administrative_street_value = f"**`{whois_info['administrative_street']}`**"
-                page = add_field_to_page(page, "Administrative Street", administrative_street_value)
-            if "billing_city" in whois_info:
-                billing_city_value = f"**`{whois_info['billing_city']}`**"
-                page = add_field_to_page(page, "Billing City", billing_city_value)
-            if "billing_country" in whois_info:
-                billing_country_value = f"**`{whois_info['billing_country']}`**"
-                page = add_field_to_page(page, "Billing Country", billing_country_value)
-            if "billing_email" in whois_info:
-                billing_email_value = f"**`{whois_info['billing_email']}`**"
-                page = add_field_to_page(page, "Billing Email", billing_email_value)
-            if "billing_fax" in whois_info:
-                billing_fax_value = f"**`{whois_info['billing_fax']}`**"
-                page = add_field_to_page(page, "Billing Fax", billing_fax_value)
-            if "billing_fax_ext" in whois_info:
-                billing_fax_ext_value = f"**`{whois_info['billing_fax_ext']}`**"
-                page = add_field_to_page(page, "Billing Fax Ext", billing_fax_ext_value)
-            if "billing_id" in whois_info:
-                billing_id_value = f"**`{whois_info['billing_id']}`**"
-                page = add_field_to_page(page, "Billing ID", billing_id_value)
-            if "billing_name" in whois_info:
-                billing_name_value = f"**`{whois_info['billing_name']}`**"
-                page = add_field_to_page(page, "Billing Name", billing_name_value)
-            if "billing_org" in whois_info:
-                billing_org_value = f"**`{whois_info['billing_org']}`**"
-                page = add_field_to_page(page, "Billing Org", billing_org_value)
-            if "billing_phone" in whois_info:
-                billing_phone_value = f"**`{whois_info['billing_phone']}`**"
-                page = add_field_to_page(page, "Billing Phone", billing_phone_value)
-            if "billing_phone_ext" in whois_info:
-                billing_phone_ext_value = f"**`{whois_info['billing_phone_ext']}`**"
-                page = add_field_to_page(page, "Billing Phone Ext", billing_phone_ext_value)
-            if "billing_postal_code" in whois_info:
-                billing_postal_code_value = f"**`{whois_info['billing_postal_code']}`**"
-                page = add_field_to_page(page, "Billing Postal Code", billing_postal_code_value)
-            if "billing_province" in whois_info:
-                billing_province_value = f"**`{whois_info['billing_province']}`**"
-                page = add_field_to_page(page, "Billing Province", billing_province_value)
-            if "billing_street" in whois_info:
-                billing_street_value = f"**`{whois_info['billing_street']}`**"
-                page = add_field_to_page(page, "Billing Street", billing_street_value)
-            if "created_date" in whois_info:
-                created_date = whois_info["created_date"]
-                if isinstance(created_date, str):
-                    from datetime import datetime
-                    try:
-                        created_date = datetime.strptime(created_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-                    except ValueError:
-                        created_date = datetime.strptime(created_date, "%Y-%m-%dT%H:%M:%S")
-                unix_timestamp = int(created_date.timestamp())
-                discord_timestamp = f"**<t:{unix_timestamp}:F>**"
-                page = add_field_to_page(page, "Created Date", discord_timestamp)
-            if "dnssec" in whois_info:
-                if "dnssec" in whois_info:
-                    dnssec_value = whois_info["dnssec"]
-                    dnssec_value = f"**`{dnssec_value}`**"
-                    page = add_field_to_page(page, "DNSSEC", dnssec_value)
-                if "domain" in whois_info:
-                    domain_value = whois_info["domain"]
-                    domain_value = f"**`{domain_value}`**"
-                    page = add_field_to_page(page, "Domain", domain_value)
-            if "expiration_date" in whois_info:
-                expiration_date = whois_info["expiration_date"]
-                if isinstance(expiration_date, str):
-                    try:
-                        expiration_date = datetime.strptime(expiration_date, "%Y-%m-%dT%H:%M:%S.%fZ")
-                    except ValueError:
-                        expiration_date = datetime.strptime(expiration_date, "%Y-%m-%dT%H:%M:%S")
-                unix_timestamp = int(expiration_date.timestamp())
-                discord_timestamp = f"**<t:{unix_timestamp}:F>**"
-                page = add_field_to_page(page, "Expiration Date", discord_timestamp)
-            if "extension" in whois_info:
-                extension_value = whois_info["extension"]
-                extension_value = f"**`{extension_value}`**"
-                page = add_field_to_page(page, "Extension", extension_value)
-            if "found" in whois_info:
-                found_value = f"**`{whois_info['found']}`**"
-                page = add_field_to_page(page, "Found", found_value)
-            if "id" in whois_info:
-                id_value = f"**`{whois_info['id']}`**"
-                page = add_field_to_page(page, "ID", id_value)
-            if "nameservers" in whois_info:
-                nameservers_list = "\n".join(f"- **`{ns}`**" for ns in whois_info["nameservers"])
-                page = add_field_to_page(page, "Nameservers", nameservers_list)
-            if "punycode" in whois_info:
-                punycode_value = f"**`{whois_info['punycode']}`**"
-                page = add_field_to_page(page, "Punycode", punycode_value)
-            if "registrant" in whois_info and whois_info["registrant"].strip():
-                registrant_value = f"**`{whois_info['registrant']}`**"
-                page = add_field_to_page(page, "Registrant", registrant_value)
+        def add_field_to_page(page, name, value):
+            nonlocal field_count, pages
+            page.add_field(name=name, value=value, inline=False)
+            field_count += 1
+            if field_count == 10:
+                pages.append(page)
+                page = discord.Embed(title=f"WHOIS Information for {domain}", color=discord.Color.from_str("#2BBD8E"))
+                field_count = 0
+            return page
+
+        if "registrar" in whois_info:
+            registrar_value = f"`{whois_info['registrar']}`"
+            page = add_field_to_page(page, "Registrar", registrar_value)
+
+            # Determine abuse report status
+            registrar_name = whois_info['registrar']
+            if registrar_name in abuse_friendly_registrars:
+                abuse_contact_email = whois_info.get('registrar_email', 'N/A')
+                abuse_status = f"This registrar is known receptive and helpful to abuse reports. You can report abuse to: {abuse_contact_email}"
+            elif registrar_name in undetermined_registrars:
+                abuse_status = "We don't have enough history with this registrar to determine how helpful they are with abuse reports"
+            elif registrar_name in not_receptive_registrars:
+                abuse_status = "This registrar is known to refuse, ignore, or otherwise fail to engage with abuse reports"
             else:
-                registrant_value = "**`REDACTED`**"
-                page = add_field_to_page(page, "Registrant", registrant_value)
-            if "registrant_city" in whois_info:
-                registrant_city = f"**`{whois_info['registrant_city']}`**"
-                page = add_field_to_page(page, "Registrant City", registrant_city)
-            if "registrant_country" in whois_info:
-                registrant_country = f"**`{whois_info['registrant_country']}`**"
-                page = add_field_to_page(page, "Registrant Country", registrant_country)
-            if "registrant_email" in whois_info:
-                registrant_email = f"**`{whois_info['registrant_email']}`**"
-                page = add_field_to_page(page, "Registrant Email", registrant_email)
-            if "registrant_fax" in whois_info:
-                registrant_fax = f"**`{whois_info['registrant_fax']}`**"
-                page = add_field_to_page(page, "Registrant Fax", registrant_fax)
-            if "registrant_fax_ext" in whois_info:
-                registrant_fax_ext = f"**`{whois_info['registrant_fax_ext']}`**"
-                page = add_field_to_page(page, "Registrant Fax Ext", registrant_fax_ext)
-            if "registrant_id" in whois_info:
-                registrant_id = f"**`{whois_info['registrant_id']}`**"
-                page = add_field_to_page(page, "Registrant ID", registrant_id)
-            if "registrant_name" in whois_info:
-                registrant_name = f"**`{whois_info['registrant_name']}`**"
-                page = add_field_to_page(page, "Registrant Name", registrant_name)
-            if "registrant_org" in whois_info:
-                registrant_org = f"**`{whois_info['registrant_org']}`**"
-                page = add_field_to_page(page, "Registrant Org", registrant_org)
-            if "registrant_phone" in whois_info:
-                registrant_phone = f"**`{whois_info['registrant_phone']}`**"
-                page = add_field_to_page(page, "Registrant Phone", registrant_phone)
-            if "registrant_phone_ext" in whois_info:
-                registrant_phone_ext = f"**`{whois_info['registrant_phone_ext']}`**"
-                page = add_field_to_page(page, "Registrant Phone Ext", registrant_phone_ext)
-            if "registrant_postal_code" in whois_info:
-                registrant_postal_code = f"**`{whois_info['registrant_postal_code']}`**"
-                page = add_field_to_page(page, "Registrant Postal Code", registrant_postal_code)
-            if "registrant_province" in whois_info:
-                registrant_province = f"**`{whois_info['registrant_province']}`**"
-                page = add_field_to_page(page, "Registrant Province", registrant_province)
-            if "registrant_street" in whois_info:
-                registrant_street = f"**`{whois_info['registrant_street']}`**"
-                page = add_field_to_page(page, "Registrant Street", registrant_street)
-            if "registrar_city" in whois_info:
-                registrar_city = f"**`{whois_info['registrar_city']}`**"
-                page = add_field_to_page(page, "Registrar City", registrar_city)
-            if "registrar_country" in whois_info:
-                registrar_country = f"**`{whois_info['registrar_country']}`**"
-                page = add_field_to_page(page, "Registrar Country", registrar_country)
-            if "registrar_email" in whois_info:
-                registrar_email = f"**`{whois_info['registrar_email']}`**"
-                page = add_field_to_page(page, "Registrar Email", registrar_email)
-            if "registrar_fax" in whois_info:
-                registrar_fax = f"**`{whois_info['registrar_fax']}`**"
-                page = add_field_to_page(page, "Registrar Fax", registrar_fax)
-            if "registrar_fax_ext" in whois_info:
-                registrar_fax_ext = f"**`{whois_info['registrar_fax_ext']}`**"
-                page = add_field_to_page(page, "Registrar Fax Ext", registrar_fax_ext)
-            if "registrar_id" in whois_info:
-                registrar_id = f"**`{whois_info['registrar_id']}`**"
-                page = add_field_to_page(page, "Registrar ID", registrar_id)
-            if "registrar_name" in whois_info:
-                registrar_name = f"**`{whois_info['registrar_name']}`**"
-                page = add_field_to_page(page, "Registrar Name", registrar_name)
-            if "registrar_org" in whois_info:
-                registrar_org = f"**`{whois_info['registrar_org']}`**"
-                page = add_field_to_page(page, "Registrar Org", registrar_org)
-            if "registrar_phone" in whois_info:
-                registrar_phone = f"**`{whois_info['registrar_phone']}`**"
-                page = add_field_to_page(page, "Registrar Phone", registrar_phone)
-            if "registrar_phone_ext" in whois_info:
-                registrar_phone_ext = f"**`{whois_info['registrar_phone_ext']}`**"
-                page = add_field_to_page(page, "Registrar Phone Ext", registrar_phone_ext)
-            if "registrar_postal_code" in whois_info:
-                registrar_postal_code = f"**`{whois_info['registrar_postal_code']}`**"
-                page = add_field_to_page(page, "Registrar Postal Code", registrar_postal_code)
-            if "registrar_province" in whois_info:
-                registrar_province = f"**`{whois_info['registrar_province']}`**"
-                page = add_field_to_page(page, "Registrar Province", registrar_province)
-            if "registrar_street" in whois_info:
-                registrar_street = f"**`{whois_info['registrar_street']}`**"
-                page = add_field_to_page(page, "Registrar Street", registrar_street)
-            if "status" in whois_info:
-                status_value = f"**`{', '.join(whois_info['status'])}`**"
-                page = add_field_to_page(page, "Status", status_value)
-            if "technical_city" in whois_info:
-                technical_city = f"**`{whois_info['technical_city']}`**"
-                page = add_field_to_page(page, "Technical City", technical_city)
-            if "technical_country" in whois_info:
-                technical_country = f"**`{whois_info['technical_country']}`**"
-                page = add_field_to_page(page, "Technical Country", technical_country)
-            if "technical_email" in whois_info:
-                technical_email = f"**`{whois_info['technical_email']}`**"
-                page = add_field_to_page(page, "Technical Email", technical_email)
-            if "technical_fax" in whois_info:
-                technical_fax = f"**`{whois_info['technical_fax']}`**"
-                page = add_field_to_page(page, "Technical Fax", technical_fax)
-            if "technical_fax_ext" in whois_info:
-                technical_fax_ext = f"**`{whois_info['technical_fax_ext']}`**"
-                page = add_field_to_page(page, "Technical Fax Ext", technical_fax_ext)
-            if "technical_id" in whois_info:
-                technical_id = f"**`{whois_info['technical_id']}`**"
-                page = add_field_to_page(page, "Technical ID", technical_id)
-            if "technical_name" in whois_info:
-                technical_name = f"**`{whois_info['technical_name']}`**"
-                page = add_field_to_page(page, "Technical Name", technical_name)
-            if "technical_org" in whois_info:
-                technical_org = f"**`{whois_info['technical_org']}`**"
-                page = add_field_to_page(page, "Technical Org", technical_org)
-            if "technical_phone" in whois_info:
-                technical_phone = f"**`{whois_info['technical_phone']}`**"
-                page = add_field_to_page(page, "Technical Phone", technical_phone)
-            if "technical_phone_ext" in whois_info:
-                technical_phone_ext = f"**`{whois_info['technical_phone_ext']}`**"
-                page = add_field_to_page(page, "Technical Phone Ext", technical_phone_ext)
-            if "technical_postal_code" in whois_info:
-                technical_postal_code = f"**`{whois_info['technical_postal_code']}`**"
-                page = add_field_to_page(page, "Technical Postal Code", technical_postal_code)
-            if "technical_province" in whois_info:
-                technical_province = f"**`{whois_info['technical_province']}`**"
-                page = add_field_to_page(page, "Technical Province", technical_province)
-            if "technical_street" in whois_info:
-                technical_street = f"**`{whois_info['technical_street']}`**"
-                page = add_field_to_page(page, "Technical Street", technical_street)
-            if "updated_date" in whois_info:
+                abuse_status = "We don't have enough history with this registrar to determine how helpful they are with abuse reports"
+
+            page = add_field_to_page(page, "Abuse Report Status", f"`{abuse_status}`")
+
+        # Add other fields as before
+        if "administrative_city" in whois_info:
+            administrative_city_value = f"**`{whois_info['administrative_city']}`**"
+            page = add_field_to_page(page, "Admin city", administrative_city_value)
+        if "administrative_country" in whois_info:
+            administrative_country_value = f"**`{whois_info['administrative_country']}`**"
+            page = add_field_to_page(page, "Admin country", administrative_country_value)
+        if "administrative_email" in whois_info:
+            administrative_email_value = f"**`{whois_info['administrative_email']}`**"
+            page = add_field_to_page(page, "Admin email", administrative_email_value)
+        if "administrative_fax" in whois_info:
+            administrative_fax_value = f"**`{whois_info['administrative_fax']}`**"
+            page = add_field_to_page(page, "Admin fax", administrative_fax_value)
+        if "administrative_fax_ext" in whois_info:
+            administrative_fax_ext_value = f"**`{whois_info['administrative_fax_ext']}`**"
+            page = add_field_to_page(page, "Admin fax ext", administrative_fax_ext_value)
+        if "administrative_id" in whois_info:
+            administrative_id_value = f"**`{whois_info['administrative_id']}`**"
+            page = add_field_to_page(page, "Admin ID", administrative_id_value)
+        if "administrative_name" in whois_info:
+            administrative_name_value = f"**`{whois_info['administrative_name']}`**"
+            page = add_field_to_page(page, "Admin name", administrative_name_value)
+        if "administrative_org" in whois_info:
+            administrative_org_value = f"**`{whois_info['administrative_org']}`**"
+            page = add_field_to_page(page, "Admin org", administrative_org_value)
+        if "administrative_phone" in whois_info:
+            administrative_phone_value = f"**`{whois_info['administrative_phone']}`**"
+            page = add_field_to_page(page, "Admin phone", administrative_phone_value)
+        if "administrative_phone_ext" in whois_info:
+            administrative_phone_ext_value = f"**`{whois_info['administrative_phone_ext']}`**"
+            page = add_field_to_page(page, "Admin phone ext", administrative_phone_ext_value)
+        if "administrative_postal_code" in whois_info:
+            administrative_postal_code_value = f"**`{whois_info['administrative_postal_code']}`**"
+            page = add_field_to_page(page, "Administrative Postal Code", administrative_postal_code_value)
+        if "administrative_province" in whois_info:
+            administrative_province_value = f"**`{whois_info['administrative_province']}`**"
+            page = add_field_to_page(page, "Administrative Province", administrative_province_value)
+        if "administrative_street" in whois_info:
+            administrative_street_value = f"**`{whois_info['administrative_street']}`**"
+            page = add_field_to_page(page, "Administrative Street", administrative_street_value)
+        if "billing_city" in whois_info:
+            billing_city_value = f"**`{whois_info['billing_city']}`**"
+            page = add_field_to_page(page, "Billing City", billing_city_value)
+        if "billing_country" in whois_info:
+            billing_country_value = f"**`{whois_info['billing_country']}`**"
+            page = add_field_to_page(page, "Billing Country", billing_country_value)
+        if "billing_email" in whois_info:
+            billing_email_value = f"**`{whois_info['billing_email']}`**"
+            page = add_field_to_page(page, "Billing Email", billing_email_value)
+        if "billing_fax" in whois_info:
+            billing_fax_value = f"**`{whois_info['billing_fax']}`**"
+            page = add_field_to_page(page, "Billing Fax", billing_fax_value)
+        if "billing_fax_ext" in whois_info:
+            billing_fax_ext_value = f"**`{whois_info['billing_fax_ext']}`**"
+            page = add_field_to_page(page, "Billing Fax Ext", billing_fax_ext_value)
+        if "billing_id" in whois_info:
+            billing_id_value = f"**`{whois_info['billing_id']}`**"
+            page = add_field_to_page(page, "Billing ID", billing_id_value)
+        if "billing_name" in whois_info:
+            billing_name_value = f"**`{whois_info['billing_name']}`**"
+            page = add_field_to_page(page, "Billing Name", billing_name_value)
+        if "billing_org" in whois_info:
+            billing_org_value = f"**`{whois_info['billing_org']}`**"
+            page = add_field_to_page(page, "Billing Org", billing_org_value)
+        if "billing_phone" in whois_info:
+            billing_phone_value = f"**`{whois_info['billing_phone']}`**"
+            page = add_field_to_page(page, "Billing Phone", billing_phone_value)
+        if "billing_phone_ext" in whois_info:
+            billing_phone_ext_value = f"**`{whois_info['billing_phone_ext']}`**"
+            page = add_field_to_page(page, "Billing Phone Ext", billing_phone_ext_value)
+        if "billing_postal_code" in whois_info:
+            billing_postal_code_value = f"**`{whois_info['billing_postal_code']}`**"
+            page = add_field_to_page(page, "Billing Postal Code", billing_postal_code_value)
+        if "billing_province" in whois_info:
+            billing_province_value = f"**`{whois_info['billing_province']}`**"
+            page = add_field_to_page(page, "Billing Province", billing_province_value)
+        if "billing_street" in whois_info:
+            billing_street_value = f"**`{whois_info['billing_street']}`**"
+            page = add_field_to_page(page, "Billing Street", billing_street_value)
+        if "created_date" in whois_info:
+            created_date = whois_info["created_date"]
+            if isinstance(created_date, str):
+                from datetime import datetime
                 try:
-                    updated_date = int(datetime.strptime(whois_info["updated_date"], "%Y-%m-%dT%H:%M:%S").timestamp())
-                    page = add_field_to_page(page, "Updated Date", f"**<t:{updated_date}:F>**")
+                    created_date = datetime.strptime(created_date, "%Y-%m-%dT%H:%M:%S.%fZ")
                 except ValueError:
-                    pass  # Handle the case where the date format is incorrect
-                except AttributeError:
-                    pass  # Handle the case where the date is not a string
-            if "whois_server" in whois_info:
-                whois_server = f"**`{whois_info['whois_server']}`**"
-                page = add_field_to_page(page, "WHOIS Server", whois_server)
-
-            if page.fields:
-                pages.append(page)
-
-            # Create a view with a button
-            view = discord.ui.View()
-            if "administrative_referral_url" in whois_info:
-                button = discord.ui.Button(label="Admin", url=whois_info["administrative_referral_url"])
-                view.add_item(button)
-            if "billing_referral_url" in whois_info:
-                button = discord.ui.Button(label="Billing", url=whois_info["billing_referral_url"])
-                view.add_item(button)
-            if "registrant_referral_url" in whois_info:
-                button = discord.ui.Button(label="Registrant", url=whois_info["registrant_referral_url"])
-                view.add_item(button)
-            if "registrar_referral_url" in whois_info:
-                button = discord.ui.Button(label="Visit registrar", url=whois_info["registrar_referral_url"])
-                view.add_item(button)
-            if "technical_referral_url" in whois_info:
-                button = discord.ui.Button(label="Technical", url=whois_info["technical_referral_url"])
-                view.add_item(button)
-
-            for page in pages:
-                page.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
-            message = await ctx.send(embed=pages[0], view=view)
-
-            current_page = 0
-            if len(pages) > 1:
-                await message.add_reaction("◀️")
-                await message.add_reaction("❌")
-                await message.add_reaction("▶️")
-
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
-
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
-
-                        if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
-                            current_page += 1
-                            await message.edit(embed=pages[current_page])
-                            await message.remove_reaction(reaction, user)
+                    created_date = datetime.strptime(created_date, "%Y-%m-%dT%H:%M:%S")
+            unix_timestamp = int(created_date.timestamp())
+            discord_timestamp = f"**<t:{unix_timestamp}:F>**"
+            page = add_field_to_page(page, "Created Date", discord_timestamp)
+        if "dnssec" in whois_info:
+            if "dnssec" in whois_info:
+                dnssec_value = whois_info["dnssec"]
+                dnssec_value = f"**`{dnssec_value}`**"
+                page = add_field_to_page(page, "DNSSEC", dnssec_value)
+            if "domain" in whois_info:
+                domain_value = whois_info["domain"]
+                domain_value = f"**`{domain_value}`**"
+                page = add_field_to_page(page, "Domain", domain_value)
+        if "expiration_date" in whois_info:
+            expiration_date = whois_info["expiration_date"]
+            if isinstance(expiration_date, str):
+                try:
+                    expiration_date = datetime.strptime(expiration_date, "%Y-%m-%dT%H:%M:%S.%fZ")
+                except ValueError:
+                    expiration_date = datetime.strptime(expiration_date, "%Y-%m-%dT%H:%M:%S")
+            unix_timestamp = int(expiration_date.timestamp())
+            discord_timestamp = f"**<t:{unix_timestamp}:F>**"
+            page = add_field_to_page(page, "Expiration Date", discord_timestamp)
+        if "extension" in whois_info:
+            extension_value = whois_info["extension"]
+            extension_value = f"**`{extension_value}`**"
+            page = add_field_to_page(page, "Extension", extension_value)
+        if "found" in whois_info:
+            found_value = f"**`{whois_info['found']}`**"
+            page = add_field_to_page(page, "Found", found_value)
+        if "id" in whois_info:
+            id_value = f"**`{whois_info['id']}`**"
+            page = add_field_to_page(page, "ID", id_value)
+        if "nameservers" in whois_info:
+            nameservers_list = "\n".join(f"- **`{ns}`**" for ns in whois_info["nameservers"])
+            page = add_field_to_page(page, "Nameservers", nameservers_list)
+        if "punycode" in whois_info:
+            punycode_value = f"**`{whois_info['punycode']}`**"
+            page = add_field_to_page(page, "Punycode", punycode_value)
+        if "registrant" in whois_info and whois_info["registrant"].strip():
+            registrant_value = f"**`{whois_info['registrant']}`**"
+            page = add_field_to_page(page, "Registrant", registrant_value)
+        else:
+            registrant_value = "**`REDACTED`**"
+            page = add_field_to_page(page, "Registrant", registrant_value)
+        if "registrant_city" in whois_info:
+            registrant_city = f"**`{whois_info['registrant_city']}`**"
+            page = add_field_to_page(page, "Registrant City", registrant_city)
+        if "registrant_country" in whois_info:
+            registrant_country = f"**`{whois_info['registrant_country']}`**"
+            page = add_field_to_page(page, "Registrant Country", registrant_country)
+        if "registrant_email" in whois_info:
+            registrant_email = f"**`{whois_info['registrant_email']}`**"
+            page = add_field_to_page(page, "Registrant Email", registrant_email)
+        if "registrant_fax" in whois_info:
+            registrant_fax = f"**`{whois_info['registrant_fax']}`**"
+            page = add_field_to_page(page, "Registrant Fax", registrant_fax)
+        if "registrant_fax_ext" in whois_info:
+            registrant_fax_ext = f"**`{whois_info['registrant_fax_ext']}`**"
+            page = add_field_to_page(page, "Registrant Fax Ext", registrant_fax_ext)
+        if "registrant_id" in whois_info:
+            registrant_id = f"**`{whois_info['registrant_id']}`**"
+            page = add_field_to_page(page, "Registrant ID", registrant_id)
+        if "registrant_name" in whois_info:
+            registrant_name = f"**`{whois_info['registrant_name']}`**"
+            page = add_field_to_page(page, "Registrant Name", registrant_name)
+        if "registrant_org" in whois_info:
+            registrant_org = f"**`{whois_info['registrant_org']}`**"
+            page = add_field_to_page(page, "Registrant Org", registrant_org)
+        if "registrant_phone" in whois_info:
+            registrant_phone = f"**`{whois_info['registrant_phone']}`**"
+            page = add_field_to_page(page, "Registrant Phone", registrant_phone)
+        if "registrant_phone_ext" in whois_info:
+            registrant_phone_ext = f"**`{whois_info['registrant_phone_ext']}`**"
+            page = add_field_to_page(page, "Registrant Phone Ext", registrant_phone_ext)
+        if "registrant_postal_code" in whois_info:
+            registrant_postal_code = f"**`{whois_info['registrant_postal_code']}`**"
+            page = add_field_to_page(page, "Registrant Postal Code", registrant_postal_code)
+        if "registrant_province" in whois_info:
+            registrant_province = f"**`{whois_info['registrant_province']}`**"
+            page = add_field_to_page(page, "Registrant Province", registrant_province)
+        if "registrant_street" in whois_info:
+            registrant_street = f"**`{whois_info['registrant_street']}`**"
+            page = add_field_to_page(page, "Registrant Street", registrant_street)
+        if "registrar_city" in whois_info:
+            registrar_city = f"**`{whois_info['registrar_city']}`**"
+            page = add_field_to_page(page, "Registrar City", registrar_city)
+        if "registrar_country" in whois_info:
+            registrar_country = f"**`{whois_info['registrar_country']}`**"
+            page = add_field_to_page(page, "Registrar Country", registrar_country)
+        if "registrar_email" in whois_info:
+            registrar_email = f"**`{whois_info['registrar_email']}`**"
+            page = add_field_to_page(page, "Registrar Email", registrar_email)
+        if "registrar_fax" in whois_info:
+            registrar_fax = f"**`{whois_info['registrar_fax']}`**"
+            page = add_field_to_page(page, "Registrar Fax", registrar_fax)
+        if "registrar_fax_ext" in whois_info:
+            registrar_fax_ext = f"**`{whois_info['registrar_fax_ext']}`**"
+            page = add_field_to_page(page, "Registrar Fax Ext", registrar_fax_ext)
+        if "registrar_id" in whois_info:
+            registrar_id = f"**`{whois_info['registrar_id']}`**"
+            page = add_field_to_page(page, "Registrar ID", registrar_id)
+        if "registrar_name" in whois_info:
+            registrar_name = f"**`{whois_info['registrar_name']}`**"
+            page = add_field_to_page(page, "Registrar Name", registrar_name)
+        if "registrar_org" in whois_info:
+            registrar_org = f"**`{whois_info['registrar_org']}`**"
+            page = add_field_to_page(page, "Registrar Org", registrar_org)
+        if "registrar_phone" in whois_info:
+            registrar_phone = f"**`{whois_info['registrar_phone']}`**"
+            page = add_field_to_page(page, "Registrar Phone", registrar_phone)
+        if "registrar_phone_ext" in whois_info:
+            registrar_phone_ext = f"**`{whois_info['registrar_phone_ext']}`**"
+            page = add_field_to_page(page, "Registrar Phone Ext", registrar_phone_ext)
+        if "registrar_postal_code" in whois_info:
+            registrar_postal_code = f"**`{whois_info['registrar_postal_code']}`**"
+            page = add_field_to_page(page, "Registrar Postal Code", registrar_postal_code)
+        if "registrar_province" in whois_info:
+            registrar_province = f"**`{whois_info['registrar_province']}`**"
+            page = add_field_to_page(page, "Registrar Province", registrar_province)
+        if "registrar_street" in whois_info:
+            registrar_street = f"**`{whois_info['registrar_street']}`**"
+            page = add_field_to_page(page, "Registrar Street", registrar_street)
+        if "status" in whois_info:
+            status_value = f"**`{', '.join(whois_info['status'])}`**"
+            page = add_field_to_page(page, "Status", status_value)
+        if "technical_city" in whois_info:
+            technical_city = f"**`{whois_info['technical_city']}`**"
+            page = add_field_to_page(page, "Technical City", technical_city)
+        if "technical_country" in whois_info:
+            technical_country = f"**`{whois_info['technical_country']}`**"
+            page = add_field_to_page(page, "Technical Country", technical_country)
+        if "technical_email" in whois_info:
+            technical_email = f"**`{whois_info['technical_email']}`**"
+            page = add_field_to_page(page, "Technical Email", technical_email)
+        if "technical_fax" in whois_info:
+            technical_fax = f"**`{whois_info['technical_fax']}`**"
+            page = add_field_to_page(page, "Technical Fax", technical_fax)
+        if "technical_fax_ext" in whois_info:
+            technical_fax_ext = f"**`{whois_info['technical_fax_ext']}`**"
+            page = add_field_to_page(page, "Technical Fax Ext", technical_fax_ext)
+        if "technical_id" in whois_info:
+            technical_id = f"**`{whois_info['technical_id']}`**"
+            page = add_field_to_page(page, "Technical ID", technical_id)
+        if "technical_name" in whois_info:
+            technical_name = f"**`{whois_info['technical_name']}`**"
+            page = add_field_to_page(page, "Technical Name", technical_name)
+        if "technical_org" in whois_info:
+            technical_org = f"**`{whois_info['technical_org']}`**"
+            page = add_field_to_page(page, "Technical Org", technical_org)
+        if "technical_phone" in whois_info:
+            technical_phone = f"**`{whois_info['technical_phone']}`**"
+            page = add_field_to_page(page, "Technical Phone", technical_phone)
+        if "technical_phone_ext" in whois_info:
+            technical_phone_ext = f"**`{whois_info['technical_phone_ext']}`**"
+            page = add_field_to_page(page, "Technical Phone Ext", technical_phone_ext)
+        if "technical_postal_code" in whois_info:
+            technical_postal_code = f"**`{whois_info['technical_postal_code']}`**"
+            page = add_field_to_page(page, "Technical Postal Code", technical_postal_code)
+        if "technical_province" in whois_info:
+            technical_province = f"**`{whois_info['technical_province']}`**"
+            page = add_field_to_page(page, "Technical Province", technical_province)
+        if "technical_street" in whois_info:
+            technical_street = f"**`{whois_info['technical_street']}`**"
+            page = add_field_to_page(page, "Technical Street", technical_street)
+        if "updated_date" in whois_info:
+            try:
+                updated_date = int(datetime.strptime(whois_info["updated_date"], "%Y-%m-%dT%H:%M:%S").timestamp())
+                page = add_field_to_page(page, "Updated Date", f"**<t:{updated_date}:F>**")
+            except ValueError:
+                pass  # Handle the case where the date format is incorrect
+            except AttributeError:
+                pass  # Handle the case where the date is not a string
+        if "whois_server" in whois_info:
+            whois_server = f"**`{whois_info['whois_server']}`**"
+            page = add_field_to_page(page, "WHOIS Server", whois_server)
+
+        if page.fields:
+            pages.append(page)
+
+        # Create a view with a button
+        view = discord.ui.View()
+        if "administrative_referral_url" in whois_info:
+            button = discord.ui.Button(label="Admin", url=whois_info["administrative_referral_url"])
+            view.add_item(button)
+        if "billing_referral_url" in whois_info:
+            button = discord.ui.Button(label="Billing", url=whois_info["billing_referral_url"])
+            view.add_item(button)
+        if "registrant_referral_url" in whois_info:
+            button = discord.ui.Button(label="Registrant", url=whois_info["registrant_referral_url"])
+            view.add_item(button)
+        if "registrar_referral_url" in whois_info:
+            button = discord.ui.Button(label="Visit registrar", url=whois_info["registrar_referral_url"])
+            view.add_item(button)
+        if "technical_referral_url" in whois_info:
+            button = discord.ui.Button(label="Technical", url=whois_info["technical_referral_url"])
+            view.add_item(button)
+
+        for page in pages:
+            page.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
+        message = await ctx.send(embed=pages[0], view=view)
+
+        current_page = 0
+        if len(pages) > 1:
+            await message.add_reaction("◀️")
+            await message.add_reaction("❌")
+            await message.add_reaction("▶️")
+
+            def check(reaction, user):
+                return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
+
+            while True:
+                try:
+                    reaction, user = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
 
-                        elif str(reaction.emoji) == "◀️" and current_page > 0:
-                            current_page -= 1
-                            await message.edit(embed=pages[current_page])
-                            await message.remove_reaction(reaction, user)
+                    if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
+                        current_page += 1
+                        await message.edit(embed=pages[current_page])
+                        await message.remove_reaction(reaction, user)
 
-                        elif str(reaction.emoji) == "❌":
-                            await message.delete()
-                            break
+                    elif str(reaction.emoji) == "◀️" and current_page > 0:
+                        current_page -= 1
+                        await message.edit(embed=pages[current_page])
+                        await message.remove_reaction(reaction, user)
 
-                    except asyncio.TimeoutError:
-                        await message.clear_reactions()
+                    elif str(reaction.emoji) == "❌":
+                        await message.delete()
                         break
 
+                except asyncio.TimeoutError:
+                    await message.clear_reactions()
+                    break
+
     @intel.command(name="domain")
     async def querydomain(self, ctx, domain: str):
         """Query Cloudflare API for domain intelligence and check blocklist status."""
@@ -1545,7 +1432,7 @@ class Cloudflare(commands.Cog):
 
         # Fetch the blocklist from the web
         blocklist_url = "https://www.beehive.systems/hubfs/blocklist/blocklist.json"
-        async with self.session.get(blocklist_url) as blocklist_response:
+        async with self.api.session.get(blocklist_url) as blocklist_response:
             if blocklist_response.status == 200:
                 blocklist = await blocklist_response.json()
             else:
@@ -1555,81 +1442,61 @@ class Cloudflare(commands.Cog):
         
         is_blocked = domain in blocklist
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
-        email = api_tokens.get("email")
-        api_key = api_tokens.get("api_key")
-        bearer_token = api_tokens.get("bearer_token")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/domain"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
         params = {
             "domain": domain
         }
 
-        async with self.session.get(url, headers=headers, params=params) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"]:
-                    result = data["result"]
-                    embed = discord.Embed(title=f"Domain intelligence for {result.get('domain', 'N/A')}", color=0x2BBD8E)
-                    
-                    if "domain" in result:
-                        embed.add_field(name="Domain", value=f"`{result['domain']}`", inline=False)
-                    if "risk_score" in result:
-                        embed.add_field(name="Risk Score", value=f"`{result['risk_score']}`", inline=False)
-                    if "popularity_rank" in result:
-                        embed.add_field(name="Popularity Rank", value=f"`{result['popularity_rank']}`", inline=False)
-                    if "application" in result and "name" in result["application"]:
-                        embed.add_field(name="Application", value=f"`{result['application']['name']}`", inline=False)
-                    if "additional_information" in result and "suspected_malware_family" in result["additional_information"]:
-                        embed.add_field(name="Suspected Malware Family", value=f"`{result['additional_information']['suspected_malware_family']}`", inline=False)
-                    if "content_categories" in result:
-                        embed.add_field(name="Content Categories", value=", ".join([f"`{cat['name']}`" for cat in result["content_categories"]]), inline=False)
-                    if "resolves_to_refs" in result:
-                        embed.add_field(name="Resolves To", value=", ".join([f"`{ref['value']}`" for ref in result["resolves_to_refs"]]), inline=False)
-                    if "inherited_content_categories" in result:
-                        embed.add_field(name="Inherited Content Categories", value=", ".join([f"`{cat['name']}`" for cat in result["inherited_content_categories"]]), inline=False)
-                    if "inherited_from" in result:
-                        embed.add_field(name="Inherited From", value=f"`{result['inherited_from']}`", inline=False)
-                    if "inherited_risk_types" in result:
-                        embed.add_field(name="Inherited Risk Types", value=", ".join([f"`{risk['name']}`" for risk in result["inherited_risk_types"]]), inline=False)
-                    if "risk_types" in result:
-                        embed.add_field(name="Risk Types", value=", ".join([f"`{risk['name']}`" for risk in result["risk_types"]]), inline=False)
-
-                    # Add blocklist status
-                    blocklist_status = ":white_check_mark: Yes" if is_blocked else ":x: No"
-                    embed.add_field(name="On BeeHive Blocklist", value=f"**{blocklist_status}**", inline=False)
-
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
-                    await ctx.send(embed=embed)
-                else:
-                    error_embed = discord.Embed(title="Error", description=f"Error: {data['errors']}", color=0xff4545)
-                    await ctx.send(embed=error_embed)
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/domain", params=params)
+        except CloudflareAPIError as e:
+            if e.status == 400:
+                embed = discord.Embed(title="Bad Request", description="The server could not understand the request due to invalid syntax.", color=0xff4545)
             else:
-                error_embed = discord.Embed(title="Failed to query Cloudflare API", description=f"Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=error_embed)
+                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"{e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        result = data["result"]
+        embed = discord.Embed(title=f"Domain intelligence for {result.get('domain', 'N/A')}", color=0x2BBD8E)
+
+        if "domain" in result:
+            embed.add_field(name="Domain", value=f"`{result['domain']}`", inline=False)
+        if "risk_score" in result:
+            embed.add_field(name="Risk Score", value=f"`{result['risk_score']}`", inline=False)
+        if "popularity_rank" in result:
+            embed.add_field(name="Popularity Rank", value=f"`{result['popularity_rank']}`", inline=False)
+        if "application" in result and "name" in result["application"]:
+            embed.add_field(name="Application", value=f"`{result['application']['name']}`", inline=False)
+        if "additional_information" in result and "suspected_malware_family" in result["additional_information"]:
+            embed.add_field(name="Suspected Malware Family", value=f"`{result['additional_information']['suspected_malware_family']}`", inline=False)
+        if "content_categories" in result:
+            embed.add_field(name="Content Categories", value=", ".join([f"`{cat['name']}`" for cat in result["content_categories"]]), inline=False)
+        if "resolves_to_refs" in result:
+            embed.add_field(name="Resolves To", value=", ".join([f"`{ref['value']}`" for ref in result["resolves_to_refs"]]), inline=False)
+        if "inherited_content_categories" in result:
+            embed.add_field(name="Inherited Content Categories", value=", ".join([f"`{cat['name']}`" for cat in result["inherited_content_categories"]]), inline=False)
+        if "inherited_from" in result:
+            embed.add_field(name="Inherited From", value=f"`{result['inherited_from']}`", inline=False)
+        if "inherited_risk_types" in result:
+            embed.add_field(name="Inherited Risk Types", value=", ".join([f"`{risk['name']}`" for risk in result["inherited_risk_types"]]), inline=False)
+        if "risk_types" in result:
+            embed.add_field(name="Risk Types", value=", ".join([f"`{risk['name']}`" for risk in result["risk_types"]]), inline=False)
+
+        # Add blocklist status
+        blocklist_status = ":white_check_mark: Yes" if is_blocked else ":x: No"
+        embed.add_field(name="On BeeHive Blocklist", value=f"**{blocklist_status}**", inline=False)
+
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
+        await ctx.send(embed=embed)
 
     @intel.command(name="ip")
     async def queryip(self, ctx, ip: str):
         """Query intelligence on a public IP address."""
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
-        email = api_tokens.get("email")
-        api_key = api_tokens.get("api_key")
-        bearer_token = api_tokens.get("bearer_token")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/ip"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
         params = {}
         try:
             ip_obj = ipaddress.ip_address(ip)
@@ -1646,46 +1513,43 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        async with self.session.get(url, headers=headers, params=params) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"]:
-                    result = data["result"][0]
-                    embed = discord.Embed(title=f"IP intelligence for {result['ip']}", color=0x2BBD8E)
-                    
-                    if "ip" in result:
-                        embed.add_field(name="IP", value=f"**`{result['ip']}`**", inline=False)
-                    if "belongs_to_ref" in result:
-                        belongs_to = result["belongs_to_ref"]
-                        if "description" in belongs_to:
-                            embed.add_field(name="Belongs To", value=f"**`{belongs_to['description']}`**", inline=False)
-                        if "country" in belongs_to:
-                            embed.add_field(name="Country", value=f"**`{belongs_to['country']}`**", inline=False)
-                        if "type" in belongs_to:
-                            embed.add_field(name="Type", value=f"**`{belongs_to['type'].upper()}`**", inline=True)
-                    if "ptr_lookup" in result and result["ptr_lookup"] and "ptr_domains" in result["ptr_lookup"] and result["ptr_lookup"]["ptr_domains"]:
-                        ptr_domains = ", ".join([f"**`{domain}`**" for domain in result["ptr_lookup"]["ptr_domains"]])
-                        embed.add_field(name="PTR Domains", value=ptr_domains, inline=False)
-                    if "risk_types" in result:
-                        risk_types = ", ".join([f"**`{risk['name']}`**" for risk in result["risk_types"]])
-                        embed.add_field(name="Risk Types", value=risk_types, inline=False)
-                    if "result_info" in data:
-                        result_info = data["result_info"]
-                        embed.add_field(name="Total Count", value=f"**`{result_info['total_count']}`**", inline=False)
-                        embed.add_field(name="Page", value=f"**`{result_info['page']}`**", inline=False)
-                        embed.add_field(name="Per Page", value=f"**`{result_info['per_page']}`**", inline=False)
-                        
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
-                    await ctx.send(embed=embed)
-                else:
-                    embed = discord.Embed(title="Error", description=f"Error: {data['errors']}", color=0xff4545)
-                    await ctx.send(embed=embed)
-            elif response.status == 400:
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/ip", params=params)
+        except CloudflareAPIError as e:
+            if e.status == 400:
                 embed = discord.Embed(title="Bad Request", description="The server could not understand the request due to invalid syntax.", color=0xff4545)
-                await ctx.send(embed=embed)
             else:
-                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
+                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"{e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        result = data["result"][0]
+        embed = discord.Embed(title=f"IP intelligence for {result['ip']}", color=0x2BBD8E)
+
+        if "ip" in result:
+            embed.add_field(name="IP", value=f"**`{result['ip']}`**", inline=False)
+        if "belongs_to_ref" in result:
+            belongs_to = result["belongs_to_ref"]
+            if "description" in belongs_to:
+                embed.add_field(name="Belongs To", value=f"**`{belongs_to['description']}`**", inline=False)
+            if "country" in belongs_to:
+                embed.add_field(name="Country", value=f"**`{belongs_to['country']}`**", inline=False)
+            if "type" in belongs_to:
+                embed.add_field(name="Type", value=f"**`{belongs_to['type'].upper()}`**", inline=True)
+        if "ptr_lookup" in result and result["ptr_lookup"] and "ptr_domains" in result["ptr_lookup"] and result["ptr_lookup"]["ptr_domains"]:
+            ptr_domains = ", ".join([f"**`{domain}`**" for domain in result["ptr_lookup"]["ptr_domains"]])
+            embed.add_field(name="PTR Domains", value=ptr_domains, inline=False)
+        if "risk_types" in result:
+            risk_types = ", ".join([f"**`{risk['name']}`**" for risk in result["risk_types"]])
+            embed.add_field(name="Risk Types", value=risk_types, inline=False)
+        if "result_info" in data:
+            result_info = data["result_info"]
+            embed.add_field(name="Total Count", value=f"**`{result_info['total_count']}`**", inline=False)
+            embed.add_field(name="Page", value=f"**`{result_info['page']}`**", inline=False)
+            embed.add_field(name="Per Page", value=f"**`{result_info['per_page']}`**", inline=False)
+
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
+        await ctx.send(embed=embed)
 
     @intel.command(name="domainhistory")
     async def domainhistory(self, ctx, domain: str):
@@ -1701,7 +1565,7 @@ class Cloudflare(commands.Cog):
         except ValueError:
             pass  # Not an IP address, continue with query
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -1713,53 +1577,47 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/domain-history"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
         params = {"domain": domain}
 
-        async with self.session.get(url, headers=headers, params=params) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"] and data["result"]:
-                    result = data["result"][0]
-                    embed = discord.Embed(title=f"Domain history for {domain}", color=0x2BBD8E)
-                    
-                    if "domain" in result:
-                        embed.add_field(name="Domain", value=f"**`{result['domain']}`**", inline=False)
-                    if "categorizations" in result:
-                        categorizations = result["categorizations"]
-                        for categorization in categorizations:
-                            categories = ", ".join([f"**`{category['name']}`**" for category in categorization["categories"]])
-                            embed.add_field(name="Categories", value=categories, inline=True)
-                            if "start" in categorization:
-                                start_timestamp = discord.utils.format_dt(discord.utils.parse_time(categorization['start']), style='R')
-                                embed.add_field(name="Beginning", value=f"**{start_timestamp}**", inline=True)
-                            if "end" in categorization:
-                                end_timestamp = discord.utils.format_dt(discord.utils.parse_time(categorization['end']), style='R')
-                                embed.add_field(name="Ending", value=f"**{end_timestamp}**", inline=True)
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
-                    await ctx.send(embed=embed)
-                else:
-                    embed = discord.Embed(title="No data available", description="There is no domain history available for this domain. Please try this query again later, as results are subject to update.", color=0xff4545)
-                    await ctx.send(embed=embed)
-            elif response.status == 400:
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/domain-history", params=params)
+        except CloudflareAPIError as e:
+            if e.status == 400:
                 embed = discord.Embed(title="Bad Request", description="The server could not understand the request due to invalid syntax.", color=0xff4545)
-                await ctx.send(embed=embed)
             else:
-                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
+                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"{e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        if data["result"]:
+            result = data["result"][0]
+            embed = discord.Embed(title=f"Domain history for {domain}", color=0x2BBD8E)
+
+            if "domain" in result:
+                embed.add_field(name="Domain", value=f"**`{result['domain']}`**", inline=False)
+            if "categorizations" in result:
+                categorizations = result["categorizations"]
+                for categorization in categorizations:
+                    categories = ", ".join([f"**`{category['name']}`**" for category in categorization["categories"]])
+                    embed.add_field(name="Categories", value=categories, inline=True)
+                    if "start" in categorization:
+                        start_timestamp = discord.utils.format_dt(discord.utils.parse_time(categorization['start']), style='R')
+                        embed.add_field(name="Beginning", value=f"**{start_timestamp}**", inline=True)
+                    if "end" in categorization:
+                        end_timestamp = discord.utils.format_dt(discord.utils.parse_time(categorization['end']), style='R')
+                        embed.add_field(name="Ending", value=f"**{end_timestamp}**", inline=True)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/globe.png")
+            await ctx.send(embed=embed)
+        else:
+            embed = discord.Embed(title="No data available", description="There is no domain history available for this domain. Please try this query again later, as results are subject to update.", color=0xff4545)
+            await ctx.send(embed=embed)
 
     @intel.command(name="asn")
     async def asnintel(self, ctx, asn: int):
         """
         Fetch and display ASN intelligence from Cloudflare.
         """
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -1771,50 +1629,40 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/asn/{asn}"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
 
-        async with self.session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"]:
-                    result = data["result"]
-                    embed = discord.Embed(title=f"ASN intelligence for {asn}", color=0x2BBD8E)
-                    
-                    if "asn" in result:
-                        embed.add_field(name="ASN", value=f"**`{result['asn']}`**", inline=False)
-                    if "description" in result:
-                        embed.add_field(name="Description", value=f"**`{result['description']}`**", inline=False)
-                    if "country" in result:
-                        embed.add_field(name="Country", value=f"**`{result['country']}`**", inline=False)
-                    if "type" in result:
-                        embed.add_field(name="Type", value=f"**`{result['type']}`**", inline=False)
-                    if "risk_score" in result:
-                        embed.add_field(name="Risk Score", value=f"**`{result['risk_score']}`**", inline=False)
-                    
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
-                    await ctx.send(embed=embed)
-                else:
-                    embed = discord.Embed(title="Error", description=f"Error: {data['errors']}", color=0xff4545)
-                    await ctx.send(embed=embed)
-            elif response.status == 400:
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/asn/{asn}")
+        except CloudflareAPIError as e:
+            if e.status == 400:
                 embed = discord.Embed(title="Bad Request", description="The server could not understand the request due to invalid syntax.", color=0xff4545)
-                await ctx.send(embed=embed)
             else:
-                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
+                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"{e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        result = data["result"]
+        embed = discord.Embed(title=f"ASN intelligence for {asn}", color=0x2BBD8E)
+
+        if "asn" in result:
+            embed.add_field(name="ASN", value=f"**`{result['asn']}`**", inline=False)
+        if "description" in result:
+            embed.add_field(name="Description", value=f"**`{result['description']}`**", inline=False)
+        if "country" in result:
+            embed.add_field(name="Country", value=f"**`{result['country']}`**", inline=False)
+        if "type" in result:
+            embed.add_field(name="Type", value=f"**`{result['type']}`**", inline=False)
+        if "risk_score" in result:
+            embed.add_field(name="Risk Score", value=f"**`{result['risk_score']}`**", inline=False)
+
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
+        await ctx.send(embed=embed)
 
     @intel.command(name="subnets")
     async def asnsubnets(self, ctx, asn: int):
         """
         Fetch and display ASN subnets intelligence from Cloudflare.
         """
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -1826,80 +1674,70 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/intel/asn/{asn}/subnets"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
 
-        async with self.session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"]:
-                    result = data["result"]
-                    subnets = result.get("subnets", [])
-                    
-                    if subnets:
-                        pages = [subnets[i:i + 10] for i in range(0, len(subnets), 10)]
-                        current_page = 0
-                        embed = discord.Embed(title=f"ASN subnets for {asn}", color=0x2BBD8E)
-                        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
-                        for subnet in pages[current_page]:
-                            embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
-                        message = await ctx.send(embed=embed)
-
-                        if len(pages) > 1:
-                            await message.add_reaction("◀️")
-                            await message.add_reaction("❌")
-                            await message.add_reaction("▶️")
-
-                            def check(reaction, user):
-                                return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
-
-                            while True:
-                                try:
-                                    reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
-
-                                    if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
-                                        current_page += 1
-                                        embed.clear_fields()
-                                        for subnet in pages[current_page]:
-                                            embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
-                                        await message.edit(embed=embed)
-                                        await message.remove_reaction(reaction, user)
-
-                                    elif str(reaction.emoji) == "◀️" and current_page > 0:
-                                        current_page -= 1
-                                        embed.clear_fields()
-                                        for subnet in pages[current_page]:
-                                            embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
-                                        await message.edit(embed=embed)
-                                        await message.remove_reaction(reaction, user)
-
-                                    elif str(reaction.emoji) == "❌":
-                                        await message.delete()
-                                        break
-
-                                except asyncio.TimeoutError:
-                                    await message.clear_reactions()
-                                    break
-                    else:
-                        embed = discord.Embed(title=f"ASN subnets for {asn}", color=0x2BBD8E)
-                        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
-                        embed.add_field(name="Subnets", value="No subnets found for this ASN.", inline=False)
-                        await ctx.send(embed=embed)
-                else:
-                    embed = discord.Embed(title="Error", description=f"Error: {data['errors']}", color=0xff4545)
-                    await ctx.send(embed=embed)
-            elif response.status == 400:
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/intel/asn/{asn}/subnets")
+        except CloudflareAPIError as e:
+            if e.status == 400:
                 embed = discord.Embed(title="Bad Request", description="The server could not understand the request due to invalid syntax.", color=0xff4545)
-                await ctx.send(embed=embed)
             else:
-                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
-   
+                embed = discord.Embed(title="Failed to query Cloudflare API", description=f"{e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        result = data["result"]
+        subnets = result.get("subnets", [])
+
+        if subnets:
+            pages = [subnets[i:i + 10] for i in range(0, len(subnets), 10)]
+            current_page = 0
+            embed = discord.Embed(title=f"ASN subnets for {asn}", color=0x2BBD8E)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
+            for subnet in pages[current_page]:
+                embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
+            message = await ctx.send(embed=embed)
+
+            if len(pages) > 1:
+                await message.add_reaction("◀️")
+                await message.add_reaction("❌")
+                await message.add_reaction("▶️")
+
+                def check(reaction, user):
+                    return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
+
+                while True:
+                    try:
+                        reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+
+                        if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
+                            current_page += 1
+                            embed.clear_fields()
+                            for subnet in pages[current_page]:
+                                embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
+                            await message.edit(embed=embed)
+                            await message.remove_reaction(reaction, user)
+
+                        elif str(reaction.emoji) == "◀️" and current_page > 0:
+                            current_page -= 1
+                            embed.clear_fields()
+                            for subnet in pages[current_page]:
+                                embed.add_field(name="Subnet", value=f"**`{subnet}`**", inline=False)
+                            await message.edit(embed=embed)
+                            await message.remove_reaction(reaction, user)
+
+                        elif str(reaction.emoji) == "❌":
+                            await message.delete()
+                            break
+
+                    except asyncio.TimeoutError:
+                        await message.clear_reactions()
+                        break
+        else:
+            embed = discord.Embed(title=f"ASN subnets for {asn}", color=0x2BBD8E)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/globe.png")
+            embed.add_field(name="Subnets", value="No subnets found for this ASN.", inline=False)
+            await ctx.send(embed=embed)
+
     @commands.group()
     async def urlscanner(self, ctx):
         """With Cloudflare’s URL Scanner, you have the ability to investigate the details of a domain, IP, URL, or ASN. Cloudflare’s URL Scanner is available in the Security Center of the Cloudflare dashboard, Cloudflare Radar and the Cloudflare API.
@@ -1911,7 +1749,7 @@ class Cloudflare(commands.Cog):
     @urlscanner.command(name="search")
     async def search_url_scan(self, ctx, query: str):
         """Search for URL scans by date and webpage requests."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
 
@@ -1924,114 +1762,107 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan"
         params = {"query": query}
 
         try:
-            async with self.session.get(url, headers=headers, params=params) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Search URL Scans",
-                        description=f"**Error:** {error_message}",
-                        color=0xff4545
-                    )
-                    await ctx.send(embed=embed)
-                    return
+            data = await self.api.call("GET", f"/accounts/{account_id}/urlscanner/scan", params=params)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Search URL Scans",
+                description=f"**Error:** {e}",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
+        except Exception as e:
+            await ctx.send(embed=discord.Embed(
+                title="Error",
+                description=f"An error occurred: {str(e)}",
+                color=0xff4545
+            ))
+            return
 
-                results = data.get("result", {}).get("tasks", [])
-                if not results:
-                    embed = discord.Embed(
-                        title="No Results",
-                        description="No URL scans found for the given query.",
-                        color=0xff4545
-                    )
-                    await ctx.send(embed=embed)
-                    return
+        results = data.get("result", {}).get("tasks", [])
+        if not results:
+            embed = discord.Embed(
+                title="No Results",
+                description="No URL scans found for the given query.",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
 
-                pages = []
+        pages = []
+        current_page = discord.Embed(
+            title="URL Scan Results",
+            description=f"Search results for query: **`{query}`**",
+            color=0x2BBD8E
+        )
+        total_size = len(current_page.description)
+        for result in results:
+            field_value = (
+                f"**Country:** {result.get('country', 'Unknown')}\n"
+                f"**Success:** {result.get('success', False)}\n"
+                f"**Time:** {result.get('time', 'Unknown')}\n"
+                f"**UUID:** {result.get('uuid', 'Unknown')}\n"
+                f"**Visibility:** {result.get('visibility', 'Unknown')}"
+            )
+            field_name = result.get("url", "Unknown URL")
+            if len(field_name) > 256:
+                field_name = field_name[:253] + "..."
+            field_size = len(field_name) + len(field_value)
+            if len(current_page.fields) == 25 or (total_size + field_size) > 6000:
+                pages.append(current_page)
                 current_page = discord.Embed(
                     title="URL Scan Results",
-                    description=f"Search results for query: **`{query}`**",
+                    description=f"Search results for query: **`{query}`** (cont.)",
                     color=0x2BBD8E
                 )
                 total_size = len(current_page.description)
-                for result in results:
-                    field_value = (
-                        f"**Country:** {result.get('country', 'Unknown')}\n"
-                        f"**Success:** {result.get('success', False)}\n"
-                        f"**Time:** {result.get('time', 'Unknown')}\n"
-                        f"**UUID:** {result.get('uuid', 'Unknown')}\n"
-                        f"**Visibility:** {result.get('visibility', 'Unknown')}"
-                    )
-                    field_name = result.get("url", "Unknown URL")
-                    if len(field_name) > 256:
-                        field_name = field_name[:253] + "..."
-                    field_size = len(field_name) + len(field_value)
-                    if len(current_page.fields) == 25 or (total_size + field_size) > 6000:
-                        pages.append(current_page)
-                        current_page = discord.Embed(
-                            title="URL Scan Results",
-                            description=f"Search results for query: **`{query}`** (cont.)",
-                            color=0x2BBD8E
-                        )
-                        total_size = len(current_page.description)
-                    current_page.add_field(
-                        name=field_name,
-                        value=field_value,
-                        inline=False
-                    )
-                    total_size += field_size
-                pages.append(current_page)
+            current_page.add_field(
+                name=field_name,
+                value=field_value,
+                inline=False
+            )
+            total_size += field_size
+        pages.append(current_page)
 
-                message = await ctx.send(embed=pages[0])
-                if len(pages) > 1:
-                    await message.add_reaction("◀️")
-                    await message.add_reaction("❌")
-                    await message.add_reaction("▶️")
+        message = await ctx.send(embed=pages[0])
+        if len(pages) > 1:
+            await message.add_reaction("◀️")
+            await message.add_reaction("❌")
+            await message.add_reaction("▶️")
 
-                    def check(reaction, user):
-                        return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
+            def check(reaction, user):
+                return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
 
-                    current_page_index = 0
-                    while True:
-                        try:
-                            reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
+            current_page_index = 0
+            while True:
+                try:
+                    reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
 
-                            if str(reaction.emoji) == "▶️" and current_page_index < len(pages) - 1:
-                                current_page_index += 1
-                                await message.edit(embed=pages[current_page_index])
-                                await message.remove_reaction(reaction, user)
+                    if str(reaction.emoji) == "▶️" and current_page_index < len(pages) - 1:
+                        current_page_index += 1
+                        await message.edit(embed=pages[current_page_index])
+                        await message.remove_reaction(reaction, user)
 
-                            elif str(reaction.emoji) == "◀️" and current_page_index > 0:
-                                current_page_index -= 1
-                                await message.edit(embed=pages[current_page_index])
-                                await message.remove_reaction(reaction, user)
+                    elif str(reaction.emoji) == "◀️" and current_page_index > 0:
+                        current_page_index -= 1
+                        await message.edit(embed=pages[current_page_index])
+                        await message.remove_reaction(reaction, user)
 
-                            elif str(reaction.emoji) == "❌":
-                                await message.delete()
-                                break
+                    elif str(reaction.emoji) == "❌":
+                        await message.delete()
+                        break
 
-                        except asyncio.TimeoutError:
-                            await message.clear_reactions()
-                            break
-        except Exception as e:
-            await ctx.send(embed=discord.Embed(
-                title="Error",
-                description=f"An error occurred: {str(e)}",
-                color=0xff4545
-            ))
+                except asyncio.TimeoutError:
+                    await message.clear_reactions()
+                    break
 
     @urlscanner.command(name="create")
     async def scan_url(self, ctx, url: str):
         """Start a new scan for the provided URL."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
 
@@ -2044,57 +1875,49 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "url": url
         }
 
-        api_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan"
-
         try:
-            async with self.session.post(api_url, headers=headers, json=payload) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Start URL Scan",
-                        description=f"**Error:** {error_message}",
-                        color=0xff4545
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {})
-                embed = discord.Embed(
-                    title="URL Scan Started",
-                    description=f"Scan started successfully.",
-                    color=0x2BBD8E
-                )
-                embed.add_field(name="UUID", value=f"**`{result.get('uuid', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Visibility", value=f"**`{result.get('visibility', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Target", value=f"**`{url}`**", inline=True)
-                time_value = result.get('time', 'Unknown')
-                if time_value != 'Unknown':
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(time_value.replace('Z', '+00:00'))
-                    time_value = f"<t:{int(dt.timestamp())}:F>"
-                embed.add_field(name="Time", value=f"**`{time_value}`**", inline=True)
-                await ctx.send(embed=embed)
+            data = await self.api.call("POST", f"/accounts/{account_id}/urlscanner/scan", json=payload)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Start URL Scan",
+                description=f"**Error:** {e}",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=0xff4545
             ))
+            return
+
+        result = data.get("result", {})
+        embed = discord.Embed(
+            title="URL Scan Started",
+            description=f"Scan started successfully.",
+            color=0x2BBD8E
+        )
+        embed.add_field(name="UUID", value=f"**`{result.get('uuid', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Visibility", value=f"**`{result.get('visibility', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Target", value=f"**`{url}`**", inline=True)
+        time_value = result.get('time', 'Unknown')
+        if time_value != 'Unknown':
+            from datetime import datetime
+            dt = datetime.fromisoformat(time_value.replace('Z', '+00:00'))
+            time_value = f"<t:{int(dt.timestamp())}:F>"
+        embed.add_field(name="Time", value=f"**`{time_value}`**", inline=True)
+        await ctx.send(embed=embed)
 
     @urlscanner.command(name="results")
     async def get_scan_result(self, ctx, scan_id: str):
         """Get the result of a URL scan by its ID."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
 
@@ -2107,75 +1930,67 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        api_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan/{scan_id}"
-
         try:
-            async with self.session.get(api_url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Retrieve URL Scan Result",
-                        description=f"**Error:** {error_message}",
-                        color=0xff4545
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                result = data.get("result", {}).get("scan", {})
-                if not result:
-                    await ctx.send(embed=discord.Embed(
-                        title="No Data",
-                        description="No relevant data found in the scan result.",
-                        color=0xff4545
-                    ))
-                    return
-
-                task = result.get('task', {})
-                verdicts = result.get('verdicts', {})
-                meta = result.get('meta', {})
-                processors = meta.get('processors', {})
-                tech = processors.get('tech', [])
-                task_url = task.get('url', 'Unknown')
-                task_domain = task_url.split('/')[2] if task_url != 'Unknown' else 'Unknown'
-                categories = []
-                domains = result.get('domains', {})
-                if task_domain in domains:
-                    domain_data = domains[task_domain]
-                    content_categories = domain_data.get('categories', {}).get('content', [])
-                    inherited_categories = domain_data.get('categories', {}).get('inherited', {}).get('content', [])
-                    categories.extend(content_categories + inherited_categories)
-
-                embed = discord.Embed(
-                    title="Scan results",
-                    description=f"### Scan result for ID\n```{scan_id}```",
-                    color=0x2BBD8E
-                )
-                embed.add_field(name="Target URL", value=f"```{task_url}```", inline=False)
-                embed.add_field(name="Effective URL", value=f"```{task.get('effectiveUrl', 'Unknown')}```", inline=False)
-                embed.add_field(name="Status", value=f"**`{task.get('status', 'Unknown')}`**", inline=True)
-                embed.add_field(name="Visibility", value=f"**`{task.get('visibility', 'Unknown')}`**", inline=True)
-                malicious_result = verdicts.get('overall', {}).get('malicious', 'Unknown')
-                embed.add_field(name="Malicious", value=f"**`{malicious_result}`**", inline=True)
-                embed.add_field(name="Tech", value=f"**`{', '.join([tech_item['name'] for tech_item in tech])}`**", inline=True)
-                embed.add_field(name="Categories", value=f"**`{', '.join([category['name'] for category in categories])}`**", inline=True)
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/accounts/{account_id}/urlscanner/scan/{scan_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Retrieve URL Scan Result",
+                description=f"**Error:** {e}",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=0xff4545
             ))
+            return
+
+        result = data.get("result", {}).get("scan", {})
+        if not result:
+            await ctx.send(embed=discord.Embed(
+                title="No Data",
+                description="No relevant data found in the scan result.",
+                color=0xff4545
+            ))
+            return
+
+        task = result.get('task', {})
+        verdicts = result.get('verdicts', {})
+        meta = result.get('meta', {})
+        processors = meta.get('processors', {})
+        tech = processors.get('tech', [])
+        task_url = task.get('url', 'Unknown')
+        task_domain = task_url.split('/')[2] if task_url != 'Unknown' else 'Unknown'
+        categories = []
+        domains = result.get('domains', {})
+        if task_domain in domains:
+            domain_data = domains[task_domain]
+            content_categories = domain_data.get('categories', {}).get('content', [])
+            inherited_categories = domain_data.get('categories', {}).get('inherited', {}).get('content', [])
+            categories.extend(content_categories + inherited_categories)
+
+        embed = discord.Embed(
+            title="Scan results",
+            description=f"### Scan result for ID\n```{scan_id}```",
+            color=0x2BBD8E
+        )
+        embed.add_field(name="Target URL", value=f"```{task_url}```", inline=False)
+        embed.add_field(name="Effective URL", value=f"```{task.get('effectiveUrl', 'Unknown')}```", inline=False)
+        embed.add_field(name="Status", value=f"**`{task.get('status', 'Unknown')}`**", inline=True)
+        embed.add_field(name="Visibility", value=f"**`{task.get('visibility', 'Unknown')}`**", inline=True)
+        malicious_result = verdicts.get('overall', {}).get('malicious', 'Unknown')
+        embed.add_field(name="Malicious", value=f"**`{malicious_result}`**", inline=True)
+        embed.add_field(name="Tech", value=f"**`{', '.join([tech_item['name'] for tech_item in tech])}`**", inline=True)
+        embed.add_field(name="Categories", value=f"**`{', '.join([category['name'] for category in categories])}`**", inline=True)
+        await ctx.send(embed=embed)
 
     @urlscanner.command(name="har")
     async def fetch_har(self, ctx, scan_id: str):
         """Fetch the HAR of a scan by the scan ID"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2186,53 +2001,42 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        api_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan/{scan_id}/har"
-
         try:
-            async with self.session.get(api_url, headers=headers) as response:
-                data = await response.json()
-                if not data.get("success", False):
-                    error_message = data.get("errors", [{"message": "Unknown error"}])[0].get("message")
-                    embed = discord.Embed(
-                        title="Failed to Retrieve HAR",
-                        description=f"**Error:** {error_message}",
-                        color=0xff4545
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                har_data = data.get("result", {}).get("har", {})
-                if not har_data:
-                    await ctx.send(embed=discord.Embed(
-                        title="No Data",
-                        description="No HAR data found for the given scan ID.",
-                        color=0xff4545
-                    ))
-                    return
-
-                # Send HAR data as a file
-                har_json = json.dumps(har_data, indent=4)
-                har_file = discord.File(io.StringIO(har_json), filename=f"{scan_id}_har.json")
-                await ctx.send(file=har_file)
-
+            data = await self.api.call("GET", f"/accounts/{account_id}/urlscanner/scan/{scan_id}/har")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to Retrieve HAR",
+                description=f"**Error:** {e}",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
                 description=f"An error occurred: {str(e)}",
                 color=0xff4545
             ))
+            return
+
+        har_data = data.get("result", {}).get("har", {})
+        if not har_data:
+            await ctx.send(embed=discord.Embed(
+                title="No Data",
+                description="No HAR data found for the given scan ID.",
+                color=0xff4545
+            ))
+            return
+
+        # Send HAR data as a file
+        har_json = json.dumps(har_data, indent=4)
+        har_file = discord.File(io.StringIO(har_json), filename=f"{scan_id}_har.json")
+        await ctx.send(file=har_file)
 
     @urlscanner.command(name="screenshot")
     async def get_scan_screenshot(self, ctx, scan_id: str):
         """Get the screenshot of a scan by its scan ID"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2243,17 +2047,12 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
+        headers = await self.api.auth_headers()
 
-        screenshot_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan/{scan_id}/screenshot"
+        screenshot_url = f"{API_BASE}/accounts/{account_id}/urlscanner/scan/{scan_id}/screenshot"
 
         try:
-            async with self.session.get(screenshot_url, headers=headers) as screenshot_response:
+            async with self.api.request("GET", screenshot_url, headers=headers) as screenshot_response:
                 if screenshot_response.content_type == "image/png":
                     screenshot_data = await screenshot_response.read()
                     screenshot_file = discord.File(io.BytesIO(screenshot_data), filename=f"{scan_id}_screenshot.png")
@@ -2274,7 +2073,7 @@ class Cloudflare(commands.Cog):
                 else:
                     screenshot_data = await screenshot_response.json()
                     if not screenshot_data.get("success", False):
-                        error_message = screenshot_data.get("errors", [{"message": "Unknown error"}])[0].get("message")
+                        error_message = format_errors(screenshot_data, screenshot_response.status)
                         embed = discord.Embed(
                             title="Failed to retrieve screenshot",
                             description=f"**`{error_message}`**",
@@ -2292,7 +2091,7 @@ class Cloudflare(commands.Cog):
     @urlscanner.command(name="scan")
     async def scan_url(self, ctx, url: str):
         """Scan a URL using Cloudflare URL Scanner and return the verdict."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2303,40 +2102,16 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
         # Submit the URL for scanning
-        submit_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan"
-        payload = {"url": url}
-
         try:
-            async with self.session.post(submit_url, headers=headers, json=payload) as response:
-                if response.status == 409:
-                    embed = discord.Embed(title="Domain on cooldown", description="The domain was too recently scanned. Please try again in a few minutes.", color=0xff4545)
-                    await ctx.send(embed=embed)
-                    return
-                elif response.status != 200:
-                    embed = discord.Embed(title="Error", description=f"Failed to submit URL for scanning: {response.status}", color=0xff4545)
-                    await ctx.send(embed=embed)
-                    return
-
-                data = await response.json()
-                if not data.get("success", False):
-                    embed = discord.Embed(title="Error", description="Failed to submit URL for scanning.", color=0xff4545)
-                    await ctx.send(embed=embed)
-                    return
-
-                scan_id = data["result"]["uuid"]
-                embed = discord.Embed(title="Scanning URL", description=f"### Your scan ID is\n```{scan_id}```\nThe scan may take a few moments to complete, please wait...", color=0x2BBD8E)
-                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/link.png")
-                await ctx.send(embed=embed)
-                await ctx.typing()
-
+            data = await self.api.call("POST", f"/accounts/{account_id}/urlscanner/scan", json={"url": url})
+        except CloudflareAPIError as e:
+            if e.status == 409:
+                embed = discord.Embed(title="Domain on cooldown", description="The domain was too recently scanned. Please try again in a few minutes.", color=0xff4545)
+            else:
+                embed = discord.Embed(title="Error", description=f"Failed to submit URL for scanning: {e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             await ctx.send(embed=discord.Embed(
                 title="Error",
@@ -2345,12 +2120,19 @@ class Cloudflare(commands.Cog):
             ))
             return
 
+        scan_id = data["result"]["uuid"]
+        embed = discord.Embed(title="Scanning URL", description=f"### Your scan ID is\n```{scan_id}```\nThe scan may take a few moments to complete, please wait...", color=0x2BBD8E)
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Green/link.png")
+        await ctx.send(embed=embed)
+        await ctx.typing()
+
         # Check the scan status every 10-15 seconds
-        status_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan/{scan_id}"
+        headers = await self.api.auth_headers()
+        status_url = f"{API_BASE}/accounts/{account_id}/urlscanner/scan/{scan_id}"
         while True:
             await asyncio.sleep(15)
             try:
-                async with self.session.get(status_url, headers=headers) as response:
+                async with self.api.request("GET", status_url, headers=headers) as response:
                     if response.status == 202:
                         await ctx.typing()
                         continue
@@ -2434,58 +2216,48 @@ class Cloudflare(commands.Cog):
         if not auto_scan_enabled:
             return
 
-        urls = [word for word in message.content.split() if word.startswith("http://") or word.startswith("https://")]
+        # Reuse AntiPhishing's memoized parse of this message when it's loaded
+        antiphishing = self.bot.get_cog("AntiPhishing")
+        if antiphishing is not None and hasattr(antiphishing, "link_extractor"):
+            urls = [link.url for link in antiphishing.link_extractor.message_links(message) if link.explicit]
+        else:
+            urls = [word for word in message.content.split() if word.startswith("http://") or word.startswith("https://")]
         if not urls:
             return
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         account_id = api_tokens.get("account_id")
         bearer_token = api_tokens.get("bearer_token")
 
         if not account_id or not bearer_token:
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
         for url in urls:
-            payload = {"url": url}
-            api_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan"
-
             try:
-                async with self.session.post(api_url, headers=headers, json=payload) as response:
-                    data = await response.json()
-                    if not data.get("success", False):
-                        continue
-
-                    scan_id = data.get("result", {}).get("uuid")
-                    if not scan_id:
-                        continue
-
-                    await asyncio.sleep(60)
+                data = await self.api.call("POST", f"/accounts/{account_id}/urlscanner/scan", json={"url": url})
+                scan_id = data.get("result", {}).get("uuid")
+                if not scan_id:
+                    continue
 
-                    scan_result_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/urlscanner/scan/{scan_id}"
-                    async with self.session.get(scan_result_url, headers=headers) as scan_response:
-                        scan_data = await scan_response.json()
-                        if not scan_data.get("success", False):
-                            continue
+                await asyncio.sleep(60)
 
-                        result = scan_data.get("result", {}).get("scan", {})
-                        verdicts = result.get("verdicts", {})
-                        malicious = verdicts.get("overall", {}).get("malicious", False)
+                scan_data = await self.api.call("GET", f"/accounts/{account_id}/urlscanner/scan/{scan_id}")
+                result = scan_data.get("result", {}).get("scan", {})
+                verdicts = result.get("verdicts", {})
+                malicious = verdicts.get("overall", {}).get("malicious", False)
 
-                        if malicious:
-                            await message.delete()
-                            embed = discord.Embed(
-                                title="Malicious URL Detected",
-                                description=f"A message containing a malicious URL was removed.",
-                                color=0xff4545
-                            )
-                            await message.channel.send(embed=embed)
-                            return
+                if malicious:
+                    await message.delete()
+                    embed = discord.Embed(
+                        title="Malicious URL Detected",
+                        description=f"A message containing a malicious URL was removed.",
+                        color=0xff4545
+                    )
+                    await message.channel.send(embed=embed)
+                    return
 
+            except CloudflareAPIError:
+                continue
             except Exception as e:
                 await message.channel.send(embed=discord.Embed(
                     title="Error",
@@ -2506,7 +2278,7 @@ class Cloudflare(commands.Cog):
     @emailrouting.command(name="list")
     async def list_email_routing_addresses(self, ctx):
         """List current destination addresses"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2517,119 +2289,67 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        async with self.session.get(f"https://api.cloudflare.com/client/v4/accounts/{account_id}/email/routing/addresses", headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(title="Error", description=f"Failed to fetch Email Routing addresses: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
-                return
+        def render(addresses, index):
+            return discord.Embed(title="Email Routing address list", description="\n".join([f"**`{addr['email']}`**" for addr in addresses]), color=0x2BBD8E)
 
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(title="Error", description="Failed to fetch Email Routing addresses.", color=0xff4545)
-                await ctx.send(embed=embed)
-                return
+        def export_row(addr):
+            return {"id": addr.get("id", ""), "email": addr.get("email", ""), "verified": addr.get("verified") or "", "created": addr.get("created", "")}
 
-            addresses = data.get("result", [])
-            if not addresses:
+        paginator = StreamPaginator(
+            ctx.author,
+            lambda: self.api.paginate(f"/accounts/{account_id}/email/routing/addresses", per_page=50),
+            render,
+            export_row=export_row,
+            export_name="email_routing_addresses.csv"
+        )
+        try:
+            if not await paginator.start(ctx):
                 embed = discord.Embed(title="Email Routing Addresses", description="No Email Routing addresses found.", color=0xff4545)
                 await ctx.send(embed=embed)
-                return
+        except CloudflareAPIError as e:
+            embed = discord.Embed(title="Error", description=f"Failed to fetch Email Routing addresses: {e}", color=0xff4545)
+            await ctx.send(embed=embed)
 
-            pages = [addresses[i:i + 10] for i in range(0, len(addresses), 10)]
-            current_page = 0
+    @commands.is_owner()
+    @emailrouting.command(name="add")
+    async def create_email_routing_address(self, ctx, email: str):
+        """Add a new destination address to your Email Routing service."""
+        api_tokens = await self.api.credentials()
+        email_token = api_tokens.get("email")
+        api_key = api_tokens.get("api_key")
+        bearer_token = api_tokens.get("bearer_token")
+        account_id = api_tokens.get("account_id")
 
-            embed = discord.Embed(title="Email Routing address list", description="\n".join([f"**`{addr['email']}`**" for addr in pages[current_page]]), color=0x2BBD8E)
-            message = await ctx.send(embed=embed)
+        if not all([email_token, api_key, bearer_token, account_id]):
+            embed = discord.Embed(title="Error", description="Missing one or more required API tokens. Please check your configuration.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
 
-            if len(pages) > 1:
-                await message.add_reaction("◀️")
-                await message.add_reaction("❌")
-                await message.add_reaction("▶️")
-
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["◀️", "❌", "▶️"] and reaction.message.id == message.id
-
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
-
-                        if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
-                            current_page += 1
-                            embed.description = "\n".join([f"**`{addr['email']}`**" for addr in pages[current_page]])
-                            await message.edit(embed=embed)
-                            await message.remove_reaction(reaction, user)
-
-                        elif str(reaction.emoji) == "◀️" and current_page > 0:
-                            current_page -= 1
-                            embed.description = "\n".join([f"**`{addr['email']}`**" for addr in pages[current_page]])
-                            await message.edit(embed=embed)
-                            await message.remove_reaction(reaction, user)
-
-                        elif str(reaction.emoji) == "❌":
-                            await message.delete()
-                            break
-
-                    except asyncio.TimeoutError:
-                        await message.clear_reactions()
-                        break
-
-    @commands.is_owner()
-    @emailrouting.command(name="add")
-    async def create_email_routing_address(self, ctx, email: str):
-        """Add a new destination address to your Email Routing service."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
-        email_token = api_tokens.get("email")
-        api_key = api_tokens.get("api_key")
-        bearer_token = api_tokens.get("bearer_token")
-        account_id = api_tokens.get("account_id")
-
-        if not all([email_token, api_key, bearer_token, account_id]):
-            embed = discord.Embed(title="Error", description="Missing one or more required API tokens. Please check your configuration.", color=0xff4545)
-            await ctx.send(embed=embed)
-            return
-
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/email/routing/addresses"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email_token,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
         payload = {
             "email": email
         }
 
-        async with self.session.post(url, headers=headers, json=payload) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data["success"]:
-                    result = data["result"]
-                    embed = discord.Embed(title="Destination address added", description="You or the owner of this inbox will need to click the link they were sent just now to enable their email as a destination within your Cloudflare account", color=0x2BBD8E)
-                    embed.add_field(name="Email", value=f"**`{result['email']}`**", inline=False)
-                    embed.add_field(name="ID", value=f"**`{result['id']}`**", inline=False)
-                    embed.add_field(name="Created", value=f"**`{result['created']}`**", inline=False)
-                    embed.add_field(name="Modified", value=f"**`{result['modified']}`**", inline=False)
-                    embed.add_field(name="Verified", value=f"**`{result['verified']}`**", inline=False)
-                    await ctx.send(embed=embed)
-                else:
-                    embed = discord.Embed(title="Error", description=f"Error: {data['errors']}", color=0xff4545)
-                    await ctx.send(embed=embed)
-            else:
-                embed = discord.Embed(title="Error", description=f"Failed to create email routing address. Status code: {response.status}", color=0xff4545)
-                await ctx.send(embed=embed)
+        try:
+            data = await self.api.call("POST", f"/accounts/{account_id}/email/routing/addresses", json=payload)
+        except CloudflareAPIError as e:
+            embed = discord.Embed(title="Error", description=f"Failed to create email routing address: {e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        result = data["result"]
+        embed = discord.Embed(title="Destination address added", description="You or the owner of this inbox will need to click the link they were sent just now to enable their email as a destination within your Cloudflare account", color=0x2BBD8E)
+        embed.add_field(name="Email", value=f"**`{result['email']}`**", inline=False)
+        embed.add_field(name="ID", value=f"**`{result['id']}`**", inline=False)
+        embed.add_field(name="Created", value=f"**`{result['created']}`**", inline=False)
+        embed.add_field(name="Modified", value=f"**`{result['modified']}`**", inline=False)
+        embed.add_field(name="Verified", value=f"**`{result['verified']}`**", inline=False)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @emailrouting.command(name="remove")
     async def remove_email_routing_address(self, ctx, email: str):
         """Remove a destination address from your Email Routing service."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email_token = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2645,49 +2365,31 @@ class Cloudflare(commands.Cog):
             return
 
         # Query to get the ID of the address to be deleted
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/email/routing/addresses"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email_token,
-            "X-Auth-Key": api_key,
-            "Content-Type": "application/json",
-        }
-
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch email routing addresses. Status code: {response.status}",
-                    color=0xff4545
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch email routing addresses.",
-                    color=0xff4545
-                )
-                await ctx.send(embed=embed)
-                return
-
-            addresses = data.get("result", [])
-            address_id = None
-            for address in addresses:
+        path = f"/accounts/{account_id}/email/routing/addresses"
+        address_id = None
+        try:
+            # Stop reading pages as soon as the address turns up
+            async for address in self.api.paginate(path, per_page=50):
                 if address["email"] == email:
                     address_id = address["id"]
                     break
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch email routing addresses.\n{e}",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
 
-            if not address_id:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"No email routing address found for **`{email}`**.",
-                    color=0xff4545
-                )
-                await ctx.send(embed=embed)
-                return
+        if not address_id:
+            embed = discord.Embed(
+                title="Error",
+                description=f"No email routing address found for **`{email}`**.",
+                color=0xff4545
+            )
+            await ctx.send(embed=embed)
+            return
 
         # Ask for confirmation
         embed = discord.Embed(
@@ -2716,31 +2418,22 @@ class Cloudflare(commands.Cog):
             elif str(reaction.emoji) == "✅":
                 # Delete the address
                 await asyncio.sleep(5)  # Wait for 5 seconds to avoid rate limiting
-                delete_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/email/routing/addresses/{address_id}"
-                async with self.session.delete(delete_url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data["success"]:
-                            embed = discord.Embed(
-                                title="Destination address removed",
-                                description=f"**Successfully removed email routing address**\n**`{email}`**",
-                                color=0x2BBD8E
-                            )
-                            await ctx.send(embed=embed)
-                        else:
-                            embed = discord.Embed(
-                                title="Error",
-                                description=f"**Error:** {data['errors']}",
-                                color=0xff4545
-                            )
-                            await ctx.send(embed=embed)
-                    else:
-                        embed = discord.Embed(
-                            title="Error",
-                            description=f"Failed to remove email routing address. Status code: {response.status}",
-                            color=0xff4545
-                        )
-                        await ctx.send(embed=embed)
+                try:
+                    await self.api.call("DELETE", f"/accounts/{account_id}/email/routing/addresses/{address_id}")
+                except CloudflareAPIError as e:
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"**Error:** {e}",
+                        color=0xff4545
+                    )
+                    await ctx.send(embed=embed)
+                    return
+                embed = discord.Embed(
+                    title="Destination address removed",
+                    description=f"**Successfully removed email routing address**\n**`{email}`**",
+                    color=0x2BBD8E
+                )
+                await ctx.send(embed=embed)
         except asyncio.TimeoutError:
             embed = discord.Embed(
                 title="Timeout",
@@ -2753,7 +2446,7 @@ class Cloudflare(commands.Cog):
     @emailrouting.command(name="settings")
     async def get_email_routing_settings(self, ctx):
         """Get and display the current Email Routing settings for a specific zone"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2769,72 +2462,55 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing"
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch Email Routing settings: {response.status}",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch Email Routing settings.",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
-            settings = data.get("result", {})
-            if not settings:
-                embed = discord.Embed(
-                    title="Error",
-                    description="No Email Routing settings found.",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            data = await self.api.call("GET", f"/zones/{zone_identifier}/email/routing")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Current settings for Email Routing",
-                description=f"**Settings for zone `{zone_identifier.upper()}`**\n\n*Change your zone using `[p]set api cloudflare zone_id`*",
-                color=0x2BBD8E  # Green color for success
+                title="Error",
+                description=f"Failed to fetch Email Routing settings: {e}",
+                color=0xff4545  # Red color for error
             )
-            created_timestamp = settings.get('created', 'N/A')
-            if created_timestamp != 'N/A':
-                created_timestamp = f"<t:{int(datetime.fromisoformat(created_timestamp).timestamp())}:F>"
-            embed.add_field(name="Created", value=f"**{created_timestamp}**", inline=False)
-            embed.add_field(name="Enabled", value=f"**`{settings.get('enabled', 'N/A')}`**", inline=False)
-            embed.add_field(name="ID", value=f"**`{settings.get('id', 'N/A').upper()}`**", inline=False)
-            modified_timestamp = settings.get('modified', 'N/A')
-            if modified_timestamp != 'N/A':
-                modified_timestamp = f"<t:{int(datetime.fromisoformat(modified_timestamp).timestamp())}:F>"
-            embed.add_field(name="Modified", value=f"**{modified_timestamp}**", inline=False)
-            embed.add_field(name="Name", value=f"**`{settings.get('name', 'N/A')}`**", inline=False)
-            embed.add_field(name="Skipped wizard", value=f"**`{str(settings.get('skip_wizard', 'N/A')).upper()}`**", inline=False)
-            embed.add_field(name="Status", value=f"**`{str(settings.get('status', 'N/A')).upper()}`**", inline=False)
-            embed.add_field(name="Synced", value=f"**`{str(settings.get('synced', 'N/A')).upper()}`**", inline=False)
-            embed.add_field(name="Tag", value=f"**`{str(settings.get('tag', 'N/A')).upper()}`**", inline=False)
+            await ctx.send(embed=embed)
+            return
 
+        settings = data.get("result", {})
+        if not settings:
+            embed = discord.Embed(
+                title="Error",
+                description="No Email Routing settings found.",
+                color=0xff4545  # Red color for error
+            )
             await ctx.send(embed=embed)
-    
+            return
+
+        embed = discord.Embed(
+            title="Current settings for Email Routing",
+            description=f"**Settings for zone `{zone_identifier.upper()}`**\n\n*Change your zone using `[p]set api cloudflare zone_id`*",
+            color=0x2BBD8E  # Green color for success
+        )
+        created_timestamp = settings.get('created', 'N/A')
+        if created_timestamp != 'N/A':
+            created_timestamp = f"<t:{int(datetime.fromisoformat(created_timestamp).timestamp())}:F>"
+        embed.add_field(name="Created", value=f"**{created_timestamp}**", inline=False)
+        embed.add_field(name="Enabled", value=f"**`{settings.get('enabled', 'N/A')}`**", inline=False)
+        embed.add_field(name="ID", value=f"**`{settings.get('id', 'N/A').upper()}`**", inline=False)
+        modified_timestamp = settings.get('modified', 'N/A')
+        if modified_timestamp != 'N/A':
+            modified_timestamp = f"<t:{int(datetime.fromisoformat(modified_timestamp).timestamp())}:F>"
+        embed.add_field(name="Modified", value=f"**{modified_timestamp}**", inline=False)
+        embed.add_field(name="Name", value=f"**`{settings.get('name', 'N/A')}`**", inline=False)
+        embed.add_field(name="Skipped wizard", value=f"**`{str(settings.get('skip_wizard', 'N/A')).upper()}`**", inline=False)
+        embed.add_field(name="Status", value=f"**`{str(settings.get('status', 'N/A')).upper()}`**", inline=False)
+        embed.add_field(name="Synced", value=f"**`{str(settings.get('synced', 'N/A')).upper()}`**", inline=False)
+        embed.add_field(name="Tag", value=f"**`{str(settings.get('tag', 'N/A')).upper()}`**", inline=False)
+
+        await ctx.send(embed=embed)
+
     @commands.is_owner()
     @emailrouting.command(name="enable")
     async def enable_email_routing(self, ctx):
         """Enable Email Routing for the selected zone"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2882,46 +2558,29 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/enable"
-        async with self.session.post(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to enable Email Routing: {response.status}",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to enable Email Routing.",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            await self.api.call("POST", f"/zones/{zone_identifier}/email/routing/enable")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Success",
-                description=f"Email Routing has been successfully enabled for zone `{zone_identifier.upper()}`.",
-                color=0x2BBD8E  # Green color for success
+                title="Error",
+                description=f"Failed to enable Email Routing: {e}",
+                color=0xff4545  # Red color for error
             )
             await ctx.send(embed=embed)
-    
+            return
+
+        embed = discord.Embed(
+            title="Success",
+            description=f"Email Routing has been successfully enabled for zone `{zone_identifier.upper()}`.",
+            color=0x2BBD8E  # Green color for success
+        )
+        await ctx.send(embed=embed)
+
     @commands.is_owner()
     @emailrouting.command(name="disable")
     async def disable_email_routing(self, ctx):
         """Disable Email Routing for the selected zone"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -2964,46 +2623,29 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/disable"
-        async with self.session.post(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to disable Email Routing: {response.status}",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to disable Email Routing.",
-                    color=0xff4545  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            await self.api.call("POST", f"/zones/{zone_identifier}/email/routing/disable")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Success",
-                description=f"Email Routing has been successfully disabled for zone `{zone_identifier.upper()}`.",
-                color=0x2BBD8E  # Green color for success
+                title="Error",
+                description=f"Failed to disable Email Routing: {e}",
+                color=0xff4545  # Red color for error
             )
             await ctx.send(embed=embed)
-    
+            return
+
+        embed = discord.Embed(
+            title="Success",
+            description=f"Email Routing has been successfully disabled for zone `{zone_identifier.upper()}`.",
+            color=0x2BBD8E  # Green color for success
+        )
+        await ctx.send(embed=embed)
+
     @commands.is_owner()
     @emailrouting.command(name="records")
     async def get_email_routing_dns_records(self, ctx):
         """Get the required DNS records to setup Email Routing"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -3018,54 +2660,37 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/dns"
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch DNS records for Email Routing: {response.status}",
-                    color=discord.Color.from_str("#ff4545")  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
+        try:
+            data = await self.api.call("GET", f"/zones/{zone_identifier}/email/routing/dns")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch DNS records for Email Routing: {e}",
+                color=discord.Color.from_str("#ff4545")  # Red color for error
+            )
+            await ctx.send(embed=embed)
+            return
 
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch DNS records for Email Routing.",
-                    color=discord.Color.from_str("#ff4545")  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
+        records = data.get("result", [])
+        if not records:
+            embed = discord.Embed(
+                title="No Records",
+                description="No DNS records found for Email Routing.",
+                color=discord.Color.from_str("#ff4545")  # Red color for error
+            )
+            await ctx.send(embed=embed)
+            return
 
-            records = data.get("result", [])
-            if not records:
-                embed = discord.Embed(
-                    title="No Records",
-                    description="No DNS records found for Email Routing.",
-                    color=discord.Color.from_str("#ff4545")  # Red color for error
-                )
-                await ctx.send(embed=embed)
-                return
+        embed = discord.Embed(title="Email Routing DNS Records", color=discord.Color.from_str("#2BBD8E"))  # Green color for success
+        for record in records:
+            embed.add_field(
+                name=f"{record['type']} Record",
+                value=f"**Name:** {record['name']}\n**Content:** {record['content']}\n**Priority:** {record.get('priority', 'N/A')}\n**TTL:** {record['ttl']}",
+                inline=False
+            )
 
-            embed = discord.Embed(title="Email Routing DNS Records", color=discord.Color.from_str("#2BBD8E"))  # Green color for success
-            for record in records:
-                embed.add_field(
-                    name=f"{record['type']} Record",
-                    value=f"**Name:** {record['name']}\n**Content:** {record['content']}\n**Priority:** {record.get('priority', 'N/A')}\n**TTL:** {record['ttl']}",
-                    inline=False
-                )
+        await ctx.send(embed=embed)
 
-            await ctx.send(embed=embed)
-    
     @commands.is_owner()
     @emailrouting.group(name="rules", invoke_without_command=True)
     async def email_routing_rules(self, ctx):
@@ -3076,7 +2701,7 @@ class Cloudflare(commands.Cog):
     @email_routing_rules.command(name="add")
     async def add_email_routing_rule(self, ctx, source: str, destination: str):
         """Add a rule to Email Routing"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -3091,51 +2716,34 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/rules"
         payload = {
             "source": source,
             "destination": destination
         }
 
-        async with self.session.post(url, headers=headers, json=payload) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to add Email Routing rule: {response.status}",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to add Email Routing rule.",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            await self.api.call("POST", f"/zones/{zone_identifier}/email/routing/rules", json=payload)
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Success",
-                description=f"Email Routing rule added successfully: {source} -> {destination}",
-                color=discord.Color.from_str("#2BBD8E")  # Success color
+                title="Error",
+                description=f"Failed to add Email Routing rule: {e}",
+                color=discord.Color.from_str("#ff4545")  # Error color
             )
             await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="Success",
+            description=f"Email Routing rule added successfully: {source} -> {destination}",
+            color=discord.Color.from_str("#2BBD8E")  # Success color
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @email_routing_rules.command(name="remove")
     async def remove_email_routing_rule(self, ctx, rule_id: str):
         """Remove a rule from Email Routing"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -3150,47 +2758,29 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/rules/{rule_id}"
-
-        async with self.session.delete(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to remove Email Routing rule: {response.status}",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to remove Email Routing rule.",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            await self.api.call("DELETE", f"/zones/{zone_identifier}/email/routing/rules/{rule_id}")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Success",
-                description=f"Email Routing rule removed successfully: {rule_id}",
-                color=discord.Color.from_str("#2BBD8E")  # Success color
+                title="Error",
+                description=f"Failed to remove Email Routing rule: {e}",
+                color=discord.Color.from_str("#ff4545")  # Error color
             )
             await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="Success",
+            description=f"Email Routing rule removed successfully: {rule_id}",
+            color=discord.Color.from_str("#2BBD8E")  # Success color
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @email_routing_rules.command(name="list")
     async def list_email_routing_rules(self, ctx):
         """Show current Email Routing rules"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         email = api_tokens.get("email")
         api_key = api_tokens.get("api_key")
         bearer_token = api_tokens.get("bearer_token")
@@ -3205,126 +2795,66 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"https://api.cloudflare.com/client/v4/zones/{zone_identifier}/email/routing/rules"
-
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch Email Routing rules: {response.status}",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch Email Routing rules.",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
-            rules = data.get("result", [])
-            if not rules:
-                embed = discord.Embed(
-                    title="Error",
-                    description="No Email Routing rules found.",
-                    color=discord.Color.from_str("#ff4545")  # Error color
-                )
-                await ctx.send(embed=embed)
-                return
-
-            embed = discord.Embed(title="Email Routing Rules", color=discord.Color.from_str("#2BBD8E"))  # Success color
-            for rule in rules:
-                actions = ", ".join([action["type"] for action in rule["actions"]])
-                destinations = ", ".join([value if isinstance(value, str) else str(value) for action in rule["actions"] for value in (action.get("value", []) if isinstance(action.get("value", []), list) else [action.get("value", [])])])
-                matchers = ", ".join([f"{matcher.get('field', 'unknown')}: {matcher.get('value', 'unknown')}" for matcher in rule["matchers"]])
-                embed.add_field(
-                    name=f"Rule ID: {rule['id']}",
-                    value=f"**Name:** {rule['name']}\n**Enabled:** {rule['enabled']}\n**Actions:** {actions}\n**Destinations:** {destinations}\n**Matchers:** {matchers}\n**Priority:** {rule['priority']}\n**Tag:** {rule['tag']}",
-                    inline=False
-                )
-
+        try:
+            data = await self.api.call("GET", f"/zones/{zone_identifier}/email/routing/rules")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch Email Routing rules: {e}",
+                color=discord.Color.from_str("#ff4545")  # Error color
+            )
             await ctx.send(embed=embed)
-    
-
-    @commands.is_owner()
-    @commands.group(invoke_without_command=False)
-    async def hyperdrive(self, ctx):
-        """Hyperdrive is a service that accelerates queries you make to existing databases, making it faster to access your data from across the globe, irrespective of your users’ location. Learn more at https://developers.cloudflare.com/hyperdrive/"""
-            
-    @commands.is_owner()
-    @hyperdrive.command(name="list")
-    async def list_hyperdrives(self, ctx):
-        """List current Hyperdrives in the specified account"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
-        email = api_tokens.get("email")
-        api_key = api_tokens.get("api_key")
-        bearer_token = api_tokens.get("bearer_token")
-        account_id = api_tokens.get("account_id")
+            return
 
-        if not all([email, api_key, bearer_token, account_id]):
+        rules = data.get("result", [])
+        if not rules:
             embed = discord.Embed(
-                title="Authentication error",
-                description="Your bot is missing one or more authentication elements required to interact with your Cloudflare account securely. Please ensure you have set an `api_key`, `email`, `bearer_token`, and `account_id` for this command to function properly. If you're not sure what this error means, ask your systems admin, or a more tech-inclined friend.",
-                color=discord.Color.from_str("#ff4545")
+                title="Error",
+                description="No Email Routing rules found.",
+                color=discord.Color.from_str("#ff4545")  # Error color
             )
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json"
-        }
+        embed = discord.Embed(title="Email Routing Rules", color=discord.Color.from_str("#2BBD8E"))  # Success color
+        for rule in rules:
+            actions = ", ".join([action["type"] for action in rule["actions"]])
+            destinations = ", ".join([value if isinstance(value, str) else str(value) for action in rule["actions"] for value in (action.get("value", []) if isinstance(action.get("value", []), list) else [action.get("value", [])])])
+            matchers = ", ".join([f"{matcher.get('field', 'unknown')}: {matcher.get('value', 'unknown')}" for matcher in rule["matchers"]])
+            embed.add_field(
+                name=f"Rule ID: {rule['id']}",
+                value=f"**Name:** {rule['name']}\n**Enabled:** {rule['enabled']}\n**Actions:** {actions}\n**Destinations:** {destinations}\n**Matchers:** {matchers}\n**Priority:** {rule['priority']}\n**Tag:** {rule['tag']}",
+                inline=False
+            )
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs"
+        await ctx.send(embed=embed)
 
-        async with self.session.get(url, headers=headers) as response:
-            if response.status == 401:
-                embed = discord.Embed(
-                    title="Upgrade required",
-                    description="**Cloudflare Hyperdrive** requires the attached **Cloudflare account** to be subscribed to a **Workers Paid** plan.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                button = discord.ui.Button(
-                    label="Hyperdrive prerequisites",
-                    url="https://developers.cloudflare.com/hyperdrive/get-started/#prerequisites"
-                )
-                button2 = discord.ui.Button(
-                    label="Workers pricing",
-                    url="https://developers.cloudflare.com/workers/platform/pricing/#workers"
-                )
-                view = discord.ui.View()
-                view.add_item(button)
-                view.add_item(button2)
-                await ctx.send(embed=embed, view=view)
-                return
-            elif response.status != 200:
-                await ctx.send(f"Failed to fetch Hyperdrives: {response.status}")
-                return
 
-            data = await response.json()
-            if not data.get("success", False):
-                await ctx.send("Failed to fetch Hyperdrives.")
-                return
+    @commands.is_owner()
+    @commands.group(invoke_without_command=False)
+    async def hyperdrive(self, ctx):
+        """Hyperdrive is a service that accelerates queries you make to existing databases, making it faster to access your data from across the globe, irrespective of your users’ location. Learn more at https://developers.cloudflare.com/hyperdrive/"""
+            
+    @commands.is_owner()
+    @hyperdrive.command(name="list")
+    async def list_hyperdrives(self, ctx):
+        """List current Hyperdrives in the specified account"""
+        api_tokens = await self.api.credentials()
+        email = api_tokens.get("email")
+        api_key = api_tokens.get("api_key")
+        bearer_token = api_tokens.get("bearer_token")
+        account_id = api_tokens.get("account_id")
 
-            hyperdrives = data.get("result", [])
-            if not hyperdrives:
-                await ctx.send("No Hyperdrives found.")
-                return
+        if not all([email, api_key, bearer_token, account_id]):
+            embed = discord.Embed(
+                title="Authentication error",
+                description="Your bot is missing one or more authentication elements required to interact with your Cloudflare account securely. Please ensure you have set an `api_key`, `email`, `bearer_token`, and `account_id` for this command to function properly. If you're not sure what this error means, ask your systems admin, or a more tech-inclined friend.",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
 
+        def render(hyperdrives, index):
             embed = discord.Embed(title="Hyperdrives", color=discord.Color.from_str("#2BBD8E"))
             for hyperdrive in hyperdrives:
                 caching = hyperdrive["caching"]
@@ -3344,14 +2874,62 @@ class Cloudflare(commands.Cog):
                     ),
                     inline=False
                 )
+            return embed
+
+        def export_row(hyperdrive):
+            caching = hyperdrive.get("caching", {})
+            origin = hyperdrive.get("origin", {})
+            return {
+                "id": hyperdrive.get("id", ""),
+                "name": hyperdrive.get("name", ""),
+                "caching_disabled": caching.get("disabled", ""),
+                "max_age": caching.get("max_age", ""),
+                "stale_while_revalidate": caching.get("stale_while_revalidate", ""),
+                "database": origin.get("database", ""),
+                "host": origin.get("host", ""),
+                "port": origin.get("port", ""),
+                "scheme": origin.get("scheme", ""),
+                "user": origin.get("user", ""),
+            }
 
-            await ctx.send(embed=embed)
+        paginator = StreamPaginator(
+            ctx.author,
+            lambda: self.api.paginate(f"/accounts/{account_id}/hyperdrive/configs"),
+            render,
+            per_page=5,
+            export_row=export_row,
+            export_name="hyperdrives.csv"
+        )
+        try:
+            if not await paginator.start(ctx):
+                await ctx.send("No Hyperdrives found.")
+        except CloudflareAPIError as e:
+            if e.status == 401:
+                embed = discord.Embed(
+                    title="Upgrade required",
+                    description="**Cloudflare Hyperdrive** requires the attached **Cloudflare account** to be subscribed to a **Workers Paid** plan.",
+                    color=discord.Color.from_str("#ff4545")
+                )
+                button = discord.ui.Button(
+                    label="Hyperdrive prerequisites",
+                    url="https://developers.cloudflare.com/hyperdrive/get-started/#prerequisites"
+                )
+                button2 = discord.ui.Button(
+                    label="Workers pricing",
+                    url="https://developers.cloudflare.com/workers/platform/pricing/#workers"
+                )
+                view = discord.ui.View()
+                view.add_item(button)
+                view.add_item(button2)
+                await ctx.send(embed=embed, view=view)
+                return
+            await ctx.send(f"Failed to fetch Hyperdrives: {e}")
 
     @commands.is_owner()
     @hyperdrive.command(name="create")
     async def create_hyperdrive(self, ctx, name: str, password: str, database: str, host: str, port: str, scheme: str, user: str, caching_disabled: bool, max_age: int, stale_while_revalidate: int):
         """Create a new Hyperdrive"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         bearer_token = api_tokens.get("bearer_token")
         account_id = api_tokens.get("account_id")
         api_key = api_tokens.get("api_key")
@@ -3361,7 +2939,6 @@ class Cloudflare(commands.Cog):
             await ctx.send("Bearer token or account ID not set.")
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs"
         payload = {
             "origin": {
                 "password": password,
@@ -3378,15 +2955,11 @@ class Cloudflare(commands.Cog):
             },
             "name": name
         }
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
 
-        async with self.session.post(url, json=payload, headers=headers) as response:
-            if response.status == 401:
+        try:
+            data = await self.api.call("POST", f"/accounts/{account_id}/hyperdrive/configs", json=payload)
+        except CloudflareAPIError as e:
+            if e.status == 401:
                 embed = discord.Embed(
                     title="Upgrade required",
                     description="**Cloudflare Hyperdrive** requires the attached **Cloudflare account** to be subscribed to a **Workers Paid** plan.",
@@ -3405,35 +2978,29 @@ class Cloudflare(commands.Cog):
                 view.add_item(button2)
                 await ctx.send(embed=embed, view=view)
                 return
-            elif response.status != 200:
-                await ctx.send(f"Failed to create Hyperdrive: {response.status}")
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                await ctx.send("Failed to create Hyperdrive.")
-                return
-
-            result = data.get("result", {})
-            embed = discord.Embed(title="Hyperdrive successfully created", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="ID", value=result.get("id"), inline=False)
-            embed.add_field(name="Name", value=result.get("name"), inline=False)
-            embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
-            embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
-            embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
-            embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
-            embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
-            embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
-            embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
-            embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
+            await ctx.send(f"Failed to create Hyperdrive: {e}")
+            return
+
+        result = data.get("result", {})
+        embed = discord.Embed(title="Hyperdrive successfully created", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="ID", value=result.get("id"), inline=False)
+        embed.add_field(name="Name", value=result.get("name"), inline=False)
+        embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
+        embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
+        embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
+        embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
+        embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
+        embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
+        embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
+        embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @hyperdrive.command(name="delete")
     async def delete_hyperdrive(self, ctx, hyperdrive_id: str):
         """Delete a Hyperdrive."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3448,46 +3015,29 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
-        async with self.session.delete(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to delete Hyperdrive: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to delete Hyperdrive.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
+        try:
+            await self.api.call("DELETE", f"/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}")
+        except CloudflareAPIError as e:
             embed = discord.Embed(
-                title="Success",
-                description=f"Hyperdrive {hyperdrive_id} successfully deleted.",
-                color=discord.Color.from_str("#2BBD8E")
+                title="Error",
+                description=f"Failed to delete Hyperdrive: {e}",
+                color=discord.Color.from_str("#ff4545")
             )
             await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(
+            title="Success",
+            description=f"Hyperdrive {hyperdrive_id} successfully deleted.",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @hyperdrive.command(name="info")
     async def get_hyperdrive_info(self, ctx, hyperdrive_id: str):
         """Fetch information about a specified Hyperdrive by its ID."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3502,54 +3052,37 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
-        async with self.session.get(url, headers=headers) as response:
-            if response.status != 200:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"Failed to fetch Hyperdrive info: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                embed = discord.Embed(
-                    title="Error",
-                    description="Failed to fetch Hyperdrive info.",
-                    color=discord.Color.from_str("#ff4545")
-                )
-                await ctx.send(embed=embed)
-                return
+        try:
+            data = await self.api.call("GET", f"/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Failed to fetch Hyperdrive info: {e}",
+                color=discord.Color.from_str("#ff4545")
+            )
+            await ctx.send(embed=embed)
+            return
 
-            result = data.get("result", {})
-            embed = discord.Embed(title="Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="ID", value=result.get("id"), inline=False)
-            embed.add_field(name="Name", value=result.get("name"), inline=False)
-            embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
-            embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
-            embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
-            embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
-            embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
-            embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
-            embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
-            embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
+        result = data.get("result", {})
+        embed = discord.Embed(title="Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="ID", value=result.get("id"), inline=False)
+        embed.add_field(name="Name", value=result.get("name"), inline=False)
+        embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
+        embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
+        embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
+        embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
+        embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
+        embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
+        embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
+        embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @hyperdrive.command(name="patch")
     async def patch_hyperdrive(self, ctx, hyperdrive_id: str, *, changes: str):
         """Patch a specified Hyperdrive by its ID with provided changes."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3563,14 +3096,6 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
         try:
             changes_dict = json.loads(changes)
         except json.JSONDecodeError:
@@ -3581,44 +3106,36 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        async with self.session.patch(url, headers=headers, json=changes_dict) as response:
-            if response.status != 200:
-                await ctx.send(embed=discord.Embed(
-                    title="Error",
-                    description=f"Failed to patch Hyperdrive: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                ))
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                await ctx.send(embed=discord.Embed(
-                    title="Error",
-                    description="Failed to patch Hyperdrive.",
-                    color=discord.Color.from_str("#ff4545")
-                ))
-                return
+        try:
+            data = await self.api.call("PATCH", f"/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}", json=changes_dict)
+        except CloudflareAPIError as e:
+            await ctx.send(embed=discord.Embed(
+                title="Error",
+                description=f"Failed to patch Hyperdrive: {e}",
+                color=discord.Color.from_str("#ff4545")
+            ))
+            return
 
-            result = data.get("result", {})
-            embed = discord.Embed(title="Patched Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="ID", value=result.get("id"), inline=False)
-            embed.add_field(name="Name", value=result.get("name"), inline=False)
-            embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
-            embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
-            embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
-            embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
-            embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
-            embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
-            embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
-            embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
+        result = data.get("result", {})
+        embed = discord.Embed(title="Patched Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="ID", value=result.get("id"), inline=False)
+        embed.add_field(name="Name", value=result.get("name"), inline=False)
+        embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
+        embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
+        embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
+        embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
+        embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
+        embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
+        embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
+        embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @hyperdrive.command(name="update")
     async def update_hyperdrive(self, ctx, hyperdrive_id: str, changes: str):
         """Update and return the specified Hyperdrive configuration."""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3632,14 +3149,6 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
         try:
             changes_dict = json.loads(changes)
         except json.JSONDecodeError:
@@ -3650,38 +3159,30 @@ class Cloudflare(commands.Cog):
             ))
             return
 
-        async with self.session.put(url, headers=headers, json=changes_dict) as response:
-            if response.status != 200:
-                await ctx.send(embed=discord.Embed(
-                    title="Error",
-                    description=f"Failed to update Hyperdrive: {response.status}",
-                    color=discord.Color.from_str("#ff4545")
-                ))
-                return
-
-            data = await response.json()
-            if not data.get("success", False):
-                await ctx.send(embed=discord.Embed(
-                    title="Error",
-                    description="Failed to update Hyperdrive.",
-                    color=discord.Color.from_str("#ff4545")
-                ))
-                return
+        try:
+            data = await self.api.call("PUT", f"/accounts/{account_id}/hyperdrive/configs/{hyperdrive_id}", json=changes_dict)
+        except CloudflareAPIError as e:
+            await ctx.send(embed=discord.Embed(
+                title="Error",
+                description=f"Failed to update Hyperdrive: {e}",
+                color=discord.Color.from_str("#ff4545")
+            ))
+            return
 
-            result = data.get("result", {})
-            embed = discord.Embed(title="Updated Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="ID", value=result.get("id"), inline=False)
-            embed.add_field(name="Name", value=result.get("name"), inline=False)
-            embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
-            embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
-            embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
-            embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
-            embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
-            embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
-            embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
-            embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
+        result = data.get("result", {})
+        embed = discord.Embed(title="Updated Hyperdrive Information", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="ID", value=result.get("id"), inline=False)
+        embed.add_field(name="Name", value=result.get("name"), inline=False)
+        embed.add_field(name="Database", value=result["origin"].get("database"), inline=False)
+        embed.add_field(name="Host", value=result["origin"].get("host"), inline=False)
+        embed.add_field(name="Port", value=result["origin"].get("port"), inline=False)
+        embed.add_field(name="Scheme", value=result["origin"].get("scheme"), inline=False)
+        embed.add_field(name="User", value=result["origin"].get("user"), inline=False)
+        embed.add_field(name="Caching Disabled", value=result["caching"].get("disabled"), inline=False)
+        embed.add_field(name="Max Age", value=result["caching"].get("max_age"), inline=False)
+        embed.add_field(name="Stale While Revalidate", value=result["caching"].get("stale_while_revalidate"), inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
 
     @commands.is_owner()
@@ -3721,7 +3222,7 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3731,37 +3232,28 @@ class Cloudflare(commands.Cog):
             await ctx.send("Missing one or more required API tokens. Please check your configuration.")
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
         payload = {
             "name": name,
             "locationHint": location_hint
         }
 
-        async with self.session.post(url, headers=headers, json=payload) as response:
-            data = await response.json()
-            if response.status != 200 or not data.get("success", False):
-                errors = data.get("errors", [])
-                error_messages = "\n".join([error.get("message", "Unknown error") for error in errors])
-                await ctx.send(embed=discord.Embed(
-                    title="Error",
-                    description=f"Failed to create bucket: {error_messages}",
-                    color=discord.Color.from_str("#ff4545")
-                ))
-                return
+        try:
+            data = await self.api.call("POST", f"/accounts/{account_id}/r2/buckets", json=payload)
+        except CloudflareAPIError as e:
+            await ctx.send(embed=discord.Embed(
+                title="Error",
+                description=f"Failed to create bucket: {e}",
+                color=discord.Color.from_str("#ff4545")
+            ))
+            return
 
-            result = data.get("result", {})
-            embed = discord.Embed(title="Bucket Created", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="Name", value=f"**`{result.get('name')}`**", inline=False)
-            embed.add_field(name="Location", value=f"**`{result.get('location')}`**", inline=False)
-            embed.add_field(name="Creation Date", value=f"**`{result.get('creation_date')}`**", inline=False)
+        result = data.get("result", {})
+        embed = discord.Embed(title="Bucket Created", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="Name", value=f"**`{result.get('name')}`**", inline=False)
+        embed.add_field(name="Location", value=f"**`{result.get('location')}`**", inline=False)
+        embed.add_field(name="Creation Date", value=f"**`{result.get('creation_date')}`**", inline=False)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @r2.command(name="delete")
@@ -3791,7 +3283,7 @@ class Cloudflare(commands.Cog):
             await ctx.send("Bucket deletion cancelled.")
             return
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3801,34 +3293,24 @@ class Cloudflare(commands.Cog):
             await ctx.send("Missing one or more required API tokens. Please check your configuration.")
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
-        async with self.session.delete(url, headers=headers) as response:
-            data = await response.json()
-            if response.status != 200 or not data.get("success", False):
-                errors = data.get("errors", [])
-                error_messages = "\n".join([error.get("message", "Unknown error") for error in errors])
-                embed = discord.Embed(title="Bucket deletion failed", color=discord.Color.from_str("#ff4545"))
-                embed.add_field(name="Errors", value=f"**`{error_messages}`**", inline=False)
-                await ctx.send(embed=embed)
-                return
-
-            embed = discord.Embed(title="Bucket deleted successfully", color=discord.Color.from_str("#2BBD8E"))
-            embed.add_field(name="Bucket", value=f"**`{bucket_name}`**", inline=False)
+        try:
+            await self.api.call("DELETE", f"/accounts/{account_id}/r2/buckets/{bucket_name}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(title="Bucket deletion failed", color=discord.Color.from_str("#ff4545"))
+            embed.add_field(name="Errors", value=f"**`{e}`**", inline=False)
             await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(title="Bucket deleted successfully", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="Bucket", value=f"**`{bucket_name}`**", inline=False)
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @r2.command(name="info")
     async def getbucket(self, ctx, bucket_name: str):
         """Get info about an R2 bucket"""
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3839,48 +3321,37 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                data = await response.json()
-                if response.status != 200 or not data.get("success", False):
-                    errors = data.get("errors", [])
-                    error_messages = "\n".join([error.get("message", "Unknown error") for error in errors])
-                    embed = discord.Embed(title="Failed to fetch bucket info", color=0xff4545)
-                    embed.add_field(name="Errors", value=f"**`{error_messages}`**", inline=False)
-                    await ctx.send(embed=embed)
-                    return
-
-                bucket_info = data.get("result", {})
-                if not bucket_info:
-                    embed = discord.Embed(title="No Information Found", description="No information found for the specified bucket.", color=0xff4545)
-                    await ctx.send(embed=embed)
-                    return
-
-                embed = discord.Embed(title="Bucket Information", color=discord.Color.from_str("#2BBD8E"))
-                # Customize individual fields
-                if "name" in bucket_info:
-                    embed.add_field(name="Name", value=f"**`{bucket_info['name']}`**", inline=False)
-                if "creation_date" in bucket_info:
-                    embed.add_field(name="Creation Date", value=f"**`{bucket_info['creation_date']}`**", inline=False)
-                if "location" in bucket_info:
-                    embed.add_field(name="Location", value=f"**`{bucket_info['location'].upper()}`**", inline=False)
-                if "storage_class" in bucket_info:
-                    embed.add_field(name="Storage Class", value=f"**`{bucket_info['storage_class']}`**", inline=False)
-                
-                await ctx.send(embed=embed)
+            data = await self.api.call("GET", f"/accounts/{account_id}/r2/buckets/{bucket_name}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(title="Failed to fetch bucket info", color=0xff4545)
+            embed.add_field(name="Errors", value=f"**`{e}`**", inline=False)
+            await ctx.send(embed=embed)
+            return
         except RuntimeError as e:
             embed = discord.Embed(title="Runtime Error", description=f"An error occurred: {str(e)}", color=0xff4545)
             await ctx.send(embed=embed)
             return
-        
+
+        bucket_info = data.get("result", {})
+        if not bucket_info:
+            embed = discord.Embed(title="No Information Found", description="No information found for the specified bucket.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(title="Bucket Information", color=discord.Color.from_str("#2BBD8E"))
+        # Customize individual fields
+        if "name" in bucket_info:
+            embed.add_field(name="Name", value=f"**`{bucket_info['name']}`**", inline=False)
+        if "creation_date" in bucket_info:
+            embed.add_field(name="Creation Date", value=f"**`{bucket_info['creation_date']}`**", inline=False)
+        if "location" in bucket_info:
+            embed.add_field(name="Location", value=f"**`{bucket_info['location'].upper()}`**", inline=False)
+        if "storage_class" in bucket_info:
+            embed.add_field(name="Storage Class", value=f"**`{bucket_info['storage_class']}`**", inline=False)
+
+        await ctx.send(embed=embed)
+
     @commands.is_owner()
     @r2.command(name="stash", help="Upload a file to the specified R2 bucket")
     async def upload_to_bucket(self, ctx, bucket_name: str):
@@ -3900,7 +3371,7 @@ class Cloudflare(commands.Cog):
 
         file_content = await attachment.read()
 
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3911,51 +3382,40 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{attachment.filename}"
-        headers = {
-            "Content-Type": "application/octet-stream",
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
         try:
             start_time = time.monotonic()
-            async with self.session.put(url, headers=headers, data=file_content) as response:
-                end_time = time.monotonic()
-                data = await response.json()
-                if response.status != 200 or not data.get("success", False):
-                    errors = data.get("errors", [])
-                    error_messages = "\n".join([error.get("message", "Unknown error") for error in errors])
-                    embed = discord.Embed(title="Failed to upload file", color=0xff4545)
-                    embed.add_field(name="Errors", value=f"**`{error_messages}`**", inline=False)
-                    await ctx.send(embed=embed)
-                    return
-
-                upload_time = end_time - start_time
-                embed = discord.Embed(title="File Uploaded Successfully", color=discord.Color.from_str("#2BBD8E"))
-                embed.add_field(name="File Name", value=f"**`{attachment.filename}`**", inline=False)
-                embed.add_field(name="Bucket Name", value=f"**`{bucket_name}`**", inline=False)
-                def format_file_size(size):
-                    for unit in ['bytes', 'KB', 'MB', 'GB', 'TB']:
-                        if size < 1024.0:
-                            return f"**`{size:.2f} {unit}`**"
-                        size /= 1024.0
-                    return f"**`{size:.2f} PB`**"  # In case the file is extremely large
-
-                embed.add_field(name="File Size", value=format_file_size(attachment.size), inline=False)
-                embed.add_field(name="Upload Time", value=f"**`{upload_time:.2f} seconds`**", inline=False)
-                await ctx.send(embed=embed)
+            await self.api.call("PUT", f"/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{attachment.filename}", headers={"Content-Type": "application/octet-stream"}, data=file_content)
+            end_time = time.monotonic()
+        except CloudflareAPIError as e:
+            embed = discord.Embed(title="Failed to upload file", color=0xff4545)
+            embed.add_field(name="Errors", value=f"**`{e}`**", inline=False)
+            await ctx.send(embed=embed)
+            return
         except RuntimeError as e:
             embed = discord.Embed(title="Runtime Error", description=f"An error occurred: {str(e)}", color=0xff4545)
             await ctx.send(embed=embed)
             return
-        
+
+        upload_time = end_time - start_time
+        embed = discord.Embed(title="File Uploaded Successfully", color=discord.Color.from_str("#2BBD8E"))
+        embed.add_field(name="File Name", value=f"**`{attachment.filename}`**", inline=False)
+        embed.add_field(name="Bucket Name", value=f"**`{bucket_name}`**", inline=False)
+        def format_file_size(size):
+            for unit in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+                if size < 1024.0:
+                    return f"**`{size:.2f} {unit}`**"
+                size /= 1024.0
+            return f"**`{size:.2f} PB`**"  # In case the file is extremely large
+
+        embed.add_field(name="File Size", value=format_file_size(attachment.size), inline=False)
+        embed.add_field(name="Upload Time", value=f"**`{upload_time:.2f} seconds`**", inline=False)
+        await ctx.send(embed=embed)
+
     @commands.is_owner()
     @r2.command(name="recycle")
     async def delete_file(self, ctx, bucket_name: str, file_name: str):
         """Delete a file by name from an R2 bucket"""
-        api_tokens = await self.bot.get_shared_api_tokens("cloudflare")
+        api_tokens = await self.api.credentials()
         api_key = api_tokens.get("api_key")
         email = api_tokens.get("email")
         bearer_token = api_tokens.get("bearer_token")
@@ -3970,45 +3430,20 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
-
-        file_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{file_name}"
         try:
-            async with self.session.delete(file_url, headers=headers) as delete_response:
-                delete_data = await delete_response.json()
-                if delete_response.status != 200 or not delete_data.get("success", False):
-                    delete_error_messages = "\n".join([error.get("message", "Unknown error") for error in delete_data.get("errors", [])])
-                    embed = discord.Embed(
-                        title="Failed to delete file",
-                        color=0xff4545
-                    )
-                    embed.add_field(
-                        name="Errors",
-                        value=f"**`{delete_error_messages}`**",
-                        inline=False
-                    )
-                    await ctx.send(embed=embed)
-                    return
-
-                embed = discord.Embed(
-                    title="File deleted from bucket",
-                    color=discord.Color.from_str("#2BBD8E")
-                )
-                embed.add_field(
-                    name="File name",
-                    value=f"**`{file_name}`**",
-                    inline=False
-                )
-                embed.add_field(
-                    name="Bucket targeted",
-                    value=f"**`{bucket_name}`**",
-                    inline=False
-                )
-                await ctx.send(embed=embed)
+            await self.api.call("DELETE", f"/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{file_name}")
+        except CloudflareAPIError as e:
+            embed = discord.Embed(
+                title="Failed to delete file",
+                color=0xff4545
+            )
+            embed.add_field(
+                name="Errors",
+                value=f"**`{e}`**",
+                inline=False
+            )
+            await ctx.send(embed=embed)
+            return
         except Exception as e:
             embed = discord.Embed(
                 title="Error",
@@ -4017,13 +3452,28 @@ class Cloudflare(commands.Cog):
             )
             await ctx.send(embed=embed)
             return
-        
+
+        embed = discord.Embed(
+            title="File deleted from bucket",
+            color=discord.Color.from_str("#2BBD8E")
+        )
+        embed.add_field(
+            name="File name",
+            value=f"**`{file_name}`**",
+            inline=False
+        )
+        embed.add_field(
+            name="Bucket targeted",
+            value=f"**`{bucket_name}`**",
+            inline=False
+        )
+        await ctx.send(embed=embed)
 
     @commands.is_owner()
     @r2.command(name="fetch")
     async def fetch_file(self, ctx, bucket_name: str, file_name: str):
         """Fetch a file from an R2 bucket"""
-        api_info = await self.bot.get_shared_api_tokens("cloudflare")
+        api_info = await self.api.credentials()
         bearer_token = api_info.get("bearer_token")
         email = api_info.get("email")
         api_key = api_info.get("api_key")
@@ -4037,15 +3487,11 @@ class Cloudflare(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{file_name}"
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "X-Auth-Email": email,
-            "X-Auth-Key": api_key,
-        }
+        url = f"{API_BASE}/accounts/{account_id}/r2/buckets/{bucket_name}/objects/{file_name}"
+        headers = await self.api.auth_headers()
 
         try:
-            async with self.session.get(url, headers=headers) as response:
+            async with self.api.request("GET", url, headers=headers) as response:
                 if response.status == 413:
                     embed = discord.Embed(
                         title="Error",
@@ -4056,9 +3502,8 @@ class Cloudflare(commands.Cog):
                     return
 
                 if response.status != 200:
-                    data = await response.json()
-                    errors = data.get("errors", [])
-                    error_messages = "\n".join([error.get("message", "Unknown error") for error in errors])
+                    data = await response.json(content_type=None)
+                    error_messages = format_errors(data, response.status)
                     embed = discord.Embed(
                         title="Failed to fetch file by name",
                         color=0xff4545
@@ -4071,9 +3516,16 @@ class Cloudflare(commands.Cog):
                     await ctx.send(embed=embed)
 
                     # Additional logic to fetch by other attributes
-                    list_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/r2/buckets/{bucket_name}/objects"
-                    async with self.session.get(list_url, headers=headers) as list_response:
-                        if list_response.status == 413:
+                    list_path = f"/accounts/{account_id}/r2/buckets/{bucket_name}/objects"
+                    file_url = None
+                    try:
+                        # Only keys starting with the name can match, and listing stops at the first hit
+                        async for obj in self.api.paginate(list_path, params={"prefix": file_name}, per_page=1000, key="objects"):
+                            if obj.get("name", obj.get("key")) == file_name and obj.get("url"):
+                                file_url = obj["url"]
+                                break
+                    except CloudflareAPIError as e:
+                        if e.status == 413:
                             embed = discord.Embed(
                                 title="Error",
                                 description="413 Payload Too Large (error code: 40005): Request entity too large",
@@ -4082,74 +3534,66 @@ class Cloudflare(commands.Cog):
                             await ctx.send(embed=embed)
                             return
 
-                        if list_response.status != 200:
-                            list_data = await list_response.json()
-                            list_errors = list_data.get("errors", [])
-                            list_error_messages = "\n".join([error.get("message", "Unknown error") for error in list_errors])
-                            embed = discord.Embed(
-                                title="Failed to list files in bucket",
-                                color=0xff4545
-                            )
-                            embed.add_field(
-                                name="Errors",
-                                value=f"**`{list_error_messages}`**",
-                                inline=False
-                            )
-                            await ctx.send(embed=embed)
-                            return
-
-                        list_data = await list_response.json()
-                        objects = list_data.get("result", {}).get("objects", [])
-                        for obj in objects:
-                            if obj.get("name") == file_name:
-                                file_url = obj.get("url")
-                                async with self.session.get(file_url, headers=headers) as file_response:
-                                    if file_response.status == 413:
-                                        embed = discord.Embed(
-                                            title="Error",
-                                            description="413 Payload Too Large (error code: 40005): Request entity too large",
-                                            color=0xff4545
-                                        )
-                                        await ctx.send(embed=embed)
-                                        return
-
-                                    if file_response.status == 200:
-                                        file_size = int(file_response.headers.get("Content-Length", 0))
-                                        if file_size > 100 * 1024 * 1024:  # 100 MB
-                                            embed = discord.Embed(
-                                                title="File too large",
-                                                description="The file size exceeds the 100 MB limit.",
-                                                color=0xff4545
-                                            )
-                                            await ctx.send(embed=embed)
-                                            return
-
-                                        file_content = await file_response.read()
-                                        embed = discord.Embed(
-                                            title="File fetched from bucket",
-                                            color=discord.Color.from_str("#2BBD8E"))
-                                        embed.add_field(
-                                            name="File name",
-                                            value=f"**`{file_name}`**",
-                                            inline=False
-                                        )
-                                        embed.add_field(
-                                            name="Bucket targeted",
-                                            value=f"**`{bucket_name}`**",
-                                            inline=False
-                                        )
-                                        await ctx.send(embed=embed)
-                                        await ctx.send(file=discord.File(io.BytesIO(file_content), filename=file_name))
-                                        return
-
                         embed = discord.Embed(
-                            title="File not found",
-                            description="The file could not be found by name or other attributes.",
+                            title="Failed to list files in bucket",
                             color=0xff4545
                         )
+                        embed.add_field(
+                            name="Errors",
+                            value=f"**`{e}`**",
+                            inline=False
+                        )
                         await ctx.send(embed=embed)
                         return
 
+                    if file_url:
+                        async with self.api.request("GET", file_url, headers=headers) as file_response:
+                            if file_response.status == 413:
+                                embed = discord.Embed(
+                                    title="Error",
+                                    description="413 Payload Too Large (error code: 40005): Request entity too large",
+                                    color=0xff4545
+                                )
+                                await ctx.send(embed=embed)
+                                return
+
+                            if file_response.status == 200:
+                                file_size = int(file_response.headers.get("Content-Length", 0))
+                                if file_size > 100 * 1024 * 1024:  # 100 MB
+                                    embed = discord.Embed(
+                                        title="File too large",
+                                        description="The file size exceeds the 100 MB limit.",
+                                        color=0xff4545
+                                    )
+                                    await ctx.send(embed=embed)
+                                    return
+
+                                file_content = await file_response.read()
+                                embed = discord.Embed(
+                                    title="File fetched from bucket",
+                                    color=discord.Color.from_str("#2BBD8E"))
+                                embed.add_field(
+                                    name="File name",
+                                    value=f"**`{file_name}`**",
+                                    inline=False
+                                )
+                                embed.add_field(
+                                    name="Bucket targeted",
+                                    value=f"**`{bucket_name}`**",
+                                    inline=False
+                                )
+                                await ctx.send(embed=embed)
+                                await ctx.send(file=discord.File(io.BytesIO(file_content), filename=file_name))
+                                return
+
+                    embed = discord.Embed(
+                        title="File not found",
+                        description="The file could not be found by name or other attributes.",
+                        color=0xff4545
+                    )
+                    await ctx.send(embed=embed)
+                    return
+
                 file_size = int(response.headers.get("Content-Length", 0))
                 if file_size > 100 * 1024 * 1024:  # 100 MB
                     embed = discord.Embed(
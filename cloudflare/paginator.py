@@ -0,0 +1,173 @@
+import asyncio
+import csv
+import io
+import tempfile
+
+import discord #type: ignore
+
+# Rows written to an export per executor call
+EXPORT_BATCH = 500
+# Upload limit outside a guild, where there's no boost tier to raise it
+DEFAULT_FILESIZE_LIMIT = 10 * 1024 * 1024
+
+
+class StreamPaginator(discord.ui.View):
+    """
+    Button paginator over an async iterator of API results, such as `CloudflareAPI.paginate`.
+
+    `source()` returns a fresh iterator, which is read `per_page` items at a time as the user
+    moves forward; `render(items, index)` turns one page of items into an embed. Only rendered
+    embeds are kept, so a listing of tens of thousands of objects is never held in memory or
+    squeezed into one embed. If `export_row(item)` is given, an export button re-reads the whole
+    listing into a CSV spooled to disk and uploads it.
+    """
+
+    def __init__(self, author, source, render, per_page=10, export_row=None, export_name="export.csv", timeout=180):
+        super().__init__(timeout=timeout)
+        self.author = author
+        self.source = source
+        self.render = render
+        self.per_page = per_page
+        self.export_row = export_row
+        self.export_name = export_name
+        self.index = 0
+        self.message = None
+        self._items = source()
+        self._pages = []
+        self._exhausted = False
+        # Async generators can't be advanced by two flips at once
+        self._lock = asyncio.Lock()
+        if export_row is None:
+            self.remove_item(self.export)
+
+    async def start(self, ctx):
+        """Send the first page. Returns False, sending nothing, if the listing is empty."""
+        embed = await self._show(0)
+        if embed is None:
+            return False
+        self.message = await ctx.send(embed=embed, view=self)
+        return True
+
+    async def _page(self, index):
+        async with self._lock:
+            while index >= len(self._pages) and not self._exhausted:
+                items = []
+                while len(items) < self.per_page:
+                    try:
+                        items.append(await self._items.__anext__())
+                    except StopAsyncIteration:
+                        self._exhausted = True
+                        break
+                if items:
+                    self._pages.append(self.render(items, len(self._pages)))
+        return self._pages[index] if index < len(self._pages) else None
+
+    async def _show(self, index):
+        embed = await self._page(index)
+        if embed is None:
+            return None
+        # Reading one page ahead tells us whether there is a next page; it's usually already buffered
+        has_next = await self._page(index + 1) is not None
+        self.index = index
+        self.previous_page.disabled = index == 0
+        self.next_page.disabled = not has_next
+        total = f" of {len(self._pages)}" if self._exhausted else ""
+        embed.set_footer(text=f"Page {index + 1}{total}")
+        return embed
+
+    async def _flip(self, interaction, index):
+        # The next page may need another API call, so acknowledge first and edit once it's ready
+        await interaction.response.defer()
+        try:
+            embed = await self._show(index)
+        except Exception as e:
+            print(f"Error loading page {index + 1}: {e}")
+            return
+        if embed is not None:
+            await interaction.edit_original_response(embed=embed, view=self)
+
+    async def interaction_check(self, interaction):
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("Only the person who ran this command can use these controls.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(view=None)
+        except discord.HTTPException:
+            pass
+
+    @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction, button):
+        await self._flip(interaction, self.index - 1)
+
+    @discord.ui.button(emoji="❌", style=discord.ButtonStyle.secondary)
+    async def stop_paging(self, interaction, button):
+        self.stop()
+        await interaction.response.defer()
+        await interaction.delete_original_response()
+
+    @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction, button):
+        await self._flip(interaction, self.index + 1)
+
+    @discord.ui.button(emoji="📄", style=discord.ButtonStyle.secondary)
+    async def export(self, interaction, button):
+        button.disabled = True
+        await interaction.response.edit_message(view=self)
+        guild = interaction.guild
+        limit = guild.filesize_limit if guild else DEFAULT_FILESIZE_LIMIT
+        try:
+            file = await self._export(limit)
+        except Exception as e:
+            print(f"Error exporting {self.export_name}: {e}")
+            await interaction.followup.send("The export failed, try again later.", ephemeral=True)
+        else:
+            if file is None:
+                await interaction.followup.send("The export is larger than this channel's upload limit.", ephemeral=True)
+            else:
+                await interaction.followup.send(file=file)
+        button.disabled = False
+        if not self.is_finished():
+            await interaction.edit_original_response(view=self)
+
+    async def _export(self, limit):
+        """Write every item to a temporary CSV file. Returns a `discord.File`, or None if it outgrew `limit`."""
+        loop = asyncio.get_running_loop()
+        fp = await loop.run_in_executor(None, tempfile.TemporaryFile)
+        try:
+            fieldnames = None
+            rows = []
+            async for item in self.source():
+                rows.append(self.export_row(item))
+                if len(rows) >= EXPORT_BATCH:
+                    fieldnames = fieldnames or list(rows[0])
+                    size = await loop.run_in_executor(None, self._write_rows, fp, fieldnames, rows)
+                    rows = []
+                    if size > limit:
+                        fp.close()
+                        return None
+            if rows:
+                fieldnames = fieldnames or list(rows[0])
+                size = await loop.run_in_executor(None, self._write_rows, fp, fieldnames, rows)
+                if size > limit:
+                    fp.close()
+                    return None
+            fp.seek(0)
+        except BaseException:
+            fp.close()
+            raise
+        return discord.File(fp, filename=self.export_name)
+
+    @staticmethod
+    def _write_rows(fp, fieldnames, rows):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+        if fp.tell() == 0:
+            writer.writeheader()
+        writer.writerows(rows)
+        fp.write(buffer.getvalue().encode('utf-8'))
+        return fp.tell()
@@ -3,6 +3,9 @@ import discord #type: ignore
 import asyncio
 from redbot.core import commands, Config #type: ignore
 
+# Hyperlinks and bare URLs, stripped in a single pass before pattern matching
+HYPERLINK_OR_URL_PATTERN = re.compile(r'\[.*?\]\(.*?\)|https?://\S+')
+
 class InfoControl(commands.Cog):
     """Detect and remove potentially sensitive information from chat."""
     
@@ -57,12 +60,7 @@ class InfoControl(commands.Cog):
         content = re.sub(r'<#[0-9]+>', '', content)  # Channel mentions
 
         # Ignore content inside hyperlinks and URLs
-        def remove_hyperlinks_and_urls(text):
-            text = re.sub(r'\[.*?\]\(.*?\)', '', text)  # Hyperlinks
-            text = re.sub(r'https?://\S+', '', text)  # URLs
-            return text
-
-        content = remove_hyperlinks_and_urls(content)
+        content = HYPERLINK_OR_URL_PATTERN.sub('', content)
 
         # Ignore discord user ID's, message ID's, and channel ID's
         content = re.sub(r'\b\d{17,19}\b', '', content)  # Discord ID's
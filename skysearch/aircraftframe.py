@@ -0,0 +1,98 @@
+import csv
+import html
+import math
+from array import array
+
+# Frame attribute -> airplanes.live key for the columns kept as typed arrays
+NUMERIC_COLUMNS = {
+    'lat': 'lat',
+    'lon': 'lon',
+    'alt': 'alt_baro',
+    'speed': 'gs',
+    'heading': 'track',
+}
+
+
+def _to_float(value):
+    # alt_baro is the string "ground" for aircraft on the ground
+    if value == 'ground':
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class AircraftFrame:
+    """
+    Column-oriented view of an airplanes.live `ac` list.
+
+    The schema is the union of every aircraft's keys in first-seen order, so rows with
+    different keys stay aligned. Position, altitude, speed and heading are also kept as
+    float arrays (NaN where missing) for bulk numeric work.
+    """
+
+    def __init__(self, aircraft_list):
+        self.columns = []
+        self._data = {}
+        self._length = 0
+        for name in NUMERIC_COLUMNS:
+            setattr(self, name, array('d'))
+        for aircraft in aircraft_list:
+            self.append(aircraft)
+
+    def append(self, aircraft):
+        for key, value in aircraft.items():
+            column = self._data.get(key)
+            if column is None:
+                self.columns.append(key)
+                # Aircraft seen before this key first appeared get an empty cell
+                column = self._data[key] = [None] * self._length
+            column.append(value)
+        self._length += 1
+        for column in self._data.values():
+            if len(column) < self._length:
+                column.append(None)
+        for name, key in NUMERIC_COLUMNS.items():
+            getattr(self, name).append(_to_float(aircraft.get(key)))
+
+    def __len__(self):
+        return self._length
+
+    def add_column(self, key, values):
+        """Add a derived column, one value per aircraft, to the end of the schema."""
+        if key not in self._data:
+            self.columns.append(key)
+        self._data[key] = list(values)
+
+    def column(self, key):
+        return self._data.get(key, [None] * self._length)
+
+    def rows(self, columns=None):
+        """Yield each aircraft as a list of strings aligned to `columns` (the full schema by default)."""
+        columns = self.columns if columns is None else columns
+        data = [self.column(key) for key in columns]
+        for index in range(self._length):
+            yield ['' if column[index] is None else str(column[index]) for column in data]
+
+    def write_csv(self, file):
+        writer = csv.writer(file)
+        writer.writerow([key.upper() for key in self.columns])
+        writer.writerows(self.rows())
+
+    def write_txt(self, file):
+        file.write(' '.join(key.upper() for key in self.columns) + '\n')
+        for row in self.rows():
+            file.write(' '.join(row) + '\n')
+
+    def write_html(self, file):
+        file.write('<table>\n<tr>\n')
+        for key in self.columns:
+            file.write(f'<th>{html.escape(key.upper())}</th>\n')
+        file.write('</tr>\n')
+        for row in self.rows():
+            file.write('<tr>\n')
+            for value in row:
+                file.write(f'<td>{html.escape(value)}</td>\n')
+            file.write('</tr>\n')
+        file.write('</table>\n')
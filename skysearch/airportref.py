@@ -0,0 +1,202 @@
+import asyncio
+import bisect
+import csv
+import os
+import time
+from typing import NamedTuple
+
+import aiohttp #type: ignore
+
+OURAIRPORTS_URL = "https://davidmegginson.github.io/ourairports-data/{name}.csv"
+DATASETS = ["airports", "runways", "navaids"]
+
+
+class Airport(NamedTuple):
+    ident: str
+    icao: str
+    iata: str
+    type: str
+    name: str
+    latitude: float
+    longitude: float
+    elevation_ft: str
+    country_code: str
+    region: str
+    municipality: str
+    home_link: str
+
+
+class Runway(NamedTuple):
+    length_ft: str
+    width_ft: str
+    surface: str
+    lighted: str
+    closed: str
+    le_ident: str
+    le_heading: str
+    he_ident: str
+    he_heading: str
+
+
+class Navaid(NamedTuple):
+    ident: str
+    name: str
+    type: str
+    frequency_khz: str
+    latitude: str
+    longitude: str
+    elevation_ft: str
+    usage_type: str
+    power: str
+
+
+class AirportReference:
+    """
+    Local copy of the OurAirports airport, runway and navaid datasets.
+
+    The CSVs are cached in the cog's data folder and refreshed from OurAirports once they are
+    older than `REFRESH_AFTER`. Airports are indexed by ICAO and IATA code for constant-time
+    lookups, with sorted code and name lists for prefix search. Closed airports are skipped.
+    """
+
+    REFRESH_AFTER = 7 * 24 * 60 * 60
+
+    def __init__(self, http, path):
+        self.http = http
+        self.path = path
+        self._airports = {}
+        self._iata = {}
+        # Runways and navaids are keyed by OurAirports ident rather than ICAO code
+        self._runways = {}
+        self._navaids = {}
+        # Sorted (key, ICAO code) pairs for prefix search over lowercased codes and names
+        self._search_keys = []
+        self._loaded = asyncio.Event()
+
+    def __len__(self):
+        return len(self._airports)
+
+    async def refresh(self, force=False):
+        """Download any dataset that's missing or stale, then (re)build the indexes from disk."""
+        try:
+            downloaded = False
+            for name in DATASETS:
+                file_path = self._file_path(name)
+                if force or not os.path.exists(file_path) or time.time() - os.path.getmtime(file_path) > self.REFRESH_AFTER:
+                    try:
+                        await self._download(name)
+                        downloaded = True
+                    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                        print(f"Error downloading {name} reference data: {e}")
+            if downloaded or not self._loaded.is_set():
+                loop = asyncio.get_running_loop()
+                try:
+                    indexes = await loop.run_in_executor(None, self._build)
+                    self._airports, self._iata, self._runways, self._navaids, self._search_keys = indexes
+                except (OSError, ValueError, KeyError, csv.Error) as e:
+                    print(f"Error loading airport reference data: {e}")
+        finally:
+            # Lookups wait on this, so it's set even if loading failed; they then just find nothing
+            self._loaded.set()
+
+    async def airport(self, code):
+        """Look up an airport by 4-character ICAO or 3-character IATA code."""
+        await self._loaded.wait()
+        code = code.upper()
+        if len(code) == 3:
+            return self._iata.get(code)
+        return self._airports.get(code)
+
+    async def runways(self, airport):
+        await self._loaded.wait()
+        return self._runways.get(airport.ident, [])
+
+    async def navaids(self, airport):
+        await self._loaded.wait()
+        return self._navaids.get(airport.ident, [])
+
+    async def search(self, query, limit=10):
+        """Return up to `limit` airports whose code or name starts with `query`."""
+        await self._loaded.wait()
+        query = query.lower()
+        results = {}
+        index = bisect.bisect_left(self._search_keys, (query, ''))
+        while index < len(self._search_keys) and len(results) < limit:
+            key, code = self._search_keys[index]
+            if not key.startswith(query):
+                break
+            results.setdefault(code, self._airports[code])
+            index += 1
+        return list(results.values())
+
+    def _file_path(self, name):
+        return os.path.join(self.path, f"ourairports_{name}.csv")
+
+    async def _download(self, name):
+        async with self.http.session.get(OURAIRPORTS_URL.format(name=name), timeout=aiohttp.ClientTimeout(total=120)) as response:
+            response.raise_for_status()
+            data = await response.read()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write, name, data)
+
+    def _write(self, name, data):
+        file_path = self._file_path(name)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+
+    def _rows(self, name):
+        file_path = self._file_path(name)
+        if not os.path.exists(file_path):
+            return
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+
+    def _build(self):
+        airports = {}
+        iata = {}
+        idents = {}
+        for row in self._rows("airports"):
+            if row['type'] == 'closed':
+                continue
+            try:
+                latitude, longitude = float(row['latitude_deg']), float(row['longitude_deg'])
+            except ValueError:
+                continue
+            icao = row.get('icao_code') or row['gps_code'] or row['ident']
+            airport = Airport(
+                row['ident'], icao, row['iata_code'], row['type'], row['name'], latitude, longitude,
+                row['elevation_ft'], row['iso_country'], row['iso_region'], row['municipality'], row['home_link'],
+            )
+            idents[airport.ident] = airport
+            # Several small fields can share a code; prefer the one that isn't a heliport or seaplane base
+            if icao not in airports or airports[icao].type in ['heliport', 'seaplane_base']:
+                airports[icao] = airport
+            if airport.iata and (airport.iata not in iata or airport.type == 'large_airport'):
+                iata[airport.iata] = airport
+
+        runways = {}
+        for row in self._rows("runways"):
+            if row['airport_ident'] in idents:
+                runways.setdefault(row['airport_ident'], []).append(Runway(
+                    row['length_ft'], row['width_ft'], row['surface'], row['lighted'], row['closed'],
+                    row['le_ident'], row['le_heading_degT'], row['he_ident'], row['he_heading_degT'],
+                ))
+
+        navaids = {}
+        for row in self._rows("navaids"):
+            if row['associated_airport'] in idents:
+                navaids.setdefault(row['associated_airport'], []).append(Navaid(
+                    row['ident'], row['name'], row['type'], row['frequency_khz'], row['latitude_deg'],
+                    row['longitude_deg'], row['elevation_ft'], row['usageType'], row['power'],
+                ))
+
+        search_keys = []
+        for code, airport in airports.items():
+            search_keys.append((code.lower(), code))
+            search_keys.append((airport.name.lower(), code))
+            if airport.iata:
+                search_keys.append((airport.iata.lower(), code))
+        search_keys.sort()
+        return airports, iata, runways, navaids, search_keys
@@ -0,0 +1,129 @@
+from .icao_codes import ICAO_TAGS
+from .spatialindex import distance_nm
+
+# airplanes.live caps /point queries at 250 nautical miles, so a fence has to fit inside one
+MAX_FENCE_RADIUS = 250
+# Seconds an aircraft must be missing from a fence before it counts as having left, so a
+# dropped position report doesn't produce an exit and a re-entry
+EXIT_GRACE = 90
+
+
+def point_in_polygon(lat, lon, points):
+    """Ray-casting containment test. Fences are small enough to treat lat/lon as planar."""
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        lat_i, lon_i = points[i]
+        lat_j, lon_j = points[j]
+        if (lon_i > lon) != (lon_j > lon) and lat < (lat_j - lat_i) * (lon - lon_i) / (lon_j - lon_i) + lat_i:
+            inside = not inside
+        j = i
+    return inside
+
+
+class Fence:
+    """
+    A guild's watch zone: a circle (centre plus radius in nautical miles) or a polygon of
+    `[lat, lon]` points, with an optional list of ICAO tags an aircraft must carry to count.
+    """
+
+    def __init__(self, guild_id, name, zone):
+        self.guild_id = guild_id
+        self.name = name
+        self.channel_id = zone['channel']
+        self.tags = zone.get('tags', [])
+        self.tag_mask = 0
+        for tag in self.tags:
+            self.tag_mask |= ICAO_TAGS[tag][0]
+        self.points = zone.get('points')
+        if self.points:
+            # Polygons are fetched as the smallest circle around their centroid that covers every vertex
+            self.lat = sum(point[0] for point in self.points) / len(self.points)
+            self.lon = sum(point[1] for point in self.points) / len(self.points)
+            self.radius = max(distance_nm(self.lat, self.lon, *point) for point in self.points)
+        else:
+            self.lat, self.lon, self.radius = zone['lat'], zone['lon'], zone['radius']
+
+    @property
+    def key(self):
+        return self.guild_id, self.name
+
+    def contains(self, grid):
+        """Return the row indices of the aircraft in a snapshot's grid that are inside this fence."""
+        candidates = grid.within_radius(self.lat, self.lon, self.radius)
+        if not self.points:
+            return [index for _, index in candidates]
+        return [index for _, index in candidates if point_in_polygon(grid.frame.lat[index], grid.frame.lon[index], self.points)]
+
+
+class GeofenceEngine:
+    """
+    Tracks which aircraft are inside every guild's watch zones.
+
+    Each poll, `evaluate` is given the aircraft around a fence and returns the aircraft that
+    entered or left it since the previous poll. An aircraft is only reported once per visit,
+    and only counts as gone once it has been missing for `EXIT_GRACE` seconds.
+    The first evaluation of a fence just records who is already inside, so loading the cog or
+    adding a zone doesn't announce every aircraft currently in it.
+    """
+
+    def __init__(self, icao_tags):
+        self.icao_tags = icao_tags
+        self.fences = {}
+        # (guild_id, name) -> {hex: [aircraft, last_seen]} currently inside, or absent before the first evaluation
+        self._inside = {}
+
+    def set_guild_fences(self, guild_id, zones):
+        previous = {key: self.fences.pop(key) for key in [key for key in self.fences if key[0] == guild_id]}
+        for name, zone in zones.items():
+            fence = Fence(guild_id, name, zone)
+            self.fences[fence.key] = fence
+            old = previous.get(fence.key)
+            # A zone that was moved, resized or refiltered starts over
+            if old is None or (old.lat, old.lon, old.radius, old.points, old.tag_mask) != (fence.lat, fence.lon, fence.radius, fence.points, fence.tag_mask):
+                self._inside.pop(fence.key, None)
+        for key in [key for key in self._inside if key not in self.fences]:
+            del self._inside[key]
+
+    def snapshot_plan(self, max_radius=MAX_FENCE_RADIUS):
+        """
+        Group every fence into as few /point snapshots as possible, whichever guild it belongs to.
+
+        Returns `[lat, lon, radius, fences]` entries whose circle covers each of their fences. Fences
+        are placed largest first, each joining the first snapshot that can stretch to cover it
+        without exceeding `max_radius`, so the plan is stable while the fences don't change.
+        """
+        plan = []
+        for fence in sorted(self.fences.values(), key=lambda fence: (-fence.radius, fence.key)):
+            for snapshot in plan:
+                reach = distance_nm(snapshot[0], snapshot[1], fence.lat, fence.lon) + fence.radius
+                if reach <= max_radius:
+                    snapshot[2] = max(snapshot[2], reach)
+                    snapshot[3].append(fence)
+                    break
+            else:
+                plan.append([fence.lat, fence.lon, fence.radius, [fence]])
+        return plan
+
+    def evaluate(self, fence, grid, aircraft_list, now):
+        """Return `(entered, exited)` lists of aircraft for one fence against the snapshot covering it."""
+        seeding = fence.key not in self._inside
+        inside = self._inside.setdefault(fence.key, {})
+        entered = []
+        for index in fence.contains(grid):
+            aircraft = aircraft_list[index]
+            hex_id = aircraft.get('hex', '').upper()
+            if not hex_id:
+                continue
+            if fence.tag_mask and not self.icao_tags.lookup(hex_id) & fence.tag_mask:
+                continue
+            if hex_id not in inside and not seeding:
+                entered.append(aircraft)
+            inside[hex_id] = [aircraft, now]
+
+        exited = []
+        for hex_id, (aircraft, last_seen) in list(inside.items()):
+            if now - last_seen >= EXIT_GRACE:
+                exited.append(aircraft)
+                del inside[hex_id]
+        return entered, exited
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import aiohttp #type: ignore
+
+
+class TokenBucket:
+    """
+    Async token bucket. Callers wait until a token is available, so requests are paced rather than rejected.
+
+    Background callers only take a token while no foreground caller is waiting, so polling loops
+    use spare capacity and never hold up interactive commands.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._foreground_waiting = 0
+
+    async def acquire(self, background=False):
+        if not background:
+            self._foreground_waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1 and (not background or not self._foreground_waiting):
+                    self._tokens -= 1
+                    return
+                # Checking and taking a token never awaits, so waiters can sleep without holding a lock
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                else:
+                    # A token is free, but a foreground caller is about to take it
+                    await asyncio.sleep(1 / self.rate)
+        finally:
+            if not background:
+                self._foreground_waiting -= 1
+
+
+class SkysearchHTTP:
+    """
+    Shared HTTP client for SkySearch.
+
+    Every upstream call goes through one pooled session. Requests to airplanes.live are paced
+    by a token bucket matching its published limit of one request per second.
+    """
+
+    AIRPLANES_LIVE_RATE = 1
+    AIRPLANES_LIVE_BURST = 1
+
+    def __init__(self):
+        self._session = None
+        self.airplanes_live_limiter = TokenBucket(self.AIRPLANES_LIVE_RATE, self.AIRPLANES_LIVE_BURST)
+
+    @property
+    def session(self):
+        # Created lazily so the session binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+        return self._session
+
+    async def get_json(self, url, params=None, rate_limited=False, background=False):
+        """GET a URL and decode its JSON body. Errors propagate to the caller."""
+        if rate_limited:
+            await self.airplanes_live_limiter.acquire(background=background)
+        async with self.session.get(url, params=params) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
@@ -1,23 +1,81 @@
-law_enforcement_icao_set = {
-    'ADDF5C', 'A2F41D', 'A22B45', 'ADAF98', 'A63F2A', 'A7C624', 'ADEE38', 'A4C7EB', 'A6A688', 'A82598', 'A8DD00', 'A10941', 'AB68C8', 'A9A449', 'A67117', 'A03325', 'A1B4BB', 'A2C934', 'AD933E', 'AC6E92', 'A64D15', 'A6A665', 'A97B90', 'A7C42B', 'A92BFF', 'ACD25B', 'AD4835', 'A68A37', 'AD40C7', 'ADBABD', 'A2C211', 'A4CA8E', 'AC9C61', 'A19FE9', 'A9F7DD', 'ACBEAA', 'ACB1F5', 'AC031D', 'A524BC', 'AB3861', 'A65512', 'A81E2A', 'A1ED21', 'AD3959', 'A1DCB0', 'A3917E', 'A1DA3B', 'A8B8AD', 'AAEB68', 'AAF2D6', 'A5685A', 'A1ADC3', 'A06653', 'AB2C8A', 'A6A904', 'A02B6E', 'A1938A', 'ACB601', 'A1511C', 'A385E3', 'A406BB', 'A97DA1', '320040',
-    'AD406E', 'ADB1FA', 'A2450A', 'A146E4', 'A28DA5', 'ADE07E', 'ABD3B3', 'A0F4FA', 'A224EF', 'A3DB05', 'A501BA', 'A66C3F', 'A66C68', 'ADE0C4', 'A146E4', 'A228CA', 'A2450A', 'A28DA5', 'A523F8', 'A6533F', 'ABD3B3', 'AD406E', 'AD6824', 'ADE473', 'ADE8D9', 'A2260B', 'A35F7E', 'A5C95B', 'A7ECC5', 'ACBB23', 'AD871B', 'ADADDA', 'ADADFD', 'ADE0A1', 'ADE150', 'ADE412', 'A089C8', 'A1F845', 'A202D4', 'A2191E', 'A22683', 'A2392F', 'A24775', 'A257E2', 'A2E7DE', 'A39ED0', 'A5D63D', 'A5F83F', 'A685D4', 'A719FE', 'A7CEFC', 'A80FDA', 'A80FE8', 'A80FF5', 'A8BBED', 'A90219', 'A96287', 'A9A7CB', 'A9C87D', 'AACAEB', 'AB65D9', 'ABAFD0', 'ADB16E', 'ADB1FA', 'ADE07E', 'ADE893', 'A247C6', 'A3A6A3', 'A565A9', 'A5F774', 'A60A5F', 'A63E52', 'A6DBA2', 'A719A0', 'AA8AB6', 'AAD6F0', 'AB63B8', 'ADE47B', 'ADF668', 'A476DE', 'A78B23', 'AB83E0', 'AB9677', 'ABB672', 'ACAA5B', 'AD22F7', 'A11111', 'A46B44', 'A6307E', 'AA28FA', 'ADEC4A',
-    'A71AB8', 'A97316', 'A3522F', 'A04ECF', 'AC06F0', 'ADE984', 'A9A74E', 'A80689', 'ADF0A8', 'A1B621', 'A6016F', 'AB2EF6', 'ABA649'
+import json
+import os
+
+# Tag name -> (bit, asset intelligence shown on aircraft info, or None to keep the tag off the embed)
+ICAO_TAGS = {
+    'law_enforcement': (1 << 0, ":police_officer: Known for use by **state law enforcement**"),
+    'military': (1 << 1, ":military_helmet: Known for use in **military** and **government**"),
+    'medical': (1 << 2, ":hospital: Known for use in **medical response** and **transport**"),
+    'suspicious': (1 << 3, ":warning: Exhibits suspicious flight or **surveillance** activity"),
+    'prior_accident': (1 << 4, ":boom: Prior involved in one or more **documented accidents**"),
+    'ukr_conflict': (1 << 5, ":flag_ua: Utilized within the **[Russo-Ukrainian conflict](https://en.wikipedia.org/wiki/Russian-occupied_territories_of_Ukraine)**"),
+    'news_media': (1 << 6, ":newspaper: Used by **news** or **media** organization"),
+    'balloon': (1 << 7, ":balloon: Aircraft is a **balloon**"),
+    'agri_utility': (1 << 8, ":corn: Used for **agriculture surveys, easement validation, or land inspection**"),
+    'trainer': (1 << 9, None),
 }
 
-military_icao_set = {'AE152C', 'AE203C', 'AE4D36', 'ADEDBE', 'AE1FED', 'AE290E', 'AE4E12', 'AE53F9', 'ADFF10', 'AE1E85', 'AE27F4', 'AE07FF', 'AE055F', 'AE0270', 'AE1462', 'AE146E', 'AE0664', 'AE4E0D', 'AE0808', 'AE0800', 'AE146B', 'AE4D69', '48B12B', 'AE1532', 'AE2919', 'AE1177', 'ADFB95', 'ADF967', 'ADF9DC', '0AC7E6', 'E494A5', '04C20D', '06A20E', '3B7542', 'AE6784', '480C44', 'AE0586', '477FF5', '33FD99', '43C5DD', '50815F', '477FF4', 'AE05B1', '4A34D6', '43C39C', '3B756A', 'AE2031', '48C45E', 'AE6AA8', 'AE1465', 'AE0978', 'AE6308', 'AE112C', 'AE1749', 'AE62C8', 'AE6307', 'AE6275', 'AE6262', 'AE626B', 'AE189C', 'AE63B3', 'AE5FA4', 'ADFDC0', 'AE117D', 'AE5E08', 'ADFEB9', 'AE01B9', '43C937', 'A4C786', 'AE0418', '7CF86A', 'AE07CB', 'AE20C3', 'AE1BF0', '87CC49', '43C77C', '480C43', '3F4129', '43C7AB', 'A966B1', '43C39C', 'AE6E80', 'A4207F', 'AE5240', 'AE6821', '4CA336', '4CA41C', '4CA335', '43C8CB', '43C6DE', '43C6F9', '43C94C', '50FFD8', 'AE11CE', 'AE01E9', 'AE111A', 'ADFF04', 'AE11E6', 'AE5284', 'AE5AC4', 'AE01D2', 'AE145F','AE0976','AE04F4', 'AE623D', 'ADFF0C', 'AE01C9', 'AE13F6', 'AE1730', 'AE6280', 'ADFDDF', 'AE26B0', 'A2EC0C', 'E40089', 'AE58A7', 'A11CF8'}
 
-medical_icao_set = {'A4E840', 'A51D46', 'A4229E', 'A0B5DF', 'A57E5C', 'A5396D', 'A5C4D6', 'A234DB', 'A22B87', 'A740F0', 'ABD3A3', 'A38D95', 'A4E489', 'AD8FE3', 'C009B6', 'AC9B9A', 'AB600B', 'A4C83D', 'A07B5D', 'A4B1A5', 'A07C1A', '48605B', '4857B3', '485E49', 'A61FF5', 'A5696D', 'A4FC36', 'A4C861', 'AB5606', 'C01D49', 'AB597F', 'A0B57D', 'A52323', 'A55D35', '407933', '4077C8', '407424', '4077C6', '406ABF', '408095', '400D94', '407152', '40709D', '406CBC', '406208', '405A76', '407CBF', '407AF7', '407AF6', '4072DA', '4008D1', '4071AB', '4071AA', '406F65', '407045', '40682B', '4071A9', '40793D', '4068CF', '4067BF', '4008A8', '400DFC', '407D36', '407DFD', '406F2B', '406CA0', '407DC0', '407DC1'}
+def icao_to_int(hex_id):
+    """Parse a 24-bit ICAO address, returning None for non-ICAO (`~`-prefixed) or malformed addresses."""
+    if not hex_id or len(hex_id) != 6:
+        return None
+    try:
+        return int(hex_id, 16)
+    except ValueError:
+        return None
+
+
+class ICAOTagIndex:
+    """
+    Maps 24-bit ICAO addresses to a bitmask of `ICAO_TAGS`, so every tag for an aircraft is one dict lookup.
+
+    Tags are loaded from JSON files of `{"tag": ["HEX", ...]}`. Later files add to earlier ones,
+    and `load` swaps in a freshly built index so it can be called again to hot-reload.
+    """
 
-suspicious_icao_set = {'A9739F', 'A1AFEA'}
+    def __init__(self):
+        self._masks = {}
+        self._counts = dict.fromkeys(ICAO_TAGS, 0)
 
-newsagency_icao_set = {'AADE9D'}
+    def load(self, *paths):
+        masks = {}
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for tag, hex_ids in data.items():
+                if tag not in ICAO_TAGS:
+                    print(f"Unknown ICAO tag {tag} in {path}")
+                    continue
+                bit = ICAO_TAGS[tag][0]
+                for hex_id in hex_ids:
+                    address = icao_to_int(hex_id)
+                    if address is not None:
+                        masks[address] = masks.get(address, 0) | bit
+        counts = {tag: sum(1 for mask in masks.values() if mask & bit) for tag, (bit, _) in ICAO_TAGS.items()}
+        self._masks, self._counts = masks, counts
 
-balloons_icao_set = {'A0973A', 'AAEB68', 'AAF2D6', 'A25CE6', 'A2609D'}
+    def __len__(self):
+        return len(self._masks)
 
-agri_utility_set = {'A2A4BF', 'A86F46', 'A543CA', 'A0DC49', 'A991D9', 'A986FA', 'A1B275', 'A89EA5', 'AA0E6E', 'A2D691'}
+    def lookup(self, hex_id):
+        """Return the tag bitmask for an ICAO address, or 0 if it has no tags."""
+        address = icao_to_int(hex_id)
+        if address is None:
+            return 0
+        return self._masks.get(address, 0)
 
-ukr_conflict_set = {'AE5240', 'AE6821', '50FFD8'}
+    def tags(self, hex_id):
+        mask = self.lookup(hex_id)
+        if not mask:
+            return []
+        return [tag for tag, (bit, _) in ICAO_TAGS.items() if mask & bit]
 
-global_prior_known_accident_set = {}
+    def tag_aircraft(self, aircraft_list):
+        """Bulk-tag an airplanes.live `ac` list, returning the tag names for each aircraft in order."""
+        return [self.tags(aircraft.get('hex')) for aircraft in aircraft_list]
 
-trainer_educational_set = {'A2FBF7', 'A5EB3E'}
\ No newline at end of file
+    def count(self, tag):
+        return self._counts.get(tag, 0)
@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+
+import aiohttp #type: ignore
+
+STATIC_MAP_URL = "https://maps.googleapis.com/maps/api/staticmap"
+
+
+class StaticMapCache:
+    """
+    On-disk cache of Google Maps static images, named by a hash of the map parameters.
+
+    Imagery for a location doesn't change, so each (center, zoom, size, scale, map type) is
+    downloaded once. Files are evicted least recently used first once the cache grows past
+    `MAX_BYTES`; file mtimes record use so the order survives restarts. All file I/O runs in
+    an executor, and callers get a path they can hand straight to `discord.File`.
+    """
+
+    MAX_BYTES = 200 * 1024 * 1024
+
+    def __init__(self, http, path):
+        self.http = http
+        self.path = path
+        # file name -> size in bytes, least recently used first
+        self._files = None
+        self._size = 0
+        self._pending = {}
+
+    async def get(self, api_key, lat, lon, zoom=13, size="700x500", scale=2, maptype="satellite"):
+        """Return the path of the cached image, downloading it if needed. Returns None if it couldn't be fetched."""
+        await self._load()
+        params = {"center": f"{lat:.6f},{lon:.6f}", "zoom": str(zoom), "size": size, "scale": str(scale), "maptype": maptype}
+        # The API key isn't part of the image, so it stays out of the cache key
+        key = hashlib.sha256("|".join(f"{name}={value}" for name, value in sorted(params.items())).encode()).hexdigest()
+        file_name = f"{key}.png"
+        file_path = os.path.join(self.path, file_name)
+
+        if file_name in self._files:
+            self._files.move_to_end(file_name)
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, os.utime, file_path)
+                return file_path
+            except OSError:
+                # Removed from disk behind our back; fetch it again
+                self._size -= self._files.pop(file_name)
+
+        pending = self._pending.get(file_name)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(file_name, dict(params, key=api_key)))
+            self._pending[file_name] = pending
+        return await asyncio.shield(pending)
+
+    async def _fetch(self, file_name, params):
+        try:
+            async with self.http.session.get(STATIC_MAP_URL, params=params) as response:
+                if response.status != 200:
+                    return None
+                data = await response.read()
+            loop = asyncio.get_running_loop()
+            file_path = os.path.join(self.path, file_name)
+            await loop.run_in_executor(None, self._write, file_path, data)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            print(f"Error fetching static map: {e}")
+            return None
+        finally:
+            self._pending.pop(file_name, None)
+
+        self._files[file_name] = len(data)
+        self._size += len(data)
+        await self._evict()
+        return file_path
+
+    async def _evict(self):
+        stale = []
+        while self._size > self.MAX_BYTES and len(self._files) > 1:
+            file_name, size = self._files.popitem(last=False)
+            self._size -= size
+            stale.append(os.path.join(self.path, file_name))
+        if stale:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._remove, stale)
+
+    async def _load(self):
+        if self._files is not None:
+            return
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, self._scan)
+        if self._files is None:
+            self._files = OrderedDict(files)
+            self._size = sum(self._files.values())
+
+    def _scan(self):
+        os.makedirs(self.path, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        return [(name, size) for _, name, size in entries]
+
+    @staticmethod
+    def _write(file_path, data):
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _remove(file_paths):
+        for file_path in file_paths:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
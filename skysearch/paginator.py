@@ -0,0 +1,104 @@
+import asyncio
+
+import discord #type: ignore
+
+
+class LazyPaginator(discord.ui.View):
+    """
+    Button paginator that renders pages on demand.
+
+    `render(index)` is awaited the first time a page is needed and returns `(embed, view)`,
+    where `view` is None or a view whose link buttons should be shown with that page.
+    Rendered pages are memoized, and the pages either side of the current one are rendered
+    in the background so flipping is usually instant. `prefetch(indices)`, if given, is called
+    with the next `PREFETCH_PAGES` page numbers each time a page is shown, so callers can warm
+    slower lookups further ahead. Only the invoking user can flip pages, and the view's own
+    timeout retires the controls, so no `wait_for` listeners are needed.
+    """
+
+    PREFETCH_PAGES = 2
+
+    def __init__(self, author, page_count, render, prefetch=None, timeout=180):
+        super().__init__(timeout=timeout)
+        self.author = author
+        self.page_count = page_count
+        self.render = render
+        self.prefetch = prefetch
+        self.index = 0
+        self.message = None
+        self._pages = {}
+        self._page_items = []
+
+    async def start(self, ctx):
+        embed = await self._show(0)
+        self.message = await ctx.send(embed=embed, view=self)
+
+    def _page(self, index):
+        page = self._pages.get(index)
+        if page is None:
+            page = self._pages[index] = asyncio.ensure_future(self.render(index))
+        return page
+
+    async def _show(self, index):
+        embed, view = await self._page(index)
+        self.index = index
+        for item in self._page_items:
+            self.remove_item(item)
+        self._page_items = [item for item in view.children if getattr(item, 'url', None)] if view else []
+        for item in self._page_items:
+            self.add_item(item)
+        self.previous_page.disabled = index == 0
+        self.next_page.disabled = index >= self.page_count - 1
+        # Warm the neighbouring pages while the user reads this one
+        for neighbour in (index - 1, index + 1):
+            if 0 <= neighbour < self.page_count:
+                self._page(neighbour)
+        if self.prefetch is not None:
+            self.prefetch(range(index + 1, min(index + 1 + self.PREFETCH_PAGES, self.page_count)))
+        return embed
+
+    async def _flip(self, interaction, index):
+        # Rendering can involve a photo lookup, so acknowledge first and edit once it's ready
+        await interaction.response.defer()
+        try:
+            embed = await self._show(index)
+        except Exception as e:
+            self._pages.pop(index, None)
+            print(f"Error rendering page {index + 1}: {e}")
+            return
+        await interaction.edit_original_response(embed=embed, view=self)
+
+    async def interaction_check(self, interaction):
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message("Only the person who ran this command can change pages.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        for page in self._pages.values():
+            page.cancel()
+        if self.message is None:
+            return
+        # Keep the page's link buttons, drop the controls
+        for item in [self.previous_page, self.stop_paging, self.next_page]:
+            self.remove_item(item)
+        try:
+            await self.message.edit(view=self if self._page_items else None)
+        except discord.HTTPException:
+            pass
+
+    @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction, button):
+        await self._flip(interaction, self.index - 1)
+
+    @discord.ui.button(emoji="❌", style=discord.ButtonStyle.secondary)
+    async def stop_paging(self, interaction, button):
+        self.stop()
+        for page in self._pages.values():
+            page.cancel()
+        await interaction.response.defer()
+        await interaction.delete_original_response()
+
+    @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction, button):
+        await self._flip(interaction, self.index + 1)
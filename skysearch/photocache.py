@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+import time
+
+import aiohttp #type: ignore
+
+PLANESPOTTERS_URL = "https://api.planespotters.net/pub/photos/hex/{hex_id}"
+
+
+class PhotoCache:
+    """
+    Persistent hex -> (thumbnail URL, photographer) cache for planespotters.net lookups.
+
+    Airframes without a photo are cached too, and lookups for the same hex share one
+    in-flight request. Entries are kept in memory and written to disk with `save`.
+    """
+
+    PHOTO_TTL = 7 * 24 * 60 * 60
+    NO_PHOTO_TTL = 24 * 60 * 60
+    ERROR_TTL = 5 * 60
+    MAX_ENTRIES = 50000
+
+    def __init__(self, http, path):
+        self.http = http
+        self.path = path
+        # hex -> [url, photographer, expires_at]; url and photographer are None when there is no photo
+        self._entries = {}
+        self._pending = {}
+        self._prefetches = set()
+        self._loaded = False
+        self._dirty = False
+
+    async def get(self, hex_id):
+        hex_id = (hex_id or '').upper()
+        if not hex_id:
+            return None, None
+        await self._load()
+        entry = self._entries.get(hex_id)
+        if entry is not None and entry[2] > time.time():
+            return entry[0], entry[1]
+
+        pending = self._pending.get(hex_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(hex_id))
+            self._pending[hex_id] = pending
+        return await asyncio.shield(pending)
+
+    def prefetch(self, hex_ids):
+        """Warm the cache for aircraft the user is likely to page to next, without waiting on the result."""
+        for hex_id in hex_ids:
+            hex_id = (hex_id or '').upper()
+            if not hex_id or hex_id in self._pending:
+                continue
+            entry = self._entries.get(hex_id)
+            if entry is not None and entry[2] > time.time():
+                continue
+            task = asyncio.ensure_future(self.get(hex_id))
+            self._prefetches.add(task)
+            task.add_done_callback(self._prefetches.discard)
+
+    async def _fetch(self, hex_id):
+        url, photographer, ttl = None, None, self.NO_PHOTO_TTL
+        try:
+            async with self.http.session.get(PLANESPOTTERS_URL.format(hex_id=hex_id)) as response:
+                if response.status == 200:
+                    json_out = await response.json()
+                    if 'photos' in json_out and json_out['photos']:
+                        photo = json_out['photos'][0]
+                        url = photo.get('thumbnail_large', {}).get('src', '') or None
+                        photographer = photo.get('photographer', '') or None
+                        if url:
+                            ttl = self.PHOTO_TTL
+                elif response.status != 404:
+                    ttl = self.ERROR_TTL
+        except (KeyError, IndexError, ValueError, aiohttp.ClientError, asyncio.TimeoutError):
+            ttl = self.ERROR_TTL
+        finally:
+            self._pending.pop(hex_id, None)
+
+        self._entries[hex_id] = [url, photographer, time.time() + ttl]
+        if ttl != self.ERROR_TTL:
+            self._dirty = True
+        if len(self._entries) > self.MAX_ENTRIES:
+            self._evict()
+        return url, photographer
+
+    def _evict(self):
+        # Drop the entries closest to expiring until we're back under the cap
+        excess = len(self._entries) - self.MAX_ENTRIES
+        for hex_id, _ in sorted(self._entries.items(), key=lambda item: item[1][2])[:excess]:
+            del self._entries[hex_id]
+
+    async def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        loop = asyncio.get_running_loop()
+        try:
+            entries = await loop.run_in_executor(None, self._read)
+        except (OSError, ValueError) as e:
+            print(f"Error loading photo cache: {e}")
+            return
+        now = time.time()
+        for hex_id, entry in entries.items():
+            if hex_id not in self._entries and isinstance(entry, list) and len(entry) == 3 and entry[2] > now:
+                self._entries[hex_id] = entry
+
+    async def save(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        now = time.time()
+        entries = {hex_id: entry for hex_id, entry in self._entries.items() if entry[2] > now}
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write, entries)
+        except OSError as e:
+            print(f"Error saving photo cache: {e}")
+
+    def close(self):
+        for task in self._prefetches:
+            task.cancel()
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, entries):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.path)
@@ -1,246 +1,109 @@
 import discord #type: ignore
 import aiohttp #type: ignore
-import re
 import asyncio
 import urllib
 import os
-import io
 import tempfile
-import csv
 import datetime
+import time
 from urllib.parse import quote_plus
 from discord.ext import tasks, commands #type: ignore
 from redbot.core import commands, Config #type: ignore
+from redbot.core.data_manager import bundled_data_path, cog_data_path #type: ignore
 from reportlab.lib.pagesizes import letter, landscape, A4 #type: ignore
 from reportlab.pdfgen import canvas #type: ignore 
 from reportlab.lib import colors #type: ignore
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle #type: ignore
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle #type: ignore
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle #type: ignore
 
 import skysearch #type: ignore
-from .icao_codes import law_enforcement_icao_set, military_icao_set, medical_icao_set, suspicious_icao_set, newsagency_icao_set, balloons_icao_set, global_prior_known_accident_set, ukr_conflict_set, agri_utility_set
+from .httpclient import SkysearchHTTP
+from .aircraftframe import AircraftFrame
+from .airportref import AirportReference
+from .photocache import PhotoCache
+from .snapshotstore import MAX_POINT_RADIUS, SnapshotStore
+from .geofence import MAX_FENCE_RADIUS, Fence, GeofenceEngine
+from .icao_codes import ICAO_TAGS, ICAOTagIndex
+from .mapcache import StaticMapCache
+from .paginator import LazyPaginator
+
+# Columns included in PDF exports, which can't fit the full airplanes.live schema on a page
+PDF_EXPORT_COLUMNS = ['hex', 'flight', 'r', 't', 'desc', 'squawk', 'lat', 'lon', 'alt_baro', 'gs', 'track', 'category', 'seen', 'tags']
+
+# Zones are pooled into shared snapshots, but each still costs evaluation and alert traffic
+MAX_WATCH_ZONES = 10
+# airplanes.live snapshots fetched per watch zone round. At one request per second this leaves
+# two thirds of each 30 second round for interactive commands; further snapshots rotate into later rounds
+WATCH_ZONE_REQUEST_BUDGET = 10
+
+HEX_CHARACTERS = frozenset("0123456789abcdefABCDEF")
+
+# Seconds an emergency squawk must be absent from the feed before its alert is marked cleared
+SQUAWK_ALERT_CLEAR_AFTER = 600
 
 class Skysearch(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=492089091320446976)  
+        self.config.register_global(squawk_alerts={})
+        self.config.register_guild(watch_zones={})
         self.api_url = "https://api.airplanes.live/v2"
+        self.http = SkysearchHTTP()
+        self.snapshots = SnapshotStore(self.http, self.api_url)
+        self.airports = AirportReference(self.http, str(cog_data_path(self)))
+        self.map_cache = StaticMapCache(self.http, os.path.join(cog_data_path(self), "static_maps"))
+        self.refresh_airport_reference.start()
+        self.photo_cache = PhotoCache(self.http, os.path.join(cog_data_path(self), "photo_cache.json"))
+        self.save_photo_cache.start()
         self.max_requests_per_user = 10
         self.EMBED_COLOR = discord.Color(0xfffffe)
+        # Guild ID -> (alert channel ID, alert role ID) for every guild subscribed to squawk alerts
+        self.alert_subscriptions = {}
+        self.alert_send_semaphore = asyncio.Semaphore(25)
+        # "HEX:SQUAWK" -> alert state, persisted so restarts don't re-announce ongoing emergencies
+        self.squawk_alerts = {}
+        self.auto_icao_guilds = set()
         self.check_emergency_squawks.start()
-        self.law_enforcement_icao_set = law_enforcement_icao_set
-        self.military_icao_set = military_icao_set
-        self.medical_icao_set = medical_icao_set
-        self.suspicious_icao_set = suspicious_icao_set
-        self.newsagency_icao_set = newsagency_icao_set
-        self.balloons_icao_set = balloons_icao_set
-        self.global_prior_known_accident_set = global_prior_known_accident_set
-        self.ukr_conflict_set = ukr_conflict_set
-        self.agri_utility_set = agri_utility_set
+        self.icao_tags = ICAOTagIndex()
+        self.icao_tags.load(*self._icao_tag_paths())
+        self.geofences = GeofenceEngine(self.icao_tags)
+        # Where the next watch zone round resumes when there are more snapshots than its budget
+        self.watch_zone_cursor = 0
+        self.check_watch_zones.start()
         
+    async def cog_load(self):
+        all_guilds = await self.config.all_guilds()
+        # Kept in memory so the on_message listener never has to read config
+        self.auto_icao_guilds = {guild_id for guild_id, guild_data in all_guilds.items() if guild_data.get('auto_icao')}
+
     async def cog_unload(self):
-        if hasattr(self, '_http_client'):
-            await self._http_client.close()
+        try:
+            self.check_emergency_squawks.cancel()
+        except Exception as e:
+            print(f"Error unloading cog: {e}")
+        self.check_watch_zones.cancel()
+        self.refresh_airport_reference.cancel()
+        self.save_photo_cache.cancel()
+        self.photo_cache.close()
+        await self.photo_cache.save()
+        await self.http.close()
+
+    def _icao_tag_paths(self):
+        # Bundled tags first, then any curated additions dropped into the cog's data folder
+        return [os.path.join(bundled_data_path(self), "icao_tags.json"), os.path.join(cog_data_path(self), "icao_tags.json")]
 
     async def _make_request(self, url):
-        if not hasattr(self, '_http_client'):
-            self._http_client = aiohttp.ClientSession()
         try:
-            async with self._http_client.get(url) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
+            return await self.snapshots.get(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Error making request: {e}")
             return None
 
     async def _send_aircraft_info(self, ctx, response):
         if 'ac' in response and response['ac']:
             await ctx.typing()
-            aircraft_data = response['ac'][0]
-            emergency_squawk_codes = ['7500', '7600', '7700']
-            hex_id = aircraft_data.get('hex', '')                                      
-            image_url, photographer = await self._get_photo_by_hex(hex_id)
-            link = f"https://globe.airplanes.live/?icao={hex_id}"
-            squawk_code = aircraft_data.get('squawk', 'N/A')
-#            if squawk_code == '7400':
-#                embed = discord.Embed(title='Aircraft information', color=discord.Colour(0xff9145))
-#                emergency_status = ":warning: **UAV has lost radio contact**"
-#                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Orange/alert-circle-outline.png")
-            if squawk_code == '7500':
-                embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
-                emergency_status = ":rotating_light: Aircraft has been **hijacked**"
-                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
-            elif squawk_code == '7600':
-                embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
-                emergency_status = ":signal_strength: Aircraft has **lost radio contact**"
-                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
-            elif squawk_code == '7700':
-                embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
-                emergency_status = ":warning: Aircraft has **declared a general emergency**"
-                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
-            else:
-                embed = discord.Embed(title='Aircraft information', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xfffffe))
-                emergency_status = ":white_check_mark: Aircraft reports **normal** conditions"
-                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
-            callsign = aircraft_data.get('flight', 'N/A').strip()
-            if not callsign or callsign == 'N/A':
-                callsign = 'BLOCKED'
-            embed.add_field(name="Callsign", value=f"`{callsign}`", inline=True)
-            registration = aircraft_data.get('reg', None)
-            if registration is not None:
-                registration = registration.upper()
-                embed.add_field(name="Registration", value=f"`{registration}`", inline=True)
-            icao = aircraft_data.get('hex', 'N/A').upper()
-            embed.add_field(name="ICAO", value=f"`{icao}`", inline=True)
-            altitude = aircraft_data.get('alt_baro', 'N/A')
-            if altitude == 'ground':
-                embed.add_field(name="Status", value="On ground", inline=True)
-            elif altitude != 'N/A':
-                if isinstance(altitude, int):
-                    altitude = "{:,}".format(altitude)
-                altitude_feet = f"{altitude} ft"
-                embed.add_field(name="Altitude", value=f"`{altitude_feet}`", inline=True)
-            heading = aircraft_data.get('true_heading', None)
-            if heading is not None:
-                if 0 <= heading < 45:
-                    emoji = ":arrow_upper_right:"
-                elif 45 <= heading < 90:
-                    emoji = ":arrow_right:"
-                elif 90 <= heading < 135:
-                    emoji = ":arrow_lower_right:"
-                elif 135 <= heading < 180:
-                    emoji = ":arrow_down:"
-                elif 180 <= heading < 225:
-                    emoji = ":arrow_lower_left:"
-                elif 225 <= heading < 270:
-                    emoji = ":arrow_left:"
-                elif 270 <= heading < 315:
-                    emoji = ":arrow_upper_left:"
-                else:
-                    emoji = ":arrow_up:"
-                embed.add_field(name="Heading", value=f"{emoji} `{heading}°`", inline=True)
-            lat = aircraft_data.get('lat', 'N/A')
-            lon = aircraft_data.get('lon', 'N/A')
-            if lat != 'N/A':
-                lat = round(float(lat), 2)
-                lat_dir = "N" if lat >= 0 else "S"
-                lat = f"{abs(lat)}{lat_dir}"
-            if lon != 'N/A':
-                lon = round(float(lon), 2)
-                lon_dir = "E" if lon >= 0 else "W"
-                lon = f"{abs(lon)}{lon_dir}"
-            if lat != 'N/A' and lon != 'N/A':
-                embed.add_field(name="Position", value=f"`{lat}, {lon}`", inline=True)
-            embed.add_field(name="Squawk", value=f"`{aircraft_data.get('squawk', 'BLOCKED')}`", inline=True)
-            if aircraft_data.get('year', None) is not None:
-                embed.add_field(name="Built", value=f"`{aircraft_data.get('year')}`", inline=True)
-            
-            aircraft_model = aircraft_data.get('t', None)
-            if aircraft_model is not None:
-                embed.add_field(name="Model", value=f"`{aircraft_model}`", inline=True)
-            ground_speed_knots = aircraft_data.get('gs', 'N/A')
-            if ground_speed_knots != 'N/A':
-                ground_speed_mph = round(float(ground_speed_knots) * 1.15078)  # Convert knots to mph
-                embed.add_field(name="Speed", value=f"`{ground_speed_mph} mph`", inline=True)
-            category_code_to_label = {
-                "A0": "`No info available`",
-                "A1": "`Light (< 15500 lbs)`",
-                "A2": "`Small (15500 to 75000 lbs)`",
-                "A3": "`Large (75000 to 300000 lbs)`",
-                "A4": "`High vortex large`",
-                "A5": "`Heavy (> 300000 lbs)`",
-                "A6": "`High performance (> 5g acceleration and 400 kts)`",
-                "A7": "`Rotorcraft`",
-                "B0": "`No info available`",
-                "B1": "`Glider / sailplane`",
-                "B2": "`Lighter-than-air`",
-                "B3": "`Parachutist / skydiver`",
-                "B4": "`Ultralight / hang-glider / paraglider`",
-                "B5": "`Reserved`",
-                "B6": "`UAV`",
-                "B7": "`Space / trans-atmospheric vehicle`",
-                "C0": "`No info available`",
-                "C1": "`Emergency vehicle`",
-                "C2": "`Service vehicle`",
-                "C3": "`Point obstacle`",
-                "C4": "`Cluster obstacle`",
-                "C5": "`Line obstacle`",
-                "C6": "`Reserved`",
-                "C7": "`Reserved`"
-            }
-            category = aircraft_data.get('category', None)
-            if category is not None:
-                category_label = category_code_to_label.get(category, "Unknown category")
-                embed.add_field(name="Category", value=f"{category_label}", inline=False)
-
-            operator = aircraft_data.get('ownOp', None)
-            if operator is not None:
-                operator_encoded = quote_plus(operator)
-                embed.add_field(name="Operated by", value=f"[{operator}](https://www.google.com/search?q={operator_encoded})", inline=False)
-            
-            last_seen = aircraft_data.get('seen', 'N/A')
-            if last_seen != 'N/A':
-                last_seen_text = ":green_circle: Just **now**" if float(last_seen) < 1 else f":hourglass: **{int(float(last_seen))}** seconds ago"
-                embed.add_field(name="Last signal", value=last_seen_text, inline=False)
-            
-            last_seen_pos = aircraft_data.get('seen_pos', 'N/A')
-            if last_seen_pos != 'N/A':
-                last_seen_pos_text = ":green_circle: Just **now**" if float(last_seen_pos) < 1 else f":hourglass: **{int(float(last_seen_pos))}** seconds ago"
-                embed.add_field(name="Last position", value=last_seen_pos_text, inline=False)
-            
-            baro_rate = aircraft_data.get('baro_rate', 'N/A')
-            if baro_rate == 'N/A':
-                embed.add_field(name="Altitude trend", value=":grey_question: Altitude trends unavailable, **not enough data**", inline=False)
-            else:
-                baro_rate_fps = round(int(baro_rate) / 60, 2)  # Convert feet per minute to feet per second
-                if abs(baro_rate_fps) < 50/60:
-                    embed.add_field(name="Altitude data", value=":cloud: Maintaining **consistent** altitude", inline=False)
-                elif baro_rate_fps > 0:
-                    embed.add_field(name="Altitude data", value=":airplane_departure: Climbing @  " + f"**{baro_rate_fps} feet/sec**", inline=False)
-                else:
-                    embed.add_field(name="Altitude data", value=":airplane_arriving: Descending @  " + f"**{abs(baro_rate_fps)} feet/sec**", inline=False)
-            embed.add_field(name="Flight status", value=emergency_status, inline=True)
-
-
-            icao = aircraft_data.get('hex', None).upper()
-            if icao and icao.upper() in self.law_enforcement_icao_set:
-                embed.add_field(name="Asset intelligence", value=":police_officer: Known for use by **state law enforcement**", inline=False)
-            if icao and icao.upper() in self.military_icao_set:
-                embed.add_field(name="Asset intelligence", value=":military_helmet: Known for use in **military** and **government**", inline=False)
-            if icao and icao.upper() in self.medical_icao_set:
-                embed.add_field(name="Asset intelligence", value=":hospital: Known for use in **medical response** and **transport**", inline=False)
-            if icao and icao.upper() in self.suspicious_icao_set:
-                embed.add_field(name="Asset intelligence", value=":warning: Exhibits suspicious flight or **surveillance** activity", inline=False)
-            if icao and icao.upper() in self.global_prior_known_accident_set:
-                embed.add_field(name="Asset intelligence", value=":boom: Prior involved in one or more **documented accidents**", inline=False)
-            if icao and icao.upper() in self.ukr_conflict_set:
-                embed.add_field(name="Asset intelligence", value=":flag_ua: Utilized within the **[Russo-Ukrainian conflict](https://en.wikipedia.org/wiki/Russian-occupied_territories_of_Ukraine)**", inline=False)
-            if icao and icao.upper() in self.newsagency_icao_set:
-                embed.add_field(name="Asset intelligence", value=":newspaper: Used by **news** or **media** organization", inline=False)
-            if icao and icao.upper() in self.balloons_icao_set:
-                embed.add_field(name="Asset intelligence", value=":balloon: Aircraft is a **balloon**", inline=False)
-            if icao and icao.upper() in self.agri_utility_set:
-                embed.add_field(name="Asset intelligence", value=":corn: Used for **agriculture surveys, easement validation, or land inspection**", inline=False)
-
-            image_url, photographer = await self._get_photo_by_hex(icao)
-            if image_url and photographer:
-                embed.set_image(url=image_url)
-                embed.set_footer(text=f"📸 {photographer}")
-
-            view = discord.ui.View()
-            view.add_item(discord.ui.Button(label="View on map", emoji="🗺️", url=f"{link}", style=discord.ButtonStyle.link))
-            ground_speed_mph = ground_speed_mph if 'ground_speed_mph' in locals() else 'unknown'
-            squawk_code = aircraft_data.get('squawk', 'N/A')
-            if squawk_code in emergency_squawk_codes:
-                tweet_text = f"Spotted an aircraft declaring an emergency! #Squawk #{squawk_code}, flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph. #SkySearch #Emergency\n\nJoin via Discord to search and discuss planes with your friends for free - https://discord.gg/X8huyaeXrA"
-            else:
-                tweet_text = f"Tracking flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph using #SkySearch\n\nJoin via Discord to search and discuss planes with your friends for free - https://discord.gg/X8huyaeXrA"
-            tweet_url = f"https://twitter.com/intent/tweet?text={urllib.parse.quote_plus(tweet_text)}"
-            view.add_item(discord.ui.Button(label=f"Post on 𝕏", emoji="📣", url=tweet_url, style=discord.ButtonStyle.link))
-            whatsapp_text = f"Check out this aircraft! Flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph. Track live @ https://globe.airplanes.live/?icao={icao} #SkySearch"
-            whatsapp_url = f"https://api.whatsapp.com/send?text={urllib.parse.quote_plus(whatsapp_text)}"
-            view.add_item(discord.ui.Button(label="Send on WhatsApp", emoji="📱", url=whatsapp_url, style=discord.ButtonStyle.link))
+            embed, view = await self._build_aircraft_info(response['ac'][0])
             await ctx.send(embed=embed, view=view)
 
 #           squawk_code = aircraft_data.get('squawk', 'N/A')
@@ -268,21 +131,198 @@ class Skysearch(commands.Cog):
             except discord.errors.Forbidden:
                 pass
 
+    async def _build_aircraft_info(self, aircraft_data):
+        """Render the embed and link buttons for a single aircraft."""
+        emergency_squawk_codes = ['7500', '7600', '7700']
+        hex_id = aircraft_data.get('hex', '')
+        link = f"https://globe.airplanes.live/?icao={hex_id}"
+        squawk_code = aircraft_data.get('squawk', 'N/A')
+#            if squawk_code == '7400':
+#                embed = discord.Embed(title='Aircraft information', color=discord.Colour(0xff9145))
+#                emergency_status = ":warning: **UAV has lost radio contact**"
+#                embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Orange/alert-circle-outline.png")
+        if squawk_code == '7500':
+            embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
+            emergency_status = ":rotating_light: Aircraft has been **hijacked**"
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
+        elif squawk_code == '7600':
+            embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
+            emergency_status = ":signal_strength: Aircraft has **lost radio contact**"
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
+        elif squawk_code == '7700':
+            embed = discord.Embed(title='Aircraft alert', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xff4545))
+            emergency_status = ":warning: Aircraft has **declared a general emergency**"
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/Red/alert-circle.png")
+        else:
+            embed = discord.Embed(title='Aircraft information', description=f"# {aircraft_data.get('desc', 'N/A')}", color=discord.Colour(0xfffffe))
+            emergency_status = ":white_check_mark: Aircraft reports **normal** conditions"
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
+        callsign = aircraft_data.get('flight', 'N/A').strip()
+        if not callsign or callsign == 'N/A':
+            callsign = 'BLOCKED'
+        embed.add_field(name="Callsign", value=f"`{callsign}`", inline=True)
+        registration = aircraft_data.get('reg', None)
+        if registration is not None:
+            registration = registration.upper()
+            embed.add_field(name="Registration", value=f"`{registration}`", inline=True)
+        icao = aircraft_data.get('hex', 'N/A').upper()
+        embed.add_field(name="ICAO", value=f"`{icao}`", inline=True)
+        altitude = aircraft_data.get('alt_baro', 'N/A')
+        if altitude == 'ground':
+            embed.add_field(name="Status", value="On ground", inline=True)
+        elif altitude != 'N/A':
+            if isinstance(altitude, int):
+                altitude = "{:,}".format(altitude)
+            altitude_feet = f"{altitude} ft"
+            embed.add_field(name="Altitude", value=f"`{altitude_feet}`", inline=True)
+        heading = aircraft_data.get('true_heading', None)
+        if heading is not None:
+            if 0 <= heading < 45:
+                emoji = ":arrow_upper_right:"
+            elif 45 <= heading < 90:
+                emoji = ":arrow_right:"
+            elif 90 <= heading < 135:
+                emoji = ":arrow_lower_right:"
+            elif 135 <= heading < 180:
+                emoji = ":arrow_down:"
+            elif 180 <= heading < 225:
+                emoji = ":arrow_lower_left:"
+            elif 225 <= heading < 270:
+                emoji = ":arrow_left:"
+            elif 270 <= heading < 315:
+                emoji = ":arrow_upper_left:"
+            else:
+                emoji = ":arrow_up:"
+            embed.add_field(name="Heading", value=f"{emoji} `{heading}°`", inline=True)
+        lat = aircraft_data.get('lat', 'N/A')
+        lon = aircraft_data.get('lon', 'N/A')
+        if lat != 'N/A':
+            lat = round(float(lat), 2)
+            lat_dir = "N" if lat >= 0 else "S"
+            lat = f"{abs(lat)}{lat_dir}"
+        if lon != 'N/A':
+            lon = round(float(lon), 2)
+            lon_dir = "E" if lon >= 0 else "W"
+            lon = f"{abs(lon)}{lon_dir}"
+        if lat != 'N/A' and lon != 'N/A':
+            embed.add_field(name="Position", value=f"`{lat}, {lon}`", inline=True)
+        embed.add_field(name="Squawk", value=f"`{aircraft_data.get('squawk', 'BLOCKED')}`", inline=True)
+        if aircraft_data.get('year', None) is not None:
+            embed.add_field(name="Built", value=f"`{aircraft_data.get('year')}`", inline=True)
+        
+        aircraft_model = aircraft_data.get('t', None)
+        if aircraft_model is not None:
+            embed.add_field(name="Model", value=f"`{aircraft_model}`", inline=True)
+        ground_speed_knots = aircraft_data.get('gs', 'N/A')
+        if ground_speed_knots != 'N/A':
+            ground_speed_mph = round(float(ground_speed_knots) * 1.15078)  # Convert knots to mph
+            embed.add_field(name="Speed", value=f"`{ground_speed_mph} mph`", inline=True)
+        category_code_to_label = {
+            "A0": "`No info available`",
+            "A1": "`Light (< 15500 lbs)`",
+            "A2": "`Small (15500 to 75000 lbs)`",
+            "A3": "`Large (75000 to 300000 lbs)`",
+            "A4": "`High vortex large`",
+            "A5": "`Heavy (> 300000 lbs)`",
+            "A6": "`High performance (> 5g acceleration and 400 kts)`",
+            "A7": "`Rotorcraft`",
+            "B0": "`No info available`",
+            "B1": "`Glider / sailplane`",
+            "B2": "`Lighter-than-air`",
+            "B3": "`Parachutist / skydiver`",
+            "B4": "`Ultralight / hang-glider / paraglider`",
+            "B5": "`Reserved`",
+            "B6": "`UAV`",
+            "B7": "`Space / trans-atmospheric vehicle`",
+            "C0": "`No info available`",
+            "C1": "`Emergency vehicle`",
+            "C2": "`Service vehicle`",
+            "C3": "`Point obstacle`",
+            "C4": "`Cluster obstacle`",
+            "C5": "`Line obstacle`",
+            "C6": "`Reserved`",
+            "C7": "`Reserved`"
+        }
+        category = aircraft_data.get('category', None)
+        if category is not None:
+            category_label = category_code_to_label.get(category, "Unknown category")
+            embed.add_field(name="Category", value=f"{category_label}", inline=False)
+
+        operator = aircraft_data.get('ownOp', None)
+        if operator is not None:
+            operator_encoded = quote_plus(operator)
+            embed.add_field(name="Operated by", value=f"[{operator}](https://www.google.com/search?q={operator_encoded})", inline=False)
+        
+        last_seen = aircraft_data.get('seen', 'N/A')
+        if last_seen != 'N/A':
+            last_seen_text = ":green_circle: Just **now**" if float(last_seen) < 1 else f":hourglass: **{int(float(last_seen))}** seconds ago"
+            embed.add_field(name="Last signal", value=last_seen_text, inline=False)
+        
+        last_seen_pos = aircraft_data.get('seen_pos', 'N/A')
+        if last_seen_pos != 'N/A':
+            last_seen_pos_text = ":green_circle: Just **now**" if float(last_seen_pos) < 1 else f":hourglass: **{int(float(last_seen_pos))}** seconds ago"
+            embed.add_field(name="Last position", value=last_seen_pos_text, inline=False)
+        
+        baro_rate = aircraft_data.get('baro_rate', 'N/A')
+        if baro_rate == 'N/A':
+            embed.add_field(name="Altitude trend", value=":grey_question: Altitude trends unavailable, **not enough data**", inline=False)
+        else:
+            baro_rate_fps = round(int(baro_rate) / 60, 2)  # Convert feet per minute to feet per second
+            if abs(baro_rate_fps) < 50/60:
+                embed.add_field(name="Altitude data", value=":cloud: Maintaining **consistent** altitude", inline=False)
+            elif baro_rate_fps > 0:
+                embed.add_field(name="Altitude data", value=":airplane_departure: Climbing @  " + f"**{baro_rate_fps} feet/sec**", inline=False)
+            else:
+                embed.add_field(name="Altitude data", value=":airplane_arriving: Descending @  " + f"**{abs(baro_rate_fps)} feet/sec**", inline=False)
+        embed.add_field(name="Flight status", value=emergency_status, inline=True)
+
+
+        icao = aircraft_data.get('hex', '').upper()
+        tag_mask = self.icao_tags.lookup(icao)
+        if tag_mask:
+            for bit, asset_intelligence in ICAO_TAGS.values():
+                if tag_mask & bit and asset_intelligence:
+                    embed.add_field(name="Asset intelligence", value=asset_intelligence, inline=False)
+
+        image_url, photographer = await self._get_photo_by_hex(icao)
+        if image_url and photographer:
+            embed.set_image(url=image_url)
+            embed.set_footer(text=f"📸 {photographer}")
+
+        view = discord.ui.View()
+        view.add_item(discord.ui.Button(label="View on map", emoji="🗺️", url=f"{link}", style=discord.ButtonStyle.link))
+        ground_speed_mph = ground_speed_mph if 'ground_speed_mph' in locals() else 'unknown'
+        squawk_code = aircraft_data.get('squawk', 'N/A')
+        if squawk_code in emergency_squawk_codes:
+            tweet_text = f"Spotted an aircraft declaring an emergency! #Squawk #{squawk_code}, flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph. #SkySearch #Emergency\n\nJoin via Discord to search and discuss planes with your friends for free - https://discord.gg/X8huyaeXrA"
+        else:
+            tweet_text = f"Tracking flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph using #SkySearch\n\nJoin via Discord to search and discuss planes with your friends for free - https://discord.gg/X8huyaeXrA"
+        tweet_url = f"https://twitter.com/intent/tweet?text={urllib.parse.quote_plus(tweet_text)}"
+        view.add_item(discord.ui.Button(label=f"Post on 𝕏", emoji="📣", url=tweet_url, style=discord.ButtonStyle.link))
+        whatsapp_text = f"Check out this aircraft! Flight {aircraft_data.get('flight', '')} at position {lat}, {lon} with speed {ground_speed_mph} mph. Track live @ https://globe.airplanes.live/?icao={icao} #SkySearch"
+        whatsapp_url = f"https://api.whatsapp.com/send?text={urllib.parse.quote_plus(whatsapp_text)}"
+        view.add_item(discord.ui.Button(label="Send on WhatsApp", emoji="📱", url=whatsapp_url, style=discord.ButtonStyle.link))
+        return embed, view
+
     async def _get_photo_by_hex(self, hex_id):
-        if not hasattr(self, '_http_client'):
-            self._http_client = aiohttp.ClientSession()
+        return await self.photo_cache.get(hex_id)
+
+    def _prefetch_photos(self, aircraft_list):
+        """Paginator hook that warms the photo cache for the aircraft on the upcoming pages of a one-per-page list."""
+        def prefetch(page_indices):
+            self.photo_cache.prefetch(aircraft_list[index].get('hex') for index in page_indices)
+        return prefetch
+
+    @tasks.loop(hours=24)
+    async def refresh_airport_reference(self):
         try:
-            async with self._http_client.get(f'https://api.planespotters.net/pub/photos/hex/{hex_id}') as response:
-                if response.status == 200:
-                    json_out = await response.json()
-                    if 'photos' in json_out and json_out['photos']:
-                        photo = json_out['photos'][0]
-                        url = photo.get('thumbnail_large', {}).get('src', '')
-                        photographer = photo.get('photographer', '')
-                        return url, photographer
-        except (KeyError, IndexError, aiohttp.ClientError):
-            pass
-        return None, None
+            await self.airports.refresh()
+        except Exception as e:
+            print(f"Error refreshing airport reference data: {e}")
+
+    @tasks.loop(minutes=10)
+    async def save_photo_cache(self):
+        await self.photo_cache.save()
 
     @commands.guild_only()
     @commands.group(name='skysearch', help='Core menu for the cog', invoke_without_command=True)
@@ -299,9 +339,8 @@ class Skysearch(commands.Cog):
         url = "https://api.airplanes.live/stats"
 
         try:
-            if not hasattr(self, '_http_client'):
-                self._http_client = aiohttp.ClientSession()
-            async with self._http_client.get(url) as response:
+            await self.http.airplanes_live_limiter.acquire()
+            async with self.http.session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
                 else:
@@ -321,20 +360,20 @@ class Skysearch(commands.Cog):
 
             embed.add_field(name="This data appears in the following commands", value="`callsign` `icao` `reg` `squawk` `type` `radius` `pia` `mil` `ladd` `export`", inline=False)
 
-            embed.add_field(name="Law enforcement aircraft", value="**{:,}** tagged".format(len(self.law_enforcement_icao_set)), inline=True)
-            embed.add_field(name="Military & government aircraft", value="**{:,}** tagged".format(len(self.military_icao_set)), inline=True)
-            embed.add_field(name="Medical aircraft", value="**{:,}** tagged".format(len(self.medical_icao_set)), inline=True)
-            embed.add_field(name="Media aircraft", value="**{:,}** known".format(len(self.newsagency_icao_set)), inline=True)
-            embed.add_field(name="Damaged aircraft", value="**{:,}** known".format(len(self.global_prior_known_accident_set)), inline=True)
-            embed.add_field(name="Wartime aircraft", value="**{:,}** observed".format(len(self.ukr_conflict_set)), inline=True)
-            embed.add_field(name="Utility aircraft", value="**{:,}** spotted".format(len(self.agri_utility_set)), inline=True)
-            embed.add_field(name="Balloons", value="**{:,}** known".format(len(self.balloons_icao_set)), inline=True)
-            embed.add_field(name="Suspicious aircraft", value="**{:,}** identifiers".format(len(self.suspicious_icao_set)), inline=True)
+            embed.add_field(name="Law enforcement aircraft", value="**{:,}** tagged".format(self.icao_tags.count('law_enforcement')), inline=True)
+            embed.add_field(name="Military & government aircraft", value="**{:,}** tagged".format(self.icao_tags.count('military')), inline=True)
+            embed.add_field(name="Medical aircraft", value="**{:,}** tagged".format(self.icao_tags.count('medical')), inline=True)
+            embed.add_field(name="Media aircraft", value="**{:,}** known".format(self.icao_tags.count('news_media')), inline=True)
+            embed.add_field(name="Damaged aircraft", value="**{:,}** known".format(self.icao_tags.count('prior_accident')), inline=True)
+            embed.add_field(name="Wartime aircraft", value="**{:,}** observed".format(self.icao_tags.count('ukr_conflict')), inline=True)
+            embed.add_field(name="Utility aircraft", value="**{:,}** spotted".format(self.icao_tags.count('agri_utility')), inline=True)
+            embed.add_field(name="Balloons", value="**{:,}** known".format(self.icao_tags.count('balloon')), inline=True)
+            embed.add_field(name="Suspicious aircraft", value="**{:,}** identifiers".format(self.icao_tags.count('suspicious')), inline=True)
             embed.add_field(name="This data appears in the following commands", value="`callsign` `icao` `reg` `squawk` `type` `radius` `pia` `mil` `ladd`", inline=False)
             embed.add_field(name="Other services", value="Additional data used in this cog is shown below", inline=False)
             embed.add_field(name="Photography", value="Photos are powered by community contributions at [planespotters.net](https://www.planespotters.net/)", inline=True)
-            embed.add_field(name="Airport data", value="Airport data is powered by the [airport-data.com](https://airport-data.com/) API service", inline=True)
-            embed.add_field(name="Runway data", value="Runway data is powered by the [airportdb.io](https://airportdb.io) API service", inline=True)
+            embed.add_field(name="Airport data", value="Airport, runway and navaid data is from [OurAirports](https://ourairports.com/data/)", inline=True)
+            embed.add_field(name="Airports indexed", value="**{:,}** airports".format(len(self.airports)), inline=True)
             embed.add_field(name="Mapping and imagery", value="Mapping and ground imagery powered by [Google Maps](https://maps.google.com) and the [Maps Static API](https://developers.google.com/maps/documentation/maps-static)", inline=False)
 
             await ctx.send(embed=embed)
@@ -416,9 +455,10 @@ class Skysearch(commands.Cog):
         if response:
             aircraft_list = response['ac']
             if aircraft_list:
-                page_index = 0
+                aircraft_tags = self.icao_tags.tag_aircraft(aircraft_list)
 
-                async def create_embed(aircraft):
+                async def create_embed(page_index):
+                    aircraft = aircraft_list[page_index]
                     embed = discord.Embed(title=f"Live military aircraft ({page_index + 1} of {len(aircraft_list)})", color=0xfffffe)
                     embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
                     aircraft_description = aircraft.get('desc', 'N/A')  # Aircraft Description
@@ -436,6 +476,8 @@ class Skysearch(commands.Cog):
                     embed.add_field(name="Heading", value=f"**`{aircraft_heading}`**", inline=True)
                     embed.add_field(name="Speed", value=f"**`{aircraft_speed}`**", inline=True)
                     embed.add_field(name="ICAO", value=f"**`{aircraft_hex}`**", inline=True)
+                    if aircraft_tags[page_index]:
+                        embed.add_field(name="Tags", value=self._format_tags(aircraft_tags[page_index]), inline=False)
 
                     photo_url, photographer = await self._get_photo_by_hex(aircraft_hex)
                     if photo_url:
@@ -448,38 +490,8 @@ class Skysearch(commands.Cog):
 
                     return embed, view
 
-                async def update_message(message, page_index):
-                    embed, view = await create_embed(aircraft_list[page_index])
-                    await message.edit(embed=embed, view=view)
-
-                embed, view = await create_embed(aircraft_list[page_index])
-                message = await ctx.send(embed=embed, view=view)
-
-                await message.add_reaction("⬅️")
-                await message.add_reaction("❌")
-                await message.add_reaction("➡️")
-                
-                def check(reaction, user):
-                    return user == ctx.author and str(reaction.emoji) in ["⬅️", "❌", "➡️"]
-
-                while True:
-                    try:
-                        reaction, user = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
-
-                        if str(reaction.emoji) == "⬅️" and page_index > 0:
-                            page_index -= 1
-                            await update_message(message, page_index)
-                        elif str(reaction.emoji) == "➡️" and page_index < len(aircraft_list) - 1:
-                            page_index += 1
-                            await update_message(message, page_index)
-                        elif str(reaction.emoji) == "❌":
-                            await message.delete()
-                            break
-
-                        await message.remove_reaction(reaction, user)
-                    except asyncio.TimeoutError:
-                        await message.clear_reactions()
-                        break
+                paginator = LazyPaginator(ctx.author, len(aircraft_list), create_embed, prefetch=self._prefetch_photos(aircraft_list))
+                await paginator.start(ctx)
             else:
                 await self._send_aircraft_info(ctx, response)
         else:
@@ -493,45 +505,7 @@ class Skysearch(commands.Cog):
         response = await self._make_request(url)
         if response:
             if len(response['ac']) > 1:
-                pages = [response['ac'][i:i + 10] for i in range(0, len(response['ac']), 10)]  # Split aircraft list into pages of 10
-                for page_index, page in enumerate(pages):
-                    embed = discord.Embed(title=f"Limited Aircraft Data Displayed (Page {page_index + 1}/{len(pages)})", color=0xfffffe)
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
-                    for aircraft in page:
-                        aircraft_description = aircraft.get('desc', 'N/A')  # Aircraft Description
-                        aircraft_squawk = aircraft.get('squawk', 'N/A')  # Squawk
-                        aircraft_lat = aircraft.get('lat', 'N/A')  # Latitude
-                        aircraft_lon = aircraft.get('lon', 'N/A')  # Longitude
-                        aircraft_heading = aircraft.get('heading', 'N/A')  # Heading
-                        aircraft_speed = aircraft.get('spd', 'N/A')  # Speed
-                        aircraft_hex = aircraft.get('hex', 'N/A')  # Hex
-
-                        aircraft_info = f"**Squawk:** {aircraft_squawk}\n"
-                        aircraft_info += f"**Coordinates:** Lat: {aircraft_lat}, Lon: {aircraft_lon}\n"
-                        aircraft_info += f"**Heading:** {aircraft_heading}\n"
-                        aircraft_info += f"**Speed:** {aircraft_speed}\n"
-                        aircraft_info += f"**ICAO:** {aircraft_hex}"
-
-                        embed.add_field(name=aircraft_description, value=aircraft_info, inline=False)
-
-                    message = await ctx.send(embed=embed)
-                    await message.add_reaction("⬅️")  # Adding a reaction to scroll to the previous page
-                    await message.add_reaction("➡️")  # Adding a reaction to scroll to the next page
-
-                    def check(reaction, user):
-                        return user == ctx.author and str(reaction.emoji) in ['⬅️', '➡️']
-
-                    try:
-                        reaction, user = await self.bot.wait_for('reaction_add', timeout=60.0, check=check)
-                        if str(reaction.emoji) == '⬅️' and page_index > 0:  # Check if the previous page reaction was added and it's not the first page
-                            await message.delete()
-                            page_index -= 1
-                        elif str(reaction.emoji) == '➡️' and page_index < len(pages) - 1:  # Check if the next page reaction was added and it's not the last page
-                            await message.delete()
-                            page_index += 1
-                    except asyncio.TimeoutError:
-                        await message.delete()
-                        break
+                await self._paginate_aircraft_list(ctx, "Limited Aircraft Data Displayed", response['ac'])
             else:
                 await self._send_aircraft_info(ctx, response)
         else:
@@ -545,56 +519,62 @@ class Skysearch(commands.Cog):
         response = await self._make_request(url)
         if response:
             if len(response['ac']) > 1:
-                pages = [response['ac'][i:i + 10] for i in range(0, len(response['ac']), 10)]  # Split aircraft list into pages of 10
-                for page_index, page in enumerate(pages):
-                    embed = discord.Embed(title=f"Private ICAO Aircraft Data Displayed (Page {page_index + 1}/{len(pages)})", color=0xfffffe)
-                    embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
-                    for aircraft in page:
-                        aircraft_description = aircraft.get('desc', 'N/A')  # Aircraft Description
-                        aircraft_squawk = aircraft.get('squawk', 'N/A')  # Squawk
-                        aircraft_lat = aircraft.get('lat', 'N/A')  # Latitude
-                        aircraft_lon = aircraft.get('lon', 'N/A')  # Longitude
-                        aircraft_heading = aircraft.get('heading', 'N/A')  # Heading
-                        aircraft_speed = aircraft.get('spd', 'N/A')  # Speed
-                        aircraft_hex = aircraft.get('hex', 'N/A')  # Hex
-
-                        aircraft_info = f"**Squawk:** {aircraft_squawk}\n"
-                        aircraft_info += f"**Coordinates:** Lat: {aircraft_lat}, Lon: {aircraft_lon}\n"
-                        aircraft_info += f"**Heading:** {aircraft_heading}\n"
-                        aircraft_info += f"**Speed:** {aircraft_speed}\n"
-                        aircraft_info += f"**ICAO:** {aircraft_hex}"
-
-                        embed.add_field(name=aircraft_description, value=aircraft_info, inline=False)
-
-                    message = await ctx.send(embed=embed)
-                    await message.add_reaction("⬅️")  # Adding a reaction to scroll to the previous page
-                    await message.add_reaction("➡️")  # Adding a reaction to scroll to the next page
-
-                    def check(reaction, user):
-                        return user == ctx.author and str(reaction.emoji) in ['⬅️', '➡️']
-
-                    try:
-                        reaction, user = await self.bot.wait_for('reaction_add', timeout=60.0, check=check)
-                        if str(reaction.emoji) == '⬅️' and page_index > 0:  # Check if the previous page reaction was added and it's not the first page
-                            await message.delete()
-                            page_index -= 1
-                        elif str(reaction.emoji) == '➡️' and page_index < len(pages) - 1:  # Check if the next page reaction was added and it's not the last page
-                            await message.delete()
-                            page_index += 1
-                    except asyncio.TimeoutError:
-                        await message.delete()
-                        break
+                await self._paginate_aircraft_list(ctx, "Private ICAO Aircraft Data Displayed", response['ac'])
             else:
                 await self._send_aircraft_info(ctx, response)
         else:
             embed = discord.Embed(title="Error", description="Error retrieving aircraft information.", color=0xff4545)
             await ctx.send(embed=embed)
 
+    async def _paginate_aircraft_list(self, ctx, title, aircraft_list, per_page=10):
+        page_count = (len(aircraft_list) + per_page - 1) // per_page
+        aircraft_tags = self.icao_tags.tag_aircraft(aircraft_list)
+
+        async def render(page_index):
+            embed = discord.Embed(title=f"{title} (Page {page_index + 1}/{page_count})", color=0xfffffe)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/airplane.png")
+            start = page_index * per_page
+            for aircraft, tags in zip(aircraft_list[start:start + per_page], aircraft_tags[start:start + per_page]):
+                aircraft_description = aircraft.get('desc', 'N/A')  # Aircraft Description
+                aircraft_squawk = aircraft.get('squawk', 'N/A')  # Squawk
+                aircraft_lat = aircraft.get('lat', 'N/A')  # Latitude
+                aircraft_lon = aircraft.get('lon', 'N/A')  # Longitude
+                aircraft_heading = aircraft.get('heading', 'N/A')  # Heading
+                aircraft_speed = aircraft.get('spd', 'N/A')  # Speed
+                aircraft_hex = aircraft.get('hex', 'N/A')  # Hex
+
+                aircraft_info = f"**Squawk:** {aircraft_squawk}\n"
+                aircraft_info += f"**Coordinates:** Lat: {aircraft_lat}, Lon: {aircraft_lon}\n"
+                aircraft_info += f"**Heading:** {aircraft_heading}\n"
+                aircraft_info += f"**Speed:** {aircraft_speed}\n"
+                aircraft_info += f"**ICAO:** {aircraft_hex}"
+                if tags:
+                    aircraft_info += f"\n**Tags:** {self._format_tags(tags)}"
+
+                embed.add_field(name=aircraft_description, value=aircraft_info, inline=False)
+            return embed, None
+
+        paginator = LazyPaginator(ctx.author, page_count, render)
+        await paginator.start(ctx)
+
+    @staticmethod
+    def _format_tags(tags):
+        return ", ".join(tag.replace('_', ' ') for tag in tags)
+
     @commands.guild_only()
     @aircraft_group.command(name='radius', help='Get information about aircraft within a specified radius.')
     async def aircraft_within_radius(self, ctx, lat: str, lon: str, radius: str):
-        url = f"{self.api_url}/point/{lat}/{lon}/{radius}"
-        response = await self._make_request(url)
+        try:
+            lat, lon, radius = float(lat), float(lon), float(radius)
+        except ValueError:
+            embed = discord.Embed(title="Error", description="Latitude, longitude and radius must be numbers.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+        try:
+            response = await self.snapshots.point(lat, lon, radius)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error making request: {e}")
+            response = None
         if response:
             await self._send_aircraft_info(ctx, response)
         else:
@@ -628,98 +608,70 @@ class Skysearch(commands.Cog):
             file_name = f"{search_type}_{search_value}.{file_format.lower()}"
             file_path = os.path.join(tempfile.gettempdir(), file_name)
 
+            frame = AircraftFrame(response['ac'])
+            frame.add_column('tags', [" ".join(tags) for tags in self.icao_tags.tag_aircraft(response['ac'])])
+            loop = asyncio.get_running_loop()
             try:
-                if file_format.lower() == "csv":
-                    with open(file_path, "w", newline='', encoding='utf-8') as file:
-                        writer = csv.writer(file)
-                        aircraft_keys = list(response['ac'][0].keys())
-                        writer.writerow([key.upper() for key in aircraft_keys])
-                        for aircraft in response['ac']:
-                            aircraft_values = list(map(str, aircraft.values()))
-                            writer.writerow(aircraft_values)
-                elif file_format.lower() == "pdf":
-                    doc = SimpleDocTemplate(file_path, pagesize=landscape(A4)) 
-                    styles = getSampleStyleSheet()
-                    styles.add(ParagraphStyle(name='Normal-Bold', fontName='Helvetica-Bold', fontSize=14, leading=16, alignment=1)) 
-                    flowables = []
-
-                    flowables.append(Paragraph(f"<u>{search_type.capitalize()} {search_value}</u>", styles['Normal-Bold'])) 
-                    flowables.append(Spacer(1, 24)) 
-
-                    aircraft_keys = list(response['ac'][0].keys())
-                    data = [Paragraph(f"<b>{key}</b>", styles['Normal-Bold']) for key in aircraft_keys]
-                    flowables.extend(data)
-
-                    for aircraft in response['ac']:
-                        aircraft_values = list(map(str, aircraft.values()))
-                        data = [Paragraph(value, styles['Normal']) for value in aircraft_values]
-                        flowables.extend(data)
-                        flowables.append(PageBreak())
-
-                    doc.build(flowables)
-                elif file_format.lower() in ["txt"]:
-                    with open(file_path, "w", newline='', encoding='utf-8') as file:
-                        aircraft_keys = list(response['ac'][0].keys())
-                        file.write(' '.join([key.upper() for key in aircraft_keys]) + '\n')
-                        for aircraft in response['ac']:
-                            aircraft_values = list(map(str, aircraft.values()))
-                            file.write(' '.join(aircraft_values) + '\n')
-                elif file_format.lower() == "html":
-                    with open(file_path, "w", newline='', encoding='utf-8') as file:
-                        aircraft_keys = list(response['ac'][0].keys())
-                        file.write('<table>\n')
-                        file.write('<tr>\n')
-                        for key in aircraft_keys:
-                            file.write(f'<th>{key.upper()}</th>\n')
-                        file.write('</tr>\n')
-                        for aircraft in response['ac']:
-                            aircraft_values = list(map(str, aircraft.values()))
-                            file.write('<tr>\n')
-                            for value in aircraft_values:
-                                file.write(f'<td>{value}</td>\n')
-                            file.write('</tr>\n')
-                        file.write('</table>\n')
+                await loop.run_in_executor(None, self._write_export, frame, file_path, file_format.lower(), f"{search_type.capitalize()} {search_value}")
             except PermissionError as e:
                 embed = discord.Embed(title="Error", description="I do not have permission to write to the file system.", color=0xff4545)
                 await ctx.send(embed=embed)
                 if os.path.exists(file_path):
                     os.remove(file_path)
+                return
 
-            with open(file_path, 'rb') as fp:
-                await ctx.send(file=discord.File(fp, filename=os.path.basename(file_path)))
+            try:
+                with open(file_path, 'rb') as fp:
+                    await ctx.send(file=discord.File(fp, filename=os.path.basename(file_path)))
+            finally:
+                os.remove(file_path)
         else:
             embed = discord.Embed(title="Error", description="Error retrieving aircraft information.", color=0xff4545)
             await ctx.send(embed=embed)
 
 
+    @staticmethod
+    def _write_export(frame, file_path, file_format, title):
+        if file_format == "pdf":
+            doc = SimpleDocTemplate(file_path, pagesize=landscape(A4))
+            styles = getSampleStyleSheet()
+            styles.add(ParagraphStyle(name='Normal-Bold', fontName='Helvetica-Bold', fontSize=14, leading=16, alignment=1))
+            columns = [key for key in PDF_EXPORT_COLUMNS if key in frame.columns]
+            # One table with a repeating header row; platypus splits it across pages
+            table = Table([[key.upper() for key in columns], *frame.rows(columns)], repeatRows=1)
+            table.setStyle(TableStyle([
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 7),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+            ]))
+            doc.build([Paragraph(f"<u>{title}</u>", styles['Normal-Bold']), Spacer(1, 24), table])
+            return
+
+        with open(file_path, "w", newline='', encoding='utf-8') as file:
+            if file_format == "csv":
+                frame.write_csv(file)
+            elif file_format == "txt":
+                frame.write_txt(file)
+            elif file_format == "html":
+                frame.write_html(file)
+
     @commands.guild_only()
     @aircraft_group.command(name='scroll', help='Scroll through available planes.')
     async def scroll_planes(self, ctx):
         url = f"{self.api_url}/mil"
         try:
             response = await self._make_request(url)
-            if response and 'ac' in response:
-                for index, aircraft_info in enumerate(response['ac']):
-                    await self._send_aircraft_info(ctx, {'ac': [aircraft_info]})
-                    embed = discord.Embed(description=f"Plane {index + 1}/{len(response['ac'])}. React with ➡️ to view the next plane or ⏹️ to stop.")
-                    message = await ctx.send(embed=embed)
-                    await message.add_reaction("➡️")
-                    await message.add_reaction("⏹️") 
-
-                    def check(reaction, user):
-                        return user == ctx.author and str(reaction.emoji) == '➡️' or str(reaction.emoji) == '⏹️'
-
-                    try:
-                        reaction, user = await self.bot.wait_for('reaction_add', timeout=60.0, check=check)
-                        await message.remove_reaction(reaction.emoji, ctx.author)
-                        if str(reaction.emoji) == '⏹️':
-                            embed = discord.Embed(description="Stopping.")
-                            await ctx.send(embed=embed)
-                            break
-                    except asyncio.TimeoutError:
-                        embed = discord.Embed(description="No reaction received. Stopping.")
-                        await ctx.send(embed=embed)
-                        break
+            if response and response.get('ac'):
+                aircraft_list = response['ac']
+
+                async def render(index):
+                    embed, view = await self._build_aircraft_info(aircraft_list[index])
+                    embed.set_author(name=f"Plane {index + 1}/{len(aircraft_list)}")
+                    return embed, view
+
+                paginator = LazyPaginator(ctx.author, len(aircraft_list), render, prefetch=self._prefetch_photos(aircraft_list))
+                await paginator.start(ctx)
         except Exception as e:
             embed = discord.Embed(description=f"An error occurred during scrolling: {e}.")
             await ctx.send(embed=embed)
@@ -772,6 +724,8 @@ class Skysearch(commands.Cog):
         if channel:
             try:
                 await self.config.guild(ctx.guild).alert_channel.set(channel.id)
+                alert_role_id = await self.config.guild(ctx.guild).alert_role()
+                self.alert_subscriptions[ctx.guild.id] = (channel.id, alert_role_id)
                 embed = discord.Embed(description=f"Alert channel set to {channel.mention}", color=0xfffffe)
                 await ctx.send(embed=embed)
             except Exception as e:
@@ -780,6 +734,7 @@ class Skysearch(commands.Cog):
         else:
             try:
                 await self.config.guild(ctx.guild).alert_channel.clear()
+                self.alert_subscriptions.pop(ctx.guild.id, None)
                 embed = discord.Embed(description="Alert channel cleared. No more alerts will be sent.", color=0xfffffe)
                 await ctx.send(embed=embed)
             except Exception as e:
@@ -793,6 +748,8 @@ class Skysearch(commands.Cog):
         if role:
             try:
                 await self.config.guild(ctx.guild).alert_role.set(role.id)
+                if ctx.guild.id in self.alert_subscriptions:
+                    self.alert_subscriptions[ctx.guild.id] = (self.alert_subscriptions[ctx.guild.id][0], role.id)
                 embed = discord.Embed(description=f"Alert role set to {role.mention}", color=0xfffffe)
                 await ctx.send(embed=embed)
             except Exception as e:
@@ -801,6 +758,8 @@ class Skysearch(commands.Cog):
         else:
             try:
                 await self.config.guild(ctx.guild).alert_role.clear()
+                if ctx.guild.id in self.alert_subscriptions:
+                    self.alert_subscriptions[ctx.guild.id] = (self.alert_subscriptions[ctx.guild.id][0], None)
                 embed = discord.Embed(description="Alert role cleared. No more role mentions will be made.", color=0xfffffe)
                 await ctx.send(embed=embed)
             except Exception as e:
@@ -808,6 +767,89 @@ class Skysearch(commands.Cog):
                 await ctx.send(embed=embed)
 
 
+    @commands.guild_only()
+    @commands.admin_or_permissions()
+    @aircraft_group.group(name='watchzone', help='Get alerts in this channel when aircraft enter or leave an area.', invoke_without_command=True)
+    async def watch_zone_group(self, ctx):
+        await ctx.send_help(ctx.command)
+
+    @watch_zone_group.command(name='airport', help='Watch a radius (nm) around an airport. Optionally filter by comma-separated tags, e.g. military,law_enforcement.')
+    async def watch_zone_airport(self, ctx, name: str, code: str, radius: float, tags: str = None):
+        # Also rejects NaN
+        if not 0 < radius <= MAX_FENCE_RADIUS:
+            embed = discord.Embed(title="Error", description=f"The radius must be more than 0 and at most {MAX_FENCE_RADIUS} nm.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
+            return
+        await self._save_watch_zone(ctx, name, {'lat': airport.latitude, 'lon': airport.longitude, 'radius': radius}, tags)
+
+    @watch_zone_group.command(name='polygon', help='Watch a polygon given as lat,lon points separated by semicolons, e.g. "51.5,-0.5;51.6,0.2;51.3,0.1". Optionally filter by comma-separated tags.')
+    async def watch_zone_polygon(self, ctx, name: str, points: str, tags: str = None):
+        try:
+            points = [[float(value) for value in point.split(',')] for point in points.strip().strip(';').split(';')]
+            if len(points) < 3 or any(len(point) != 2 or abs(point[0]) > 90 or abs(point[1]) > 180 for point in points):
+                raise ValueError
+        except ValueError:
+            embed = discord.Embed(title="Error", description="A polygon needs at least 3 points written as `lat,lon;lat,lon;lat,lon`.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+        await self._save_watch_zone(ctx, name, {'points': points}, tags)
+
+    @watch_zone_group.command(name='remove', help='Stop watching a zone.')
+    async def watch_zone_remove(self, ctx, name: str):
+        async with self.config.guild(ctx.guild).watch_zones() as watch_zones:
+            removed = watch_zones.pop(name, None)
+            zones = dict(watch_zones)
+        if removed is None:
+            embed = discord.Embed(title="Error", description=f"No watch zone named **{name}**.", color=0xff4545)
+        else:
+            self.geofences.set_guild_fences(ctx.guild.id, zones)
+            embed = discord.Embed(description=f"Watch zone **{name}** removed.", color=0xfffffe)
+        await ctx.send(embed=embed)
+
+    @watch_zone_group.command(name='list', help='List the watch zones for this server.')
+    async def watch_zone_list(self, ctx):
+        watch_zones = await self.config.guild(ctx.guild).watch_zones()
+        if not watch_zones:
+            embed = discord.Embed(description="No watch zones are set up.", color=0xfffffe)
+            await ctx.send(embed=embed)
+            return
+        embed = discord.Embed(title="Watch zones", color=0xfffffe)
+        for name, zone in watch_zones.items():
+            if zone.get('points'):
+                area = f"Polygon of {len(zone['points'])} points"
+            else:
+                area = f"{zone['radius']:g} nm around `{zone['lat']}, {zone['lon']}`"
+            tags = ', '.join(zone.get('tags', [])) or "All aircraft"
+            embed.add_field(name=name, value=f"{area}\nAlerts in <#{zone['channel']}>\nTags: {tags}", inline=False)
+        await ctx.send(embed=embed)
+
+    async def _save_watch_zone(self, ctx, name, zone, tags):
+        tags = [tag.strip().lower() for tag in tags.split(',') if tag.strip()] if tags else []
+        unknown = [tag for tag in tags if tag not in ICAO_TAGS]
+        if unknown:
+            embed = discord.Embed(title="Error", description=f"Unknown tags: {', '.join(unknown)}. Use any of: {', '.join(ICAO_TAGS)}.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+        zone.update(tags=tags, channel=ctx.channel.id)
+        if Fence(ctx.guild.id, name, zone).radius > MAX_FENCE_RADIUS:
+            embed = discord.Embed(title="Error", description=f"Watch zones must fit within {MAX_FENCE_RADIUS} nm.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        async with self.config.guild(ctx.guild).watch_zones() as watch_zones:
+            if name not in watch_zones and len(watch_zones) >= MAX_WATCH_ZONES:
+                embed = discord.Embed(title="Error", description=f"This server already has the maximum of {MAX_WATCH_ZONES} watch zones.", color=0xff4545)
+                await ctx.send(embed=embed)
+                return
+            watch_zones[name] = zone
+            zones = dict(watch_zones)
+        self.geofences.set_guild_fences(ctx.guild.id, zones)
+        embed = discord.Embed(description=f"Watch zone **{name}** saved. Alerts will be sent to {ctx.channel.mention}.", color=0xfffffe)
+        await ctx.send(embed=embed)
+
     @commands.guild_only()
     @commands.has_permissions(manage_guild=True)
     @aircraft_group.command(name='autoicao')
@@ -823,6 +865,10 @@ class Skysearch(commands.Cog):
                 await ctx.send(embed=embed)
         else:
             await self.config.guild(ctx.guild).auto_icao.set(state)
+            if state:
+                self.auto_icao_guilds.add(ctx.guild.id)
+            else:
+                self.auto_icao_guilds.discard(ctx.guild.id)
             if state:
                 embed = discord.Embed(title="ICAO Lookup Status", description="Automatic ICAO lookup has been enabled.", color=0x2BBD8E)
                 await ctx.send(embed=embed)
@@ -830,6 +876,22 @@ class Skysearch(commands.Cog):
                 embed = discord.Embed(title="ICAO Lookup Status", description="Automatic ICAO lookup has been disabled.", color=0xff4545)
                 await ctx.send(embed=embed)
 
+    @commands.is_owner()
+    @aircraft_group.command(name='reloadtags', help='Reload the ICAO asset intelligence tags from disk.')
+    async def reload_icao_tags(self, ctx):
+        loop = asyncio.get_running_loop()
+        icao_tags = ICAOTagIndex()
+        try:
+            await loop.run_in_executor(None, icao_tags.load, *self._icao_tag_paths())
+        except (OSError, ValueError) as e:
+            embed = discord.Embed(title="Error", description=f"Error reloading ICAO tags: {e}", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+        self.icao_tags = icao_tags
+        self.geofences.icao_tags = icao_tags
+        embed = discord.Embed(description=f"Reloaded tags for **{len(icao_tags):,}** aircraft.", color=0x2BBD8E)
+        await ctx.send(embed=embed)
+
     @commands.guild_only()
     @commands.group(name='airport', help='Command center for airport related commands')
     async def airport_group(self, ctx):
@@ -844,23 +906,12 @@ class Skysearch(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        # Determine if the code is ICAO or IATA based on length
-        if len(code) == 4:
-            code_type = 'icao'
-        elif len(code) == 3:
-            code_type = 'iata'
-        else:
-            embed = discord.Embed(title="Error", description="Invalid ICAO or IATA code. ICAO codes are 4 characters long and IATA codes are 3 characters long.", color=0xff4545)
-            await ctx.send(embed=embed)
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
             return
 
         try:
-            url1 = f"https://airport-data.com/api/ap_info.json?{code_type}={code}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url1) as response1:
-                    data1 = await response1.json()
-            
-            embed = discord.Embed(title=f"Airport information for {code.upper()}", description=f"# {data1.get('name', 'Unknown Airport')}", color=0xfffffe)
+            embed = discord.Embed(title=f"Airport information for {code.upper()}", description=f"# {airport.name}", color=0xfffffe)
             embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/location.png")
 
             googlemaps_tokens = await self.bot.get_shared_api_tokens("googlemaps")
@@ -868,56 +919,28 @@ class Skysearch(commands.Cog):
             
             file = None  # Initialize file to None to handle cases where no image is available
             if google_street_view_api_key != "YOUR_API_KEY":
-                street_view_base_url = "https://maps.googleapis.com/maps/api/staticmap"
-                street_view_params = {
-                    "size": "700x500", # Width x Height
-                    "zoom": "13",
-                    "scale": "2", 
-                    "center": f"{data1['latitude']},{data1['longitude']}",  # Latitude and Longitude as comma-separated string
-                    "maptype": "satellite",
-                    "key": google_street_view_api_key
-                }
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(street_view_base_url, params=street_view_params) as street_view_response:
-                        if street_view_response.status == 200:
-                            # Save the raw binary that the API returns as an image to set in embed.set_image
-                            street_view_image_url = "attachment://street_view_image.png"
-                            embed.set_image(url=street_view_image_url)
-                            street_view_image_stream = io.BytesIO(await street_view_response.read())
-                            file = discord.File(fp=street_view_image_stream, filename="street_view_image.png")
-                        else:
-                            # Handle the error accordingly, e.g., log it or send a message to the user
-                            pass
-
-            view = discord.ui.View(timeout=180)  # Initialize view outside of the else block
-            if 'error' in data1:
-                embed.add_field(name="Error", value=data1['error'], inline=False)
-            elif not data1 or 'name' not in data1:
-                embed.add_field(name="Error", value="No airport found with the provided code.", inline=False)
-            else:
-                if 'icao' in data1:
-                    embed.add_field(name='ICAO', value=f"`{data1['icao']}`", inline=True)
-                if 'iata' in data1:
-                    embed.add_field(name='IATA', value=f"`{data1['iata']}`", inline=True)
-                if 'country_code' in data1:
-                    embed.add_field(name='Country Code', value=f"`{data1['country_code']}`", inline=True)
-                if 'location' in data1:
-                    embed.add_field(name='Location', value=f"`{data1['location']}`", inline=True)
-                if 'country' in data1:
-                    embed.add_field(name='Country', value=f"`{data1['country']}`", inline=True)
-                if 'longitude' in data1:
-                    embed.add_field(name='Longitude', value=f"`{data1['longitude']}`", inline=True)
-                if 'latitude' in data1:
-                    embed.add_field(name='Latitude', value=f"`{data1['latitude']}`", inline=True)
-                
-                # Check if 'link' is in data1 and add it to the view
-                if 'link' in data1:
-                    link = data1['link']
-                    if not (link.startswith('http://') or link.startswith('https://')):
-                        link = 'https://airport-data.com' + link
-                    # URL button
-                    view_airport = discord.ui.Button(label=f"More info about {data1['icao']}", url=link, style=discord.ButtonStyle.link)
-                    view.add_item(view_airport)
+                # Served from the on-disk map cache; discord.File streams the image from disk
+                street_view_image_path = await self.map_cache.get(google_street_view_api_key, airport.latitude, airport.longitude)
+                if street_view_image_path:
+                    embed.set_image(url="attachment://street_view_image.png")
+                    file = discord.File(street_view_image_path, filename="street_view_image.png")
+
+            view = discord.ui.View(timeout=180)
+            embed.add_field(name='ICAO', value=f"`{airport.icao}`", inline=True)
+            if airport.iata:
+                embed.add_field(name='IATA', value=f"`{airport.iata}`", inline=True)
+            embed.add_field(name='Country Code', value=f"`{airport.country_code}`", inline=True)
+            if airport.municipality:
+                embed.add_field(name='Location', value=f"`{airport.municipality}, {airport.region}`", inline=True)
+            if airport.elevation_ft:
+                embed.add_field(name='Elevation', value=f"`{airport.elevation_ft} ft`", inline=True)
+            embed.add_field(name='Type', value=f"`{airport.type.replace('_', ' ').capitalize()}`", inline=True)
+            embed.add_field(name='Longitude', value=f"`{airport.longitude}`", inline=True)
+            embed.add_field(name='Latitude', value=f"`{airport.latitude}`", inline=True)
+
+            link = airport.home_link or f"https://ourairports.com/airports/{airport.ident}/"
+            view_airport = discord.ui.Button(label=f"More info about {airport.icao}", url=link, style=discord.ButtonStyle.link)
+            view.add_item(view_airport)
 
             # Send the message with the embed, view, and file (if available)
             await ctx.send(embed=embed, view=view, file=file)
@@ -925,253 +948,191 @@ class Skysearch(commands.Cog):
             embed = discord.Embed(title="Error", description=str(e), color=0xff4545)
             await ctx.send(embed=embed)
 
+    @commands.guild_only()
+    @airport_group.command(name='nearby', help='Show the aircraft closest to an airport by ICAO or IATA code.')
+    async def aircraft_near_airport(self, ctx, code: str, radius: float = 25):
+        radius = min(radius, MAX_POINT_RADIUS)
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
+            return
+
+        try:
+            response = await self.snapshots.point(airport.latitude, airport.longitude, radius)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error making request: {e}")
+            response = None
+        if not response or 'ac' not in response:
+            embed = discord.Embed(title="Error", description="Error retrieving aircraft information.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
+
+        embed = discord.Embed(title=f"Aircraft near {airport.name}", description=f"{len(response['ac'])} aircraft within {radius:g} nm", color=0xfffffe)
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/location.png")
+        # Snapshot responses are sorted by distance, so the first few are the nearest
+        for aircraft in response['ac'][:10]:
+            callsign = (aircraft.get('flight') or aircraft.get('hex', 'N/A')).strip()
+            altitude = aircraft.get('alt_baro', 'N/A')
+            altitude = "On ground" if altitude == 'ground' else f"{altitude} ft"
+            embed.add_field(name=callsign, value=f"{aircraft.get('t', 'N/A')} · {altitude}\n{aircraft['dst']:.1f} nm at {aircraft['dir']:.0f}°", inline=True)
+        await ctx.send(embed=embed)
+
+    async def _get_airport(self, ctx, code):
+        """Look up an airport in the reference data, sending an error and returning None if the code is invalid or unknown."""
+        if len(code) not in [3, 4]:
+            embed = discord.Embed(title="Error", description="Invalid ICAO or IATA code. ICAO codes are 4 characters long and IATA codes are 3 characters long.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return None
+        airport = await self.airports.airport(code)
+        if airport is None:
+            embed = discord.Embed(title="Error", description="No airport found with the provided code.", color=0xff4545)
+            await ctx.send(embed=embed)
+        return airport
+
     @commands.guild_only()
     @airport_group.command(name='runway')
     async def runwayinfo(self, ctx, code: str):
         """Query runway information by ICAO code."""
-        if len(code) != 4:
-            if len(code) == 3:
-                code_type = 'iata'
-            else:
-                embed = discord.Embed(title="Error", description="Invalid ICAO or IATA code. ICAO codes are 4 characters long and IATA codes are 3 characters long.", color=0xff4545)
-                await ctx.send(embed=embed)
-                return
-        else:
-            code_type = 'icao'
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
+            return
 
-        try:
-            if code_type == 'iata':
-                url1 = f"https://airport-data.com/api/ap_info.json?iata={code}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url1) as response1:
-                        data1 = await response1.json()
-                        if 'icao' in data1:
-                            code = data1['icao']
-                        else:
-                            embed = discord.Embed(title="Error", description="No ICAO code found for the provided IATA code.", color=0xff4545)
-                            await ctx.send(embed=embed)
-                            return
-
-            api_token = await self.bot.get_shared_api_tokens("airportdbio")
-            if api_token and 'api_token' in api_token:
-                url2 = f"https://airportdb.io/api/v1/airport/{code}?apiToken={api_token['api_token']}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url2) as response2:
-                        data2 = await response2.json()
-
-                if 'error' in data2:
-                    error_message = data2['error']
-                    if len(error_message) > 1024:
-                        error_message = error_message[:1021] + "..."
-                    embed = discord.Embed(title="Error", description=error_message, color=0xff4545)
-                    await ctx.send(embed=embed)
-                elif not data2 or 'name' not in data2:
-                    embed = discord.Embed(title="Error", description="No airport found with the provided code.", color=0xff4545)
-                    await ctx.send(embed=embed)
-                else:
-                    combined_pages = []
-                    if 'runways' in data2:
-                        embed = discord.Embed(title=f"Runway information for {code.upper()}", color=0xfffffe)
-                        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/layers.png")
-                        runways = data2['runways']
-                        for runway in runways:
-                            if 'id' in runway:
-                                embed.add_field(name="Runway ID", value=f"**`{runway['id']}`**", inline=True)
-
-                            if 'surface' in runway:
-                                embed.add_field(name="Surface", value=f"**`{runway['surface']}`**", inline=True)
-
-                            if 'length_ft' in runway and 'width_ft' in runway:
-                                embed.add_field(name="Dimensions", value=f"**`{runway['length_ft']}ft long`\n`{runway['width_ft']}ft wide`**", inline=True)
-
-                            if 'le_ident' in runway or 'he_ident' in runway:
-                                ils_value = ""
-                                if 'le_ident' in runway:
-                                    ils_info = runway.get('le_ils', {})
-                                    ils_freq = ils_info.get('freq', 'N/A')
-                                    ils_course = ils_info.get('course', 'N/A')
-                                    ils_value += f"**{runway['le_ident']}** *`{ils_freq} MHz @ {ils_course}°`*\n"
-                                if 'he_ident' in runway:
-                                    ils_info = runway.get('he_ils', {})
-                                    ils_freq = ils_info.get('freq', 'N/A')
-                                    ils_course = ils_info.get('course', 'N/A')
-                                    ils_value += f"**{runway['he_ident']}** *`{ils_freq} MHz @ {ils_course}°`*\n"
-                                embed.add_field(name="Landing assistance", value=ils_value.strip(), inline=True)
-
-                            runway_status = ":white_check_mark: **`Open`**" if str(runway.get('closed', 0)) == '0' else ":x: **`Closed`**"
-                            embed.add_field(name="Runway status", value=runway_status, inline=True)
-
-                            lighted_status = ":bulb: **`Lighted`**" if str(runway.get('lighted', 0)) == '1' else ":x: **`Not Lighted`**"
-                            embed.add_field(name="Lighting", value=lighted_status, inline=True)
-
-                            combined_pages.append(embed)
-                            embed = discord.Embed(title=f"Runway information for {code.upper()}", color=0xfffffe)
-                            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/layers.png")
-
-                    await self.paginate_embed(ctx, combined_pages)
-            else:
-                embed = discord.Embed(title="Error", description="API token for airportdb.io not configured.", color=0xff4545)
-                await ctx.send(embed=embed)
-        except Exception as e:
-            embed = discord.Embed(title="Error", description=str(e), color=0xff4545)
+        runways = await self.airports.runways(airport)
+        if not runways:
+            embed = discord.Embed(title="Error", description=f"No runway information found for {airport.icao}.", color=0xff4545)
             await ctx.send(embed=embed)
+            return
+
+        combined_pages = []
+        for runway in runways:
+            embed = discord.Embed(title=f"Runway information for {airport.icao}", color=0xfffffe)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/layers.png")
+            embed.add_field(name="Runway ID", value=f"**`{runway.le_ident}/{runway.he_ident}`**" if runway.he_ident else f"**`{runway.le_ident}`**", inline=True)
+
+            if runway.surface:
+                embed.add_field(name="Surface", value=f"**`{runway.surface}`**", inline=True)
+
+            if runway.length_ft and runway.width_ft:
+                embed.add_field(name="Dimensions", value=f"**`{runway.length_ft}ft long`\n`{runway.width_ft}ft wide`**", inline=True)
+
+            headings = ""
+            for ident, heading in [(runway.le_ident, runway.le_heading), (runway.he_ident, runway.he_heading)]:
+                if ident and heading:
+                    headings += f"**{ident}** *`{heading}° true`*\n"
+            if headings:
+                embed.add_field(name="Headings", value=headings.strip(), inline=True)
+
+            runway_status = ":white_check_mark: **`Open`**" if runway.closed != '1' else ":x: **`Closed`**"
+            embed.add_field(name="Runway status", value=runway_status, inline=True)
+
+            lighted_status = ":bulb: **`Lighted`**" if runway.lighted == '1' else ":x: **`Not Lighted`**"
+            embed.add_field(name="Lighting", value=lighted_status, inline=True)
+
+            combined_pages.append(embed)
+
+        await self.paginate_embed(ctx, combined_pages)
 
     async def paginate_embed(self, ctx, pages):
-        message = await ctx.send(embed=pages[0])
-        await message.add_reaction("⬅️")
-        await message.add_reaction("❌")
-        await message.add_reaction("➡️")
-
-        def check(reaction, user):
-            return user == ctx.author and str(reaction.emoji) in ["⬅️", "❌", "➡️"]
-
-        i = 0
-        reaction = None
-        while True:
-            if str(reaction) == "⬅️":
-                if i > 0:
-                    i -= 1
-                    await message.edit(embed=pages[i])
-            elif str(reaction) == "➡️":
-                if i < len(pages) - 1:
-                    i += 1
-                    await message.edit(embed=pages[i])
-            elif str(reaction) == "❌":
-                await message.delete()
-                break
-            try:
-                reaction, user = await self.bot.wait_for("reaction_add", timeout=30.0, check=check)
-                await asyncio.sleep(1)
-                await message.remove_reaction(reaction, user)
-            except asyncio.TimeoutError:
-                await message.clear_reactions()
-                break
+        if not pages:
+            return
+
+        async def render(index):
+            return pages[index], None
+
+        paginator = LazyPaginator(ctx.author, len(pages), render)
+        await paginator.start(ctx)
 
     @commands.guild_only()
     @airport_group.command(name='navaid')
     async def navaidinfo(self, ctx, code: str):
         """Query navaid information by ICAO code."""
-        if len(code) != 4:
-            if len(code) == 3:
-                code_type = 'iata'
-            else:
-                embed = discord.Embed(title="Error", description="Invalid ICAO or IATA code. ICAO codes are 4 characters long and IATA codes are 3 characters long.", color=0xff4545)
-                await ctx.send(embed=embed)
-                return
-        else:
-            code_type = 'icao'
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
+            return
 
-        try:
-            if code_type == 'iata':
-                url1 = f"https://airport-data.com/api/ap_info.json?iata={code}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url1) as response1:
-                        data1 = await response1.json()
-                        if 'icao' in data1:
-                            code = data1['icao']
-                        else:
-                            embed = discord.Embed(title="Error", description="No ICAO code found for the provided IATA code.", color=0xff4545)
-                            await ctx.send(embed=embed)
-                            return
-
-            api_token = await self.bot.get_shared_api_tokens("airportdbio")
-            if api_token and 'api_token' in api_token:
-                url = f"https://airportdb.io/api/v1/airport/{code}?apiToken={api_token['api_token']}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        data = await response.json()
-
-                if 'error' in data:
-                    error_message = data['error']
-                    if len(error_message) > 1024:
-                        error_message = error_message[:1021] + "..."
-                    embed = discord.Embed(title="Error", description=error_message, color=0xff4545)
-                    await ctx.send(embed=embed)
-                elif not data or 'name' not in data:
-                    embed = discord.Embed(title="Error", description="No airport found with the provided code.", color=0xff4545)
-                    await ctx.send(embed=embed)
-                else:
-                    combined_pages = []
-                    if 'navaids' in data:
-                        embed = discord.Embed(title=f"Navigational aids at {code.upper()}", color=0xfffffe)
-                        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/navigate.png")
-                        navaids = data['navaids']
-                        for navaid in navaids:
-                            if 'ident' in navaid and navaid['ident']:
-                                embed.add_field(name="Ident", value=f"**`{navaid['ident']}`**", inline=True)
+        navaids = await self.airports.navaids(airport)
+        if not navaids:
+            embed = discord.Embed(title="Error", description=f"No navigational aids found for {airport.icao}.", color=0xff4545)
+            await ctx.send(embed=embed)
+            return
 
-                            if 'name' in navaid and navaid['name']:
-                                embed.add_field(name="Name", value=f"**`{navaid['name']}`**", inline=True)
+        combined_pages = []
+        for navaid in navaids:
+            embed = discord.Embed(title=f"Navigational aids at {airport.icao}", color=0xfffffe)
+            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/navigate.png")
+            if navaid.ident:
+                embed.add_field(name="Ident", value=f"**`{navaid.ident}`**", inline=True)
 
-                            if 'type' in navaid and navaid['type']:
-                                embed.add_field(name="Type", value=f"**`{navaid['type']}`**", inline=True)
+            if navaid.name:
+                embed.add_field(name="Name", value=f"**`{navaid.name}`**", inline=True)
 
-                            if 'frequency_khz' in navaid and navaid['frequency_khz']:
-                                embed.add_field(name="Frequency", value=f"**`{navaid['frequency_khz']}khz`**", inline=True)
+            if navaid.type:
+                embed.add_field(name="Type", value=f"**`{navaid.type}`**", inline=True)
 
-                            if 'latitude_deg' in navaid and 'longitude_deg' in navaid and navaid['latitude_deg'] and navaid['longitude_deg']:
-                                latitude = "{:.6f}".format(float(navaid['latitude_deg']))
-                                longitude = "{:.6f}".format(float(navaid['longitude_deg']))
-                                embed.add_field(name="Coordinates", value="**`{}°, {}°`**".format(latitude, longitude), inline=True)
+            if navaid.frequency_khz:
+                embed.add_field(name="Frequency", value=f"**`{navaid.frequency_khz}khz`**", inline=True)
 
-                            if 'elevation_ft' in navaid and navaid['elevation_ft']:
-                                embed.add_field(name="Elevation", value=f"**`{navaid['elevation_ft']}ft`**", inline=True)
+            if navaid.latitude and navaid.longitude:
+                latitude = "{:.6f}".format(float(navaid.latitude))
+                longitude = "{:.6f}".format(float(navaid.longitude))
+                embed.add_field(name="Coordinates", value="**`{}°, {}°`**".format(latitude, longitude), inline=True)
 
-                            if 'usageType' in navaid and navaid['usageType']:
-                                embed.add_field(name="Usage", value=f"**`{navaid['usageType']}`**", inline=True)
+            if navaid.elevation_ft:
+                embed.add_field(name="Elevation", value=f"**`{navaid.elevation_ft}ft`**", inline=True)
 
-                            if 'power' in navaid and navaid['power']:
-                                embed.add_field(name="Signal power", value=f"**`{navaid['power']}`**", inline=True)
+            if navaid.usage_type:
+                embed.add_field(name="Usage", value=f"**`{navaid.usage_type}`**", inline=True)
 
-                            if 'associated_airport' in navaid and navaid['associated_airport']:
-                                embed.add_field(name="Airport", value=f"**`{navaid['associated_airport']}`**", inline=True)
+            if navaid.power:
+                embed.add_field(name="Signal power", value=f"**`{navaid.power}`**", inline=True)
 
-                            combined_pages.append(embed)
-                            embed = discord.Embed(title=f"Navaid information for {code.upper()}", color=0xfffffe)
-                            embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/navigate.png")
+            embed.add_field(name="Airport", value=f"**`{airport.icao}`**", inline=True)
+            combined_pages.append(embed)
 
-                    await self.paginate_embed(ctx, combined_pages)
-            else:
-                embed = discord.Embed(title="Error", description="API token for airportdb.io not configured.", color=0xff4545)
-                await ctx.send(embed=embed)
-        except Exception as e:
-            embed = discord.Embed(title="Error", description=str(e), color=0xff4545)
+        await self.paginate_embed(ctx, combined_pages)
+
+    @commands.guild_only()
+    @airport_group.command(name='search', help='Search airports by the start of their name, ICAO or IATA code.')
+    async def airport_search(self, ctx, *, query: str):
+        airports = await self.airports.search(query, limit=15)
+        if not airports:
+            embed = discord.Embed(title="Error", description=f"No airports found matching **{query}**.", color=0xff4545)
             await ctx.send(embed=embed)
+            return
+        embed = discord.Embed(title=f"Airports matching {query}", color=0xfffffe)
+        embed.set_thumbnail(url="https://www.beehive.systems/hubfs/Icon%20Packs/White/location.png")
+        for airport in airports:
+            codes = f"`{airport.icao}`" + (f" · `{airport.iata}`" if airport.iata else "")
+            location = ", ".join(part for part in [airport.municipality, airport.country_code] if part)
+            embed.add_field(name=airport.name, value=f"{codes}\n{location}", inline=True)
+        await ctx.send(embed=embed)
 
     @commands.guild_only()
     @airport_group.command(name='forecast', help='Get the future weather format for an airport by ICAO or IATA code.')
     async def get_forecast(self, ctx, code: str):
         """Fetch the latitude and longitude of an airport via IATA or ICAO code, then show the forecast"""
-        code_type = 'icao' if len(code) == 4 else 'iata' if len(code) == 3 else None
-        if not code_type:
-            await ctx.send(embed=discord.Embed(title="Error", description="Invalid ICAO or IATA code. ICAO codes are 4 characters long and IATA codes are 3 characters long.", color=0xff4545))
+        airport = await self._get_airport(ctx, code)
+        if airport is None:
+            return
+        if airport.country_code != 'US':
+            await ctx.send(embed=discord.Embed(title="Error", description="Weather forecasts are currently only available for airports in the United States.", color=0xff4545))
             return
+        latitude, longitude = airport.latitude, airport.longitude
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://airport-data.com/api/ap_info.json?{code_type}={code}") as response1:
-                    data1 = await response1.json()
-                    latitude, longitude = data1.get('latitude'), data1.get('longitude')
-                    if not latitude or not longitude:
-                        await ctx.send(embed=discord.Embed(title="Error", description="Could not fetch latitude and longitude for the provided code.", color=0xff4545))
-                        return
-                    if data1.get('country_code') != 'US':
-                        await ctx.send(embed=discord.Embed(title="Error", description="Weather forecasts are currently only available for airports in the United States.", color=0xff4545))
-                        return
-
-                async with session.get(f"https://api.weather.gov/points/{latitude},{longitude}") as response2:
-                    data2 = await response2.json()
-                    forecast_url = data2.get('properties', {}).get('forecast')
-                    if not forecast_url:
-                        await ctx.send(embed=discord.Embed(title="Error", description="Could not fetch forecast URL.", color=0xff4545))
-                        return
-
-                async with session.get(forecast_url) as response3:
-                    data3 = await response3.json()
-                    periods = data3.get('properties', {}).get('periods')
-                    if not periods:
-                        await ctx.send(embed=discord.Embed(title="Error", description="Could not fetch forecast details.", color=0xff4545))
-                        return
+            session = self.http.session
+            async with session.get(f"https://api.weather.gov/points/{latitude},{longitude}") as response2:
+                data2 = await response2.json()
+                forecast_url = data2.get('properties', {}).get('forecast')
+                if not forecast_url:
+                    await ctx.send(embed=discord.Embed(title="Error", description="Could not fetch forecast URL.", color=0xff4545))
+                    return
+
+            async with session.get(forecast_url) as response3:
+                data3 = await response3.json()
+                periods = data3.get('properties', {}).get('periods')
+                if not periods:
+                    await ctx.send(embed=discord.Embed(title="Error", description="Could not fetch forecast details.", color=0xff4545))
+                    return
 
             combined_pages = []
             
@@ -1263,66 +1224,209 @@ class Skysearch(commands.Cog):
     async def check_emergency_squawks(self):
         try:
             emergency_squawk_codes = ['7500', '7600', '7700']
-            for squawk_code in emergency_squawk_codes:
-                url = f"{self.api_url}/squawk/{squawk_code}"
-                response = await self._make_request(url)
+            # airplanes.live has no multi-squawk query, so the three lookups run concurrently and the
+            # shared client's token bucket paces them to the API rate limit
+            responses = await asyncio.gather(
+                *(self._make_request(f"{self.api_url}/squawk/{squawk_code}") for squawk_code in emergency_squawk_codes)
+            )
+            squawking = {}
+            for squawk_code, response in zip(emergency_squawk_codes, responses):
                 if response and 'ac' in response:
                     for aircraft_info in response['ac']:
                         # Ignore aircraft with the callsign 00000000
                         if aircraft_info.get('icao') == '00000000':
                             continue
-                        guilds = self.bot.guilds
-                        for guild in guilds:
-                            alert_channel_id = await self.config.guild(guild).alert_channel()
-                            if alert_channel_id:
-                                alert_channel = self.bot.get_channel(alert_channel_id)
-                                if alert_channel:
-                                    # Get the alert role
-                                    alert_role_id = await self.config.guild(guild).alert_role()
-                                    alert_role_mention = f"<@&{alert_role_id}>" if alert_role_id else ""
-                                    
-                                    # Send the new alert with role mention if available
-                                    if alert_role_mention:
-                                        await alert_channel.send(alert_role_mention, allowed_mentions=discord.AllowedMentions(roles=True))
-                                    await self._send_aircraft_info(alert_channel, {'ac': [aircraft_info]})
-                                    
-                                    # Check if aircraft has landed
-                                    if aircraft_info.get('altitude') is not None and aircraft_info.get('altitude') < 25:
-                                        embed = discord.Embed(title="Aircraft landed", description=f"Aircraft {aircraft_info.get('icao')} has landed while squawking {squawk_code}.", color=0x00ff00)
-                                        await alert_channel.send(embed=embed)
-                                else:
-                                    print(f"Error: Alert channel not found for guild {guild.name}")
-                            else:
-                                print(f"Error: No alert channel set for guild {guild.name}")
-                await asyncio.sleep(2)  # Add a delay to respect API rate limit
+                        hex_id = aircraft_info.get('hex', '').upper()
+                        if hex_id:
+                            squawking[f"{hex_id}:{squawk_code}"] = aircraft_info
+            # A failed lookup says nothing about who stopped squawking, so nothing is cleared this cycle
+            complete = all(response is not None for response in responses)
+            await self._update_squawk_alerts(squawking, complete)
         except Exception as e:
             print(f"Error checking emergency squawks: {e}")
 
+    async def _update_squawk_alerts(self, squawking, complete=True):
+        """
+        Advance the alert state for each squawking aircraft, keyed by hex and squawk code.
+
+        New emergencies are announced once. Later transitions (landed, cleared) edit the
+        original alert messages instead of sending new ones. Alerts are only cleared when
+        `complete` is True, i.e. every squawk lookup this cycle succeeded.
+        """
+        if not squawking and not self.squawk_alerts:
+            return
+        now = time.time()
+        for key, aircraft_info in squawking.items():
+            landed = self._has_landed(aircraft_info)
+            state = self.squawk_alerts.get(key)
+            if state is None:
+                messages = await self._fan_out_alert(aircraft_info)
+                self.squawk_alerts[key] = {
+                    "first_seen": now,
+                    "last_seen": now,
+                    "landed": landed,
+                    "aircraft": aircraft_info,
+                    "messages": messages,
+                }
+                continue
+            state["last_seen"] = now
+            state["aircraft"] = aircraft_info
+            if landed and not state["landed"]:
+                state["landed"] = True
+                squawk_code = key.split(":")[1]
+                await self._edit_alert(state, f":airplane_arriving: Aircraft has **landed** while squawking `{squawk_code}`")
+
+        if complete:
+            for key, state in list(self.squawk_alerts.items()):
+                if key not in squawking and now - state["last_seen"] >= SQUAWK_ALERT_CLEAR_AFTER:
+                    await self._edit_alert(state, f":white_check_mark: Emergency squawk **cleared** <t:{int(state['last_seen'])}:R>")
+                    del self.squawk_alerts[key]
+
+        await self.config.squawk_alerts.set(self.squawk_alerts)
+
+    @staticmethod
+    def _has_landed(aircraft_info):
+        altitude = aircraft_info.get('alt_baro')
+        return altitude == 'ground' or (isinstance(altitude, (int, float)) and altitude < 25)
+
+    async def _load_alert_subscriptions(self):
+        all_guilds = await self.config.all_guilds()
+        self.alert_subscriptions = {
+            guild_id: (guild_data.get('alert_channel'), guild_data.get('alert_role'))
+            for guild_id, guild_data in all_guilds.items()
+            if guild_data.get('alert_channel')
+        }
+
+    async def _fan_out_alert(self, aircraft_info):
+        """
+        Render an emergency alert once and deliver it to every subscribed alert channel concurrently.
+        Returns the sent message IDs keyed by channel ID.
+        """
+        if not self.alert_subscriptions:
+            return {}
+        embed, view = await self._build_aircraft_info(aircraft_info)
+
+        sends = []
+        for guild_id, (alert_channel_id, alert_role_id) in self.alert_subscriptions.items():
+            alert_channel = self.bot.get_channel(alert_channel_id)
+            if alert_channel:
+                sends.append(self._send_alert(alert_channel, alert_role_id, embed, view))
+            else:
+                print(f"Error: Alert channel not found for guild {guild_id}")
+        messages = await asyncio.gather(*sends)
+        return {str(message.channel.id): message.id for message in messages if message}
+
+    async def _send_alert(self, alert_channel, alert_role_id, embed, view):
+        # discord.py already honors per-channel rate limits; the semaphore keeps bursts under the global limit
+        async with self.alert_send_semaphore:
+            try:
+                # Send the alert with role mention if available
+                if alert_role_id:
+                    return await alert_channel.send(f"<@&{alert_role_id}>", embed=embed, view=view, allowed_mentions=discord.AllowedMentions(roles=True))
+                return await alert_channel.send(embed=embed, view=view)
+            except discord.HTTPException as e:
+                print(f"Error sending alert to {alert_channel.id}: {e}")
+                return None
+
+    async def _edit_alert(self, state, status):
+        """Re-render an alert from its latest aircraft data and edit every message it was sent as."""
+        embed, view = await self._build_aircraft_info(state["aircraft"])
+        embed.add_field(name="Alert status", value=status, inline=False)
+        edits = []
+        for channel_id, message_id in state["messages"].items():
+            channel = self.bot.get_channel(int(channel_id))
+            if channel:
+                edits.append(self._edit_alert_message(channel, message_id, embed, view))
+        await asyncio.gather(*edits)
+
+    async def _edit_alert_message(self, channel, message_id, embed, view):
+        async with self.alert_send_semaphore:
+            try:
+                await channel.get_partial_message(message_id).edit(embed=embed, view=view)
+            except discord.HTTPException as e:
+                print(f"Error updating squawk alert in {channel.id}: {e}")
+
     @check_emergency_squawks.before_loop
     async def before_check_emergency_squawks(self):
         await self.bot.wait_until_ready()  # Removed unnecessary try-except block
+        await self._load_alert_subscriptions()
+        self.squawk_alerts = await self.config.squawk_alerts()
+
+    @tasks.loop(seconds=30)
+    async def check_watch_zones(self):
+        try:
+            if not self.geofences.fences:
+                return
+            # Every guild's fences share as few snapshots as possible, fetched at background priority
+            plan = self.geofences.snapshot_plan()
+            if len(plan) > WATCH_ZONE_REQUEST_BUDGET:
+                start = self.watch_zone_cursor % len(plan)
+                plan = (plan[start:] + plan[:start])[:WATCH_ZONE_REQUEST_BUDGET]
+                self.watch_zone_cursor = start + WATCH_ZONE_REQUEST_BUDGET
+            for lat, lon, radius, fences in plan:
+                try:
+                    response, grid = await self.snapshots.area(lat, lon, radius, background=True)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    print(f"Error checking watch zones {', '.join(fence.name for fence in fences)}: {e}")
+                    continue
+                if grid is None:
+                    continue
+                now = time.time()
+                for fence in fences:
+                    entered, exited = self.geofences.evaluate(fence, grid, response['ac'], now)
+                    if entered or exited:
+                        await self._send_watch_zone_events(fence, entered, exited)
+        except Exception as e:
+            print(f"Error checking watch zones: {e}")
+
+    async def _send_watch_zone_events(self, fence, entered, exited):
+        channel = self.bot.get_channel(fence.channel_id)
+        if not channel:
+            print(f"Error: Watch zone channel not found for guild {fence.guild_id}")
+            return
+        embeds = []
+        for aircraft_list, action, color in [(entered, "entered", 0x2BBD8E), (exited, "left", 0xfffffe)]:
+            for aircraft in aircraft_list:
+                callsign = (aircraft.get('flight') or aircraft.get('hex', 'N/A')).strip()
+                embed = discord.Embed(description=f":airplane: **{callsign}** (`{aircraft.get('hex', 'N/A').upper()}`) {action} watch zone **{fence.name}**", color=color)
+                altitude = aircraft.get('alt_baro', 'N/A')
+                embed.add_field(name="Type", value=f"`{aircraft.get('t', 'N/A')}`", inline=True)
+                embed.add_field(name="Altitude", value="`On ground`" if altitude == 'ground' else f"`{altitude} ft`", inline=True)
+                embed.add_field(name="Position", value=f"`{aircraft.get('lat', 'N/A')}, {aircraft.get('lon', 'N/A')}`", inline=True)
+                embeds.append(embed)
+        # Discord allows 10 embeds per message; batches go out one at a time to stay within the channel rate limit
+        for start in range(0, len(embeds), 10):
+            try:
+                async with self.alert_send_semaphore:
+                    await channel.send(embeds=embeds[start:start + 10])
+            except discord.HTTPException as e:
+                print(f"Error sending watch zone events for guild {fence.guild_id}: {e}")
+                return
+
+    @check_watch_zones.before_loop
+    async def before_check_watch_zones(self):
+        await self.bot.wait_until_ready()
+        all_guilds = await self.config.all_guilds()
+        for guild_id, guild_data in all_guilds.items():
+            if guild_data.get('watch_zones'):
+                self.geofences.set_guild_fences(guild_id, guild_data['watch_zones'])
 
     @commands.Cog.listener()
     async def on_message(self, message):
+        # Cheapest checks first: almost no message is exactly six hex characters
+        content = message.content
+        if len(content) != 6 or not HEX_CHARACTERS.issuperset(content):
+            return
+
         if message.author == self.bot.user:
             return
 
         if message.guild is None:
             return
 
-        auto_icao = await self.config.guild(message.guild).auto_icao()
-        if not auto_icao:
+        if message.guild.id not in self.auto_icao_guilds:
             return
 
-        content = message.content
-        icao_pattern = re.compile(r'^[a-fA-F0-9]{6}$')
-
-        if icao_pattern.match(content):
-            ctx = await self.bot.get_context(message)
-            await self.aircraft_by_icao(ctx, content)
-
-    def cog_unload(self):
-        try:
-            self.check_emergency_squawks.cancel()
-        except Exception as e:
-            print(f"Error unloading cog: {e}")
+        ctx = await self.bot.get_context(message)
+        # Lowercased so repeat lookups of a hex share one snapshot whatever case it was typed in
+        await self.aircraft_by_icao(ctx, content.lower())
@@ -0,0 +1,128 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+
+from .aircraftframe import AircraftFrame
+from .spatialindex import GridIndex, bearing, distance_nm
+
+# airplanes.live caps /point queries at 250 nautical miles
+MAX_POINT_RADIUS = 250
+# Point queries are fetched with their radius rounded up to this step, so nearby follow-up queries fit inside
+POINT_RADIUS_STEP = 25
+
+
+class SnapshotStore:
+    """
+    Short-lived cache of airplanes.live responses, keyed by request URL.
+
+    Identical queries within `TTL` seconds share one upstream request, including queries that
+    arrive while it is still in flight. Radius queries are answered from any fresh /point
+    snapshot whose circle covers them, using a grid index built once per snapshot.
+
+    Responses are shared between callers and must be treated as read-only.
+    """
+
+    TTL = 10
+    MAX_ENTRIES = 256
+
+    def __init__(self, http, api_url):
+        self.http = http
+        self.api_url = api_url
+        # url -> (response, fetched_at)
+        self._snapshots = OrderedDict()
+        # (lat, lon, radius) -> url for cached /point snapshots
+        self._points = {}
+        self._pending = {}
+        # url -> (response, GridIndex) for snapshots that have been queried spatially
+        self._indexes = {}
+
+    async def get(self, url, background=False):
+        """
+        Return the JSON response for an airplanes.live URL, fetching it only if there's no fresh snapshot.
+        Background fetches wait for spare rate-limit capacity.
+        """
+        snapshot = self._snapshots.get(url)
+        if snapshot is not None and time.monotonic() - snapshot[1] < self.TTL:
+            return snapshot[0]
+
+        pending = self._pending.get(url)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(url, background))
+            self._pending[url] = pending
+        return await asyncio.shield(pending)
+
+    async def area(self, lat, lon, radius, background=False):
+        """
+        Return `(response, grid)` for a fresh /point snapshot covering a circle, fetching one if needed.
+        The snapshot may be larger than the circle; `grid` is None if the response has no aircraft list.
+        """
+        radius = min(radius, MAX_POINT_RADIUS)
+        covering = self._covering_point(lat, lon, radius)
+        if covering is None:
+            fetch_radius = min(MAX_POINT_RADIUS, math.ceil(radius / POINT_RADIUS_STEP) * POINT_RADIUS_STEP)
+            url = f"{self.api_url}/point/{lat}/{lon}/{fetch_radius}"
+            self._points[(lat, lon, fetch_radius)] = url
+            covering = url
+        response = await self.get(covering, background)
+        if not response or 'ac' not in response:
+            return response, None
+        return response, self.grid(covering, response)
+
+    async def point(self, lat, lon, radius):
+        """Return aircraft within `radius` nautical miles of a point, in the shape of a /point response."""
+        radius = min(radius, MAX_POINT_RADIUS)
+        response, grid = await self.area(lat, lon, radius)
+        if grid is None:
+            return response
+
+        aircraft_list = []
+        for distance, index in grid.within_radius(lat, lon, radius):
+            aircraft = response['ac'][index]
+            # dst and dir are relative to the query point, which may not be the snapshot's centre
+            direction = bearing(lat, lon, grid.frame.lat[index], grid.frame.lon[index])
+            aircraft_list.append(dict(aircraft, dst=round(distance, 3), dir=round(direction, 1)))
+        return dict(response, ac=aircraft_list, total=len(aircraft_list))
+
+    def grid(self, url, response):
+        """Return the grid index for a snapshot, building it the first time the snapshot is queried."""
+        cached = self._indexes.get(url)
+        if cached is not None and cached[0] is response:
+            return cached[1]
+        grid = GridIndex(AircraftFrame(response['ac']))
+        self._indexes[url] = (response, grid)
+        return grid
+
+    def _covering_point(self, lat, lon, radius):
+        now = time.monotonic()
+        for (point_lat, point_lon, point_radius), url in list(self._points.items()):
+            snapshot = self._snapshots.get(url)
+            if snapshot is None and url not in self._pending:
+                del self._points[(point_lat, point_lon, point_radius)]
+                continue
+            if snapshot is not None and now - snapshot[1] >= self.TTL and url not in self._pending:
+                continue
+            if distance_nm(lat, lon, point_lat, point_lon) + radius <= point_radius:
+                return url
+        return None
+
+    async def _fetch(self, url, background=False):
+        try:
+            response = await self.http.get_json(url, rate_limited=True, background=background)
+        finally:
+            self._pending.pop(url, None)
+        self._snapshots[url] = (response, time.monotonic())
+        self._snapshots.move_to_end(url)
+        self._evict()
+        return response
+
+    def _evict(self):
+        now = time.monotonic()
+        for url, (_, fetched_at) in list(self._snapshots.items()):
+            if now - fetched_at < self.TTL:
+                break
+            del self._snapshots[url]
+            self._indexes.pop(url, None)
+        while len(self._snapshots) > self.MAX_ENTRIES:
+            url, _ = self._snapshots.popitem(last=False)
+            self._indexes.pop(url, None)
@@ -0,0 +1,88 @@
+import math
+
+EARTH_RADIUS_NM = 3440.065
+# Half the earth's circumference, the furthest any two points can be apart
+MAX_DISTANCE_NM = 10800
+
+
+def distance_nm(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two points, in nautical miles."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_NM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bearing(lat1, lon1, lat2, lon2):
+    """Initial bearing from the first point to the second, in degrees from true north."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    x = math.sin(lon2 - lon1) * math.cos(lat2)
+    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1)
+    return (math.degrees(math.atan2(x, y)) + 360) % 360
+
+
+class GridIndex:
+    """
+    Uniform lat/lon grid over the positions in an `AircraftFrame`.
+
+    Each cell holds the row indices of the aircraft inside it, so radius, bounding-box and
+    nearest-neighbour queries only measure the aircraft in cells that can possibly match.
+    Aircraft without a position are left out.
+    """
+
+    def __init__(self, frame, cell_degrees=1.0):
+        self.frame = frame
+        self.cell_degrees = cell_degrees
+        self._columns = math.ceil(360 / cell_degrees)
+        self._cells = {}
+        for index, (lat, lon) in enumerate(zip(frame.lat, frame.lon)):
+            if math.isnan(lat) or math.isnan(lon):
+                continue
+            self._cells.setdefault(self._cell(lat, lon), []).append(index)
+
+    def _cell(self, lat, lon):
+        return math.floor((lat + 90) / self.cell_degrees), math.floor((lon + 180) / self.cell_degrees) % self._columns
+
+    def _candidates(self, min_lat, max_lat, min_lon, max_lon):
+        min_row, min_column = self._cell(max(min_lat, -90), min_lon)
+        max_row = math.floor((min(max_lat, 90) + 90) / self.cell_degrees)
+        # Longitude spans can cross the antimeridian, so walk the columns modulo the grid width
+        span = min(self._columns - 1, math.floor((max_lon - min_lon) / self.cell_degrees) + 1)
+        for row in range(min_row, max_row + 1):
+            for offset in range(span + 1):
+                yield from self._cells.get((row, (min_column + offset) % self._columns), ())
+
+    def within_radius(self, lat, lon, radius):
+        """Return `(distance_nm, row index)` pairs for aircraft within `radius` nautical miles, nearest first."""
+        lat_span = radius / 60
+        if abs(lat) + lat_span >= 90:
+            lon_span = 180
+        else:
+            lon_span = min(180, lat_span / math.cos(math.radians(abs(lat) + lat_span)))
+        results = []
+        for index in self._candidates(lat - lat_span, lat + lat_span, lon - lon_span, lon + lon_span):
+            distance = distance_nm(lat, lon, self.frame.lat[index], self.frame.lon[index])
+            if distance <= radius:
+                results.append((distance, index))
+        results.sort()
+        return results
+
+    def within_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """Return the row indices of aircraft inside a bounding box. `min_lon` may be east of `max_lon` across the antimeridian."""
+        lon_width = max_lon - min_lon
+        if not 0 <= lon_width <= 360:
+            lon_width %= 360
+        results = []
+        for index in self._candidates(min_lat, max_lat, min_lon, min_lon + lon_width):
+            lat, lon = self.frame.lat[index], self.frame.lon[index]
+            if min_lat <= lat <= max_lat and (lon - min_lon) % 360 <= lon_width:
+                results.append(index)
+        return results
+
+    def nearest(self, lat, lon, k):
+        """Return up to `k` `(distance_nm, row index)` pairs for the aircraft closest to a point."""
+        radius = self.cell_degrees * 60
+        while True:
+            results = self.within_radius(lat, lon, radius)
+            if len(results) >= k or radius >= MAX_DISTANCE_NM:
+                return results[:k]
+            radius = min(MAX_DISTANCE_NM, radius * 4)
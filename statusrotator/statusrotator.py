@@ -54,6 +54,12 @@ class StatusRotator(commands.Cog):
                 await asyncio.sleep(240)  # Change status every 240 seconds
 
     async def fetch_blocked_domains_count(self):
+        # AntiPhishing already holds the blocklist, so don't download a second copy just to count it
+        antiphishing = self.bot.get_cog("AntiPhishing")
+        if antiphishing is not None and hasattr(antiphishing, "domains") and len(antiphishing.domains):
+            self.blocked_domains_count = len(antiphishing.domains)
+            await self.config.blocked_domains_count.set(self.blocked_domains_count)
+            return
         url = "https://www.beehive.systems/hubfs/blocklist/blocklist.json"
         headers = {"User-Agent": "Mozilla/5.0"}
         async with aiohttp.ClientSession() as session:
@@ -80,7 +86,13 @@ class StatusRotator(commands.Cog):
 
     async def enable_antiphishing_status(self):
         await self.fetch_blocked_domains_count()
-        self.statuses.append(lambda: f"Screening for {self.blocked_domains_count:,} bad domains")
+        self.statuses.append(lambda: f"Screening for {self.get_blocked_domains_count():,} bad domains")
+
+    def get_blocked_domains_count(self):
+        antiphishing = self.bot.get_cog("AntiPhishing")
+        if antiphishing is not None and hasattr(antiphishing, "domains") and len(antiphishing.domains):
+            return len(antiphishing.domains)
+        return self.blocked_domains_count
 
     def get_message_count_status(self):
         now = datetime.utcnow()
@@ -150,8 +162,13 @@ class StatusRotator(commands.Cog):
         if message.author.bot:
             return
         self.message_log.append(datetime.utcnow())
-        # Check for hyperlinks in the message
-        if re.search(r'http[s]?://', message.content):
+        # Check for hyperlinks in the message, reusing AntiPhishing's memoized parse when it's loaded
+        antiphishing = self.bot.get_cog("AntiPhishing")
+        if antiphishing is not None and hasattr(antiphishing, "link_extractor"):
+            has_hyperlink = any(link.explicit for link in antiphishing.link_extractor.message_links(message))
+        else:
+            has_hyperlink = re.search(r'http[s]?://', message.content) is not None
+        if has_hyperlink:
             self.hyperlink_log.append(datetime.utcnow())
 
     @commands.Cog.listener()
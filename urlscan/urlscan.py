@@ -133,7 +133,12 @@ class URLScan(commands.Cog):
         if message.author.bot:
             return
 
-        urls_to_scan = re.findall(r'(https?://\S+)', message.content)
+        # Reuse AntiPhishing's memoized parse of this message when it's loaded
+        antiphishing = self.bot.get_cog("AntiPhishing")
+        if antiphishing is not None and hasattr(antiphishing, "link_extractor"):
+            urls_to_scan = [link.url for link in antiphishing.link_extractor.message_links(message) if link.explicit]
+        else:
+            urls_to_scan = re.findall(r'(https?://\S+)', message.content)
         if not urls_to_scan:
             return
 